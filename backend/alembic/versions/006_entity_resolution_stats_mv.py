@@ -0,0 +1,53 @@
+"""Materialized view for entity resolution stats
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OWNER_CONTACT_TYPES = (
+    "('CorporateOwner', 'HeadOfficer', 'IndividualOwner', 'JointOwner', "
+    "'Officer', 'Shareholder', 'Owner')"
+)
+
+
+def upgrade() -> None:
+    # Owner contacts are a small slice of registration_contacts; a partial
+    # index lets the view refresh skip the rest of the table for most counts
+    op.execute(f"""
+        CREATE INDEX idx_registration_contacts_owner_types
+        ON registration_contacts (contact_type)
+        WHERE contact_type IN {OWNER_CONTACT_TYPES}
+    """)
+
+    # Single-row view refreshed after entity resolution; the constant id
+    # gives REFRESH ... CONCURRENTLY the unique index it requires
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW er_stats_mv AS
+        SELECT
+            1 AS id,
+            COUNT(*) AS total_contacts,
+            COUNT(*) FILTER (WHERE contact_type IN {OWNER_CONTACT_TYPES}) AS owner_type_contacts,
+            COUNT(*) FILTER (WHERE contact_type IN {OWNER_CONTACT_TYPES} AND name_hash IS NOT NULL) AS with_hash,
+            COUNT(*) FILTER (WHERE contact_type IN {OWNER_CONTACT_TYPES} AND owner_portfolio_id IS NOT NULL) AS linked,
+            COUNT(*) FILTER (WHERE contact_type IN {OWNER_CONTACT_TYPES} AND (full_name IS NULL OR full_name = '')) AS empty_name,
+            COUNT(*) FILTER (WHERE contact_type IN {OWNER_CONTACT_TYPES} AND (business_address IS NULL OR business_address = '')) AS empty_address
+        FROM registration_contacts
+    """)
+    op.execute("CREATE UNIQUE INDEX idx_er_stats_mv_id ON er_stats_mv (id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS er_stats_mv")
+    op.execute("DROP INDEX IF EXISTS idx_registration_contacts_owner_types")
@@ -0,0 +1,38 @@
+"""Cluster hpd_violations and complaints_311 by BBL
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> index on bbl it is physically ordered by
+CLUSTERED_TABLES = {
+    "hpd_violations": "idx_hpd_violations_bbl",
+    "complaints_311": "idx_complaints_311_bbl",
+}
+
+
+def upgrade() -> None:
+    # Rewrite each table in bbl order so a building's rows sit on adjacent
+    # pages: report, timeline and violations lookups read a handful of pages
+    # instead of one per row. The rewrite is one-off (later inserts append),
+    # so `CLUSTER <table>` can be re-run after large reloads.
+    for table, index in CLUSTERED_TABLES.items():
+        op.execute(f"CLUSTER {table} USING {index}")
+        op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    for table in CLUSTERED_TABLES:
+        op.execute(f"ALTER TABLE {table} SET WITHOUT CLUSTER")
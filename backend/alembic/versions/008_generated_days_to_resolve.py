@@ -0,0 +1,44 @@
+"""Make complaints_311.days_to_resolve a generated column
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Postgres fills the column during INSERT/UPDATE, so the 311 extractor
+    # no longer computes it per record. It counts whole days elapsed, as the
+    # extractor's (closed - created).days did, not calendar days. Adding a
+    # stored generated column rewrites the table once to backfill existing
+    # rows.
+    op.drop_column('complaints_311', 'days_to_resolve')
+    op.add_column(
+        'complaints_311',
+        sa.Column(
+            'days_to_resolve',
+            sa.Integer(),
+            sa.Computed("EXTRACT(DAY FROM closed_date - created_date)::int", persisted=True),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('complaints_311', 'days_to_resolve')
+    op.add_column('complaints_311', sa.Column('days_to_resolve', sa.Integer()))
+    op.execute(
+        "UPDATE complaints_311 "
+        "SET days_to_resolve = EXTRACT(DAY FROM closed_date - created_date)::int"
+    )
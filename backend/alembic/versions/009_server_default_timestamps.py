@@ -0,0 +1,44 @@
+"""Default created_at/updated_at to now() in the database
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> timestamp columns the models now default server-side
+TIMESTAMP_COLUMNS = {
+    "buildings": ("created_at", "updated_at"),
+    "building_scores": ("created_at", "updated_at"),
+    "owner_portfolios": ("created_at", "updated_at"),
+    "hpd_registrations": ("created_at",),
+    "registration_contacts": ("created_at",),
+    "hpd_violations": ("created_at",),
+    "complaints_311": ("created_at",),
+    "dob_violations": ("created_at",),
+    "evictions": ("created_at",),
+}
+
+
+def upgrade() -> None:
+    # Bulk upserts no longer send a Python-side timestamp per row; setting a
+    # default is a catalog-only change, existing rows are untouched
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT now()")
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
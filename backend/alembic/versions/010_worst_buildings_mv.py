@@ -0,0 +1,57 @@
+"""Materialized view for the worst buildings leaderboard
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Scored buildings with their city-wide and per-borough rank and the
+    # matching totals, so a leaderboard page is a range scan on a rank index
+    # instead of sorting and counting the whole join. Refreshed after scoring.
+    op.execute("""
+        CREATE MATERIALIZED VIEW worst_buildings_mv AS
+        SELECT
+            b.bbl,
+            b.full_address,
+            b.borough,
+            b.zip_code,
+            b.total_units,
+            bs.overall_score,
+            bs.grade,
+            bs.total_violations,
+            bs.class_c_violations,
+            bs.total_complaints,
+            bs.total_evictions,
+            ROW_NUMBER() OVER (ORDER BY bs.overall_score DESC, b.bbl) AS city_rank,
+            ROW_NUMBER() OVER (
+                PARTITION BY b.borough ORDER BY bs.overall_score DESC, b.bbl
+            ) AS borough_rank,
+            COUNT(*) OVER () AS city_total,
+            COUNT(*) OVER (PARTITION BY b.borough) AS borough_total
+        FROM buildings b
+        JOIN building_scores bs ON b.bbl = bs.bbl
+    """)
+    # Unique index required by REFRESH ... CONCURRENTLY
+    op.execute("CREATE UNIQUE INDEX idx_worst_buildings_mv_bbl ON worst_buildings_mv (bbl)")
+    op.execute("CREATE INDEX idx_worst_buildings_mv_city_rank ON worst_buildings_mv (city_rank)")
+    op.execute(
+        "CREATE INDEX idx_worst_buildings_mv_borough_rank "
+        "ON worst_buildings_mv (borough, borough_rank)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS worst_buildings_mv")
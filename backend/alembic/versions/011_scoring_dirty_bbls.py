@@ -0,0 +1,127 @@
+"""Track BBLs whose score inputs changed since the last scoring run
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Score inputs that carry a bbl column directly
+BBL_TABLES = ["buildings", "hpd_registrations", "hpd_violations", "complaints_311", "evictions"]
+
+# Transition tables can only be declared on single-event triggers
+TRIGGER_EVENTS = {
+    "ins": ("INSERT", "NEW TABLE AS new_rows"),
+    "upd": ("UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    "del": ("DELETE", "OLD TABLE AS old_rows"),
+}
+
+
+def _create_triggers(table: str, function: str) -> None:
+    for suffix, (event, referencing) in TRIGGER_EVENTS.items():
+        op.execute(f"""
+            CREATE TRIGGER {table}_scoring_dirty_{suffix}
+            AFTER {event} ON {table}
+            REFERENCING {referencing}
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}()
+        """)
+
+
+def upgrade() -> None:
+    # Queue of BBLs to rescore. Statement-level triggers with transition
+    # tables add one set-based INSERT per batch upsert rather than a trigger
+    # call per row; the scoring run claims the queue by deleting from it.
+    op.execute("""
+        CREATE TABLE scoring_dirty_bbls (
+            bbl VARCHAR(10) PRIMARY KEY,
+            enqueued_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+    """)
+
+    op.execute("""
+        CREATE FUNCTION scoring_enqueue_bbls() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO scoring_dirty_bbls (bbl)
+                SELECT DISTINCT bbl FROM new_rows WHERE bbl IS NOT NULL
+                ON CONFLICT (bbl) DO NOTHING;
+            END IF;
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                INSERT INTO scoring_dirty_bbls (bbl)
+                SELECT DISTINCT bbl FROM old_rows WHERE bbl IS NOT NULL
+                ON CONFLICT (bbl) DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+
+    # Contacts reach a BBL through their registration. A contact joining or
+    # leaving a portfolio also changes the portfolio size behind every other
+    # building in it, so those are queued too.
+    op.execute("""
+        CREATE FUNCTION scoring_enqueue_contact_bbls() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            registration_ids INTEGER[] := '{}';
+            portfolio_ids INTEGER[] := '{}';
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                SELECT ARRAY_AGG(registration_id), ARRAY_AGG(owner_portfolio_id)
+                INTO registration_ids, portfolio_ids
+                FROM new_rows;
+            ELSIF TG_OP = 'DELETE' THEN
+                SELECT ARRAY_AGG(registration_id), ARRAY_AGG(owner_portfolio_id)
+                INTO registration_ids, portfolio_ids
+                FROM old_rows;
+            ELSE
+                SELECT
+                    ARRAY_AGG(n.registration_id) || ARRAY_AGG(o.registration_id),
+                    ARRAY_AGG(n.owner_portfolio_id) FILTER (
+                        WHERE n.owner_portfolio_id IS DISTINCT FROM o.owner_portfolio_id
+                    ) || ARRAY_AGG(o.owner_portfolio_id) FILTER (
+                        WHERE n.owner_portfolio_id IS DISTINCT FROM o.owner_portfolio_id
+                    )
+                INTO registration_ids, portfolio_ids
+                FROM new_rows n
+                JOIN old_rows o ON o.id = n.id;
+            END IF;
+
+            INSERT INTO scoring_dirty_bbls (bbl)
+            SELECT DISTINCT hr.bbl
+            FROM hpd_registrations hr
+            WHERE hr.registration_id = ANY(registration_ids)
+            OR hr.registration_id IN (
+                SELECT rc.registration_id
+                FROM registration_contacts rc
+                WHERE rc.owner_portfolio_id = ANY(portfolio_ids)
+            )
+            ON CONFLICT (bbl) DO NOTHING;
+            RETURN NULL;
+        END
+        $$
+    """)
+
+    for table in BBL_TABLES:
+        _create_triggers(table, "scoring_enqueue_bbls")
+    _create_triggers("registration_contacts", "scoring_enqueue_contact_bbls")
+
+
+def downgrade() -> None:
+    for table in BBL_TABLES + ["registration_contacts"]:
+        for suffix in TRIGGER_EVENTS:
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_scoring_dirty_{suffix} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS scoring_enqueue_contact_bbls()")
+    op.execute("DROP FUNCTION IF EXISTS scoring_enqueue_bbls()")
+    op.execute("DROP TABLE IF EXISTS scoring_dirty_bbls")
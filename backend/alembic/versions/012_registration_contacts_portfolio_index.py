@@ -0,0 +1,31 @@
+"""Partial index on registration_contacts.owner_portfolio_id
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Portfolio sizes in scoring and update_portfolio_stats() start from the
+    # linked contacts; unlinked ones (the rest of the table) are left out
+    op.execute("""
+        CREATE INDEX idx_registration_contacts_owner_portfolio
+        ON registration_contacts (owner_portfolio_id)
+        WHERE owner_portfolio_id IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_registration_contacts_owner_portfolio")
@@ -0,0 +1,101 @@
+"""Make building and portfolio grades generated columns
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: Union[str, None] = "012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _grade(score_column: str) -> str:
+    # NULL scores (e.g. portfolios without scored buildings) stay ungraded
+    return (
+        f"CASE WHEN {score_column} < 20 THEN 'A' WHEN {score_column} < 40 THEN 'B' "
+        f"WHEN {score_column} < 60 THEN 'C' WHEN {score_column} < 80 THEN 'D' "
+        f"WHEN {score_column} >= 80 THEN 'F' END"
+    )
+
+
+# worst_buildings_mv (010) selects building_scores.grade, so it is dropped
+# and rebuilt around the column swap
+WORST_BUILDINGS_MV_SQL = """
+    CREATE MATERIALIZED VIEW worst_buildings_mv AS
+    SELECT
+        b.bbl,
+        b.full_address,
+        b.borough,
+        b.zip_code,
+        b.total_units,
+        bs.overall_score,
+        bs.grade,
+        bs.total_violations,
+        bs.class_c_violations,
+        bs.total_complaints,
+        bs.total_evictions,
+        ROW_NUMBER() OVER (ORDER BY bs.overall_score DESC, b.bbl) AS city_rank,
+        ROW_NUMBER() OVER (
+            PARTITION BY b.borough ORDER BY bs.overall_score DESC, b.bbl
+        ) AS borough_rank,
+        COUNT(*) OVER () AS city_total,
+        COUNT(*) OVER (PARTITION BY b.borough) AS borough_total
+    FROM buildings b
+    JOIN building_scores bs ON b.bbl = bs.bbl
+"""
+
+
+def _create_worst_buildings_mv() -> None:
+    op.execute(WORST_BUILDINGS_MV_SQL)
+    op.execute("CREATE UNIQUE INDEX idx_worst_buildings_mv_bbl ON worst_buildings_mv (bbl)")
+    op.execute("CREATE INDEX idx_worst_buildings_mv_city_rank ON worst_buildings_mv (city_rank)")
+    op.execute(
+        "CREATE INDEX idx_worst_buildings_mv_borough_rank "
+        "ON worst_buildings_mv (borough, borough_rank)"
+    )
+
+
+def upgrade() -> None:
+    # Postgres derives the grade on every write, so scoring no longer maps
+    # scores to letters itself and any other writer can't store a stale one.
+    # Adding a stored generated column rewrites each table once to backfill.
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS worst_buildings_mv")
+
+    op.drop_column('building_scores', 'grade')
+    op.add_column(
+        'building_scores',
+        sa.Column('grade', sa.String(2), sa.Computed(_grade('overall_score'), persisted=True)),
+    )
+    op.create_index('idx_building_scores_grade', 'building_scores', ['grade'])
+
+    op.drop_column('owner_portfolios', 'portfolio_grade')
+    op.add_column(
+        'owner_portfolios',
+        sa.Column('portfolio_grade', sa.String(2), sa.Computed(_grade('portfolio_score'), persisted=True)),
+    )
+
+    _create_worst_buildings_mv()
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS worst_buildings_mv")
+
+    op.drop_column('building_scores', 'grade')
+    op.add_column('building_scores', sa.Column('grade', sa.String(2)))
+    op.execute(f"UPDATE building_scores SET grade = {_grade('overall_score')}")
+    op.create_index('idx_building_scores_grade', 'building_scores', ['grade'])
+
+    op.drop_column('owner_portfolios', 'portfolio_grade')
+    op.add_column('owner_portfolios', sa.Column('portfolio_grade', sa.String(2)))
+    op.execute(f"UPDATE owner_portfolios SET portfolio_grade = {_grade('portfolio_score')}")
+
+    _create_worst_buildings_mv()
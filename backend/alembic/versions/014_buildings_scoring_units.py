@@ -0,0 +1,35 @@
+"""Add generated buildings.scoring_units column
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The per-unit denominator used by scoring, kept by Postgres on write
+    # instead of being derived for every building on every scoring run
+    op.add_column(
+        'buildings',
+        sa.Column(
+            'scoring_units',
+            sa.Integer(),
+            sa.Computed("CASE WHEN total_units > 1 THEN total_units ELSE 1 END", persisted=True),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('buildings', 'scoring_units')
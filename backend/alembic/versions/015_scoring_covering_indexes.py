@@ -0,0 +1,40 @@
+"""Covering bbl indexes for the scoring aggregates
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The scoring aggregates only read bbl plus these columns, so with them
+    # in the index Postgres can count per building with an index-only scan
+    # instead of visiting every heap row. evictions is counted by bbl alone,
+    # which idx_evictions_bbl already covers. The plain bbl indexes stay:
+    # 007 clusters the tables on them.
+    op.execute("""
+        CREATE INDEX idx_hpd_violations_bbl_scoring
+        ON hpd_violations (bbl) INCLUDE (violation_class, current_status)
+        WHERE bbl IS NOT NULL
+    """)
+    op.execute("""
+        CREATE INDEX idx_complaints_311_bbl_scoring
+        ON complaints_311 (bbl) INCLUDE (days_to_resolve)
+        WHERE bbl IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_complaints_311_bbl_scoring")
+    op.execute("DROP INDEX IF EXISTS idx_hpd_violations_bbl_scoring")
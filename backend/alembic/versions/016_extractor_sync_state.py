@@ -0,0 +1,35 @@
+"""Record the source version each extractor last loaded
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "016"
+down_revision: Union[str, None] = "015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One row per extractor (not per dataset: buildings and hpd_registrations
+    # both read the registrations dataset). source_updated_at is the
+    # dataset's rowsUpdatedAt when the last complete load started, so an
+    # incremental run can skip a dataset that hasn't changed since.
+    op.execute("""
+        CREATE TABLE extractor_sync_state (
+            extractor VARCHAR(50) PRIMARY KEY,
+            source_updated_at TIMESTAMP NOT NULL,
+            loaded_at TIMESTAMP NOT NULL DEFAULT now()
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS extractor_sync_state")
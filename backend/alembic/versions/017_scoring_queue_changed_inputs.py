@@ -0,0 +1,118 @@
+"""Only queue updated rows whose score inputs changed
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "017"
+down_revision: Union[str, None] = "016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 011's UPDATE branch, restored on downgrade
+ALL_ROWS_UPDATE = """
+    INSERT INTO scoring_dirty_bbls (bbl)
+    SELECT DISTINCT bbl FROM new_rows WHERE bbl IS NOT NULL
+    ON CONFLICT (bbl) DO NOTHING;
+    INSERT INTO scoring_dirty_bbls (bbl)
+    SELECT DISTINCT bbl FROM old_rows WHERE bbl IS NOT NULL
+    ON CONFLICT (bbl) DO NOTHING;
+"""
+
+# Extractor upserts rewrite every row they touch, so 011's UPDATE branch
+# queued nearly every building each night. Updated rows are now joined to
+# their old version on the key the upsert conflicts on, and only queued when
+# a column the scoring SQL reads changed; a row that moved to another BBL
+# queues both. PL/pgSQL compiles a trigger function per table, so each
+# table's branch is only planned against its own transition tables.
+CHANGED_INPUTS_UPDATE = f"""
+    CASE TG_TABLE_NAME
+    WHEN 'buildings' THEN
+        INSERT INTO scoring_dirty_bbls (bbl)
+        SELECT n.bbl
+        FROM new_rows n
+        JOIN old_rows o ON o.bbl = n.bbl
+        WHERE n.borough IS DISTINCT FROM o.borough
+           OR n.total_units IS DISTINCT FROM o.total_units
+        ON CONFLICT (bbl) DO NOTHING;
+    WHEN 'hpd_registrations' THEN
+        INSERT INTO scoring_dirty_bbls (bbl)
+        SELECT DISTINCT moved.bbl
+        FROM new_rows n
+        JOIN old_rows o ON o.registration_id = n.registration_id,
+        LATERAL (VALUES (n.bbl), (o.bbl)) AS moved(bbl)
+        WHERE moved.bbl IS NOT NULL
+          AND n.bbl IS DISTINCT FROM o.bbl
+        ON CONFLICT (bbl) DO NOTHING;
+    WHEN 'hpd_violations' THEN
+        INSERT INTO scoring_dirty_bbls (bbl)
+        SELECT DISTINCT moved.bbl
+        FROM new_rows n
+        JOIN old_rows o ON o.violation_id = n.violation_id,
+        LATERAL (VALUES (n.bbl), (o.bbl)) AS moved(bbl)
+        WHERE moved.bbl IS NOT NULL
+          AND (n.bbl IS DISTINCT FROM o.bbl
+               OR n.violation_class IS DISTINCT FROM o.violation_class
+               OR n.current_status IS DISTINCT FROM o.current_status)
+        ON CONFLICT (bbl) DO NOTHING;
+    WHEN 'complaints_311' THEN
+        INSERT INTO scoring_dirty_bbls (bbl)
+        SELECT DISTINCT moved.bbl
+        FROM new_rows n
+        JOIN old_rows o ON o.unique_key = n.unique_key,
+        LATERAL (VALUES (n.bbl), (o.bbl)) AS moved(bbl)
+        WHERE moved.bbl IS NOT NULL
+          AND (n.bbl IS DISTINCT FROM o.bbl
+               OR n.days_to_resolve IS DISTINCT FROM o.days_to_resolve)
+        ON CONFLICT (bbl) DO NOTHING;
+    WHEN 'evictions' THEN
+        INSERT INTO scoring_dirty_bbls (bbl)
+        SELECT DISTINCT moved.bbl
+        FROM new_rows n
+        JOIN old_rows o ON o.court_index_number = n.court_index_number,
+        LATERAL (VALUES (n.bbl), (o.bbl)) AS moved(bbl)
+        WHERE moved.bbl IS NOT NULL
+          AND n.bbl IS DISTINCT FROM o.bbl
+        ON CONFLICT (bbl) DO NOTHING;
+    ELSE
+        -- A table without a branch above queues every updated row, as before
+        {ALL_ROWS_UPDATE}
+    END CASE;
+"""
+
+
+def _replace_enqueue_function(update_branch: str) -> None:
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION scoring_enqueue_bbls() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO scoring_dirty_bbls (bbl)
+                SELECT DISTINCT bbl FROM new_rows WHERE bbl IS NOT NULL
+                ON CONFLICT (bbl) DO NOTHING;
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO scoring_dirty_bbls (bbl)
+                SELECT DISTINCT bbl FROM old_rows WHERE bbl IS NOT NULL
+                ON CONFLICT (bbl) DO NOTHING;
+            ELSE
+                {update_branch}
+            END IF;
+            RETURN NULL;
+        END
+        $$
+    """)
+
+
+def upgrade() -> None:
+    _replace_enqueue_function(CHANGED_INPUTS_UPDATE)
+
+
+def downgrade() -> None:
+    _replace_enqueue_function(ALL_ROWS_UPDATE)
@@ -0,0 +1,103 @@
+"""Only queue updated contacts whose score inputs changed
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "018"
+down_revision: Union[str, None] = "017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 011's UPDATE branch, restored on downgrade: every updated contact's
+# registration is queued
+ALL_ROWS_UPDATE = """
+                SELECT
+                    ARRAY_AGG(n.registration_id) || ARRAY_AGG(o.registration_id),
+                    ARRAY_AGG(n.owner_portfolio_id) FILTER (
+                        WHERE n.owner_portfolio_id IS DISTINCT FROM o.owner_portfolio_id
+                    ) || ARRAY_AGG(o.owner_portfolio_id) FILTER (
+                        WHERE n.owner_portfolio_id IS DISTINCT FROM o.owner_portfolio_id
+                    )
+                INTO registration_ids, portfolio_ids
+                FROM new_rows n
+                JOIN old_rows o ON o.id = n.id;
+"""
+
+# The nightly contact upsert rewrites every row, so the branch above queued
+# nearly every building, as 017 fixed for the BBL tables. Scoring reads a
+# contact's registration, type and portfolio; only rows where one of those
+# changed are queued now. A contact moving registration or portfolio also
+# changes the portfolio sizes on both sides.
+CHANGED_INPUTS_UPDATE = """
+                SELECT
+                    ARRAY_AGG(n.registration_id) || ARRAY_AGG(o.registration_id),
+                    ARRAY_AGG(n.owner_portfolio_id) FILTER (
+                        WHERE n.owner_portfolio_id IS DISTINCT FROM o.owner_portfolio_id
+                           OR n.registration_id IS DISTINCT FROM o.registration_id
+                    ) || ARRAY_AGG(o.owner_portfolio_id) FILTER (
+                        WHERE n.owner_portfolio_id IS DISTINCT FROM o.owner_portfolio_id
+                           OR n.registration_id IS DISTINCT FROM o.registration_id
+                    )
+                INTO registration_ids, portfolio_ids
+                FROM new_rows n
+                JOIN old_rows o ON o.id = n.id
+                WHERE n.registration_id IS DISTINCT FROM o.registration_id
+                   OR n.contact_type IS DISTINCT FROM o.contact_type
+                   OR n.owner_portfolio_id IS DISTINCT FROM o.owner_portfolio_id;
+"""
+
+
+def _replace_enqueue_function(update_branch: str) -> None:
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION scoring_enqueue_contact_bbls() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            registration_ids INTEGER[] := '{{}}';
+            portfolio_ids INTEGER[] := '{{}}';
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                SELECT ARRAY_AGG(registration_id), ARRAY_AGG(owner_portfolio_id)
+                INTO registration_ids, portfolio_ids
+                FROM new_rows;
+            ELSIF TG_OP = 'DELETE' THEN
+                SELECT ARRAY_AGG(registration_id), ARRAY_AGG(owner_portfolio_id)
+                INTO registration_ids, portfolio_ids
+                FROM old_rows;
+            ELSE
+                {update_branch}
+            END IF;
+
+            IF registration_ids IS NULL AND portfolio_ids IS NULL THEN
+                RETURN NULL;
+            END IF;
+
+            INSERT INTO scoring_dirty_bbls (bbl)
+            SELECT DISTINCT hr.bbl
+            FROM hpd_registrations hr
+            WHERE hr.registration_id = ANY(registration_ids)
+            OR hr.registration_id IN (
+                SELECT rc.registration_id
+                FROM registration_contacts rc
+                WHERE rc.owner_portfolio_id = ANY(portfolio_ids)
+            )
+            ON CONFLICT (bbl) DO NOTHING;
+            RETURN NULL;
+        END
+        $$
+    """)
+
+
+def upgrade() -> None:
+    _replace_enqueue_function(CHANGED_INPUTS_UPDATE)
+
+
+def downgrade() -> None:
+    _replace_enqueue_function(ALL_ROWS_UPDATE)
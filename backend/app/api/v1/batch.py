@@ -0,0 +1,37 @@
+import asyncio
+
+import httpx
+from fastapi import APIRouter, Request
+
+from app.schemas.batch import BatchRequest, BatchRequestItem, BatchResponse
+
+router = APIRouter()
+
+
+async def _dispatch(client: httpx.AsyncClient, item: BatchRequestItem) -> dict:
+    """Run one sub-request against the app in-process."""
+    response = await client.request(item.method, item.url)
+    try:
+        body = response.json()
+    except ValueError:
+        body = response.text
+    return {"id": item.id, "status": response.status_code, "body": body}
+
+
+@router.post("", response_model=BatchResponse)
+async def batch(payload: BatchRequest, request: Request):
+    """
+    Run several read-only API lookups in one HTTP round-trip.
+
+    Each sub-request is dispatched in-process through the app (so it gets
+    its own DB session and the normal caching) and all of them run
+    concurrently. Up to 10 GET requests under /api/v1/ are allowed.
+    Responses are returned in request order.
+    """
+    transport = httpx.ASGITransport(app=request.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://batch") as client:
+        results = await asyncio.gather(
+            *(_dispatch(client, item) for item in payload.requests)
+        )
+
+    return {"responses": results}
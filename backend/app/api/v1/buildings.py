@@ -1,25 +1,34 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
+from app.responses import etag_response
 from app.services.cached import CachedBuildingService
 from app.schemas.building import (
     BuildingSearchResult,
     BuildingReport,
     ViolationsResponse,
     TimelineResponse,
-    ViolationItem,
-    TimelineEvent,
     RecentViolationsResponse,
-    RecentViolationItem,
+    BuildingOverview,
 )
 
 router = APIRouter()
 
+# List endpoints return the cached dicts as-is. They were shaped by the
+# service layer, so re-validating every item through response_model on each
+# cache hit is pure overhead; the schemas are still published for the docs.
+# Wrapping them in ORJSONResponse also skips jsonable_encoder.
 
-@router.get("/search", response_model=BuildingSearchResult)
+
+@router.get(
+    "/search",
+    response_model=None,
+    responses={200: {"model": BuildingSearchResult}},
+)
 async def search_buildings(
     q: str = Query(..., min_length=3, description="Address search query"),
     limit: int = Query(10, ge=1, le=50),
@@ -33,10 +42,14 @@ async def search_buildings(
     """
     service = CachedBuildingService(db)
     results = await service.search_buildings(q, limit=limit)
-    return BuildingSearchResult(results=results, query=q)
+    return ORJSONResponse({"results": results, "query": q})
 
 
-@router.get("/violations/recent", response_model=RecentViolationsResponse)
+@router.get(
+    "/violations/recent",
+    response_model=None,
+    responses={200: {"model": RecentViolationsResponse}},
+)
 async def get_recent_violations(
     limit: int = Query(50, ge=1, le=100),
     violation_class: Optional[str] = Query(
@@ -55,15 +68,17 @@ async def get_recent_violations(
         limit=limit, violation_class=violation_class
     )
 
-    return RecentViolationsResponse(
-        items=[RecentViolationItem(**v) for v in violations],
-        limit=limit,
-    )
+    return ORJSONResponse({"items": violations, "limit": limit})
 
 
-@router.get("/{bbl}", response_model=BuildingReport)
+@router.get(
+    "/{bbl}",
+    response_model=None,
+    responses={200: {"model": BuildingReport}, 304: {"description": "Not modified"}},
+)
 async def get_building(
     bbl: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -77,7 +92,8 @@ async def get_building(
     - Complaint summary
     - Eviction count
 
-    Results are cached for 5 minutes.
+    Results are cached for 1 hour. Responses carry an ETag; send it back in
+    If-None-Match to get a 304 when the report has not changed.
     """
     service = CachedBuildingService(db)
     report = await service.get_building_report(bbl)
@@ -85,10 +101,16 @@ async def get_building(
     if not report:
         raise HTTPException(status_code=404, detail="Building not found")
 
-    return report
+    # Validate and serialize in one pass through pydantic-core
+    body = BuildingReport.model_validate(report).model_dump_json().encode()
+    return etag_response(request, body)
 
 
-@router.get("/{bbl}/violations", response_model=ViolationsResponse)
+@router.get(
+    "/{bbl}/violations",
+    response_model=None,
+    responses={200: {"model": ViolationsResponse}},
+)
 async def get_building_violations(
     bbl: str,
     limit: int = Query(50, ge=1, le=200),
@@ -103,39 +125,34 @@ async def get_building_violations(
     Get paginated violations for a building.
 
     Filter by status or violation class.
-    Results are cached for 5 minutes.
+    Results are cached for 1 hour.
     """
     service = CachedBuildingService(db)
 
-    # Check building exists
-    building = await service.get_building_by_bbl(bbl)
-    if not building:
-        raise HTTPException(status_code=404, detail="Building not found")
-
-    # Get total count and violations
-    total = await service.get_violations_count(
-        bbl,
-        status=status,
-        violation_class=violation_class,
-    )
-
-    violations = await service.get_violations(
+    # Existence is checked in the same query as the page
+    page = await service.get_violations_page(
         bbl,
         limit=limit,
         offset=offset,
         status=status,
         violation_class=violation_class,
     )
+    if page is None:
+        raise HTTPException(status_code=404, detail="Building not found")
 
-    return ViolationsResponse(
-        items=[ViolationItem(**v) for v in violations],
-        total=total,
-        offset=offset,
-        limit=limit,
-    )
+    return ORJSONResponse({
+        "items": page["items"],
+        "total": page["total"],
+        "offset": offset,
+        "limit": limit,
+    })
 
 
-@router.get("/{bbl}/timeline", response_model=TimelineResponse)
+@router.get(
+    "/{bbl}/timeline",
+    response_model=None,
+    responses={200: {"model": TimelineResponse}},
+)
 async def get_building_timeline(
     bbl: str,
     limit: int = Query(50, ge=1, le=200),
@@ -145,18 +162,51 @@ async def get_building_timeline(
     Get combined timeline of events for a building.
 
     Includes violations, 311 complaints, and evictions in chronological order.
-    Results are cached for 5 minutes.
+    Results are cached for 1 hour.
     """
     service = CachedBuildingService(db)
 
-    # Check building exists
-    building = await service.get_building_by_bbl(bbl)
-    if not building:
+    # Existence is checked in the same query as the events
+    events = await service.get_timeline(bbl, limit=limit)
+    if events is None:
         raise HTTPException(status_code=404, detail="Building not found")
 
-    events = await service.get_timeline(bbl, limit=limit)
+    return ORJSONResponse({"events": events, "bbl": bbl})
+
+
+@router.get(
+    "/{bbl}/overview",
+    response_model=None,
+    responses={200: {"model": BuildingOverview}},
+)
+async def get_building_overview(
+    bbl: str,
+    violations_limit: int = Query(50, ge=1, le=200),
+    timeline_limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get everything a building page shows in one request.
 
-    return TimelineResponse(
-        events=[TimelineEvent(**e) for e in events],
-        bbl=bbl,
+    Combines the report, the first page of violations and the timeline.
+    Shares the cache with the individual endpoints and reads it in one
+    round trip. Results are cached for 1 hour.
+    """
+    service = CachedBuildingService(db)
+
+    bundle = await service.get_building_bundle(
+        bbl, violations_limit=violations_limit, timeline_limit=timeline_limit
     )
+    if bundle is None:
+        raise HTTPException(status_code=404, detail="Building not found")
+
+    return ORJSONResponse({
+        "report": bundle["report"],
+        "violations": {
+            "items": bundle["violations"]["items"],
+            "total": bundle["violations"]["total"],
+            "offset": 0,
+            "limit": violations_limit,
+        },
+        "timeline": {"events": bundle["timeline"], "bbl": bbl},
+    })
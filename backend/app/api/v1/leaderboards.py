@@ -1,59 +1,70 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Query, Request
 
-from app.database import get_db
+from app.database import ReadOnlyConnection, get_readonly_conn
+from app.responses import etag_json_response
 from app.services.cached import CachedLeaderboardService
 from app.schemas.leaderboard import (
-    LeaderboardBuilding,
-    LeaderboardLandlord,
     BuildingsLeaderboardResponse,
     LandlordsLeaderboardResponse,
 )
 
 router = APIRouter()
 
+# Leaderboard pages are returned straight from the cache without
+# re-validating each row; the schemas are still published for the docs.
 
-@router.get("/worst-buildings", response_model=BuildingsLeaderboardResponse)
+
+@router.get(
+    "/worst-buildings",
+    response_model=None,
+    responses={200: {"model": BuildingsLeaderboardResponse}, 304: {"description": "Not modified"}},
+)
 async def get_worst_buildings(
+    request: Request,
     borough: Optional[str] = Query(
         None,
         description="Filter by borough (Manhattan, Brooklyn, Queens, Bronx, Staten Island)",
     ),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: ReadOnlyConnection = Depends(get_readonly_conn),
 ):
     """
     Get worst buildings ranked by overall score.
 
     Higher scores indicate worse conditions. Can filter by borough.
     Returns paginated results with total count.
-    Results are cached for 15 minutes.
+    Results are cached until the next ingest (at most 6 hours) and carry
+    an ETag for conditional requests.
     """
     service = CachedLeaderboardService(db)
 
-    total = await service.get_worst_buildings_count(borough=borough)
-    buildings = await service.get_worst_buildings(
+    page = await service.get_worst_buildings_page(
         borough=borough,
         limit=limit,
         offset=offset,
     )
 
-    return BuildingsLeaderboardResponse(
-        items=[LeaderboardBuilding(**b) for b in buildings],
-        total=total,
-        offset=offset,
-        limit=limit,
-    )
+    return etag_json_response(request, {
+        "items": page["items"],
+        "total": page["total"],
+        "offset": offset,
+        "limit": limit,
+    })
 
 
-@router.get("/worst-landlords", response_model=LandlordsLeaderboardResponse)
+@router.get(
+    "/worst-landlords",
+    response_model=None,
+    responses={200: {"model": LandlordsLeaderboardResponse}, 304: {"description": "Not modified"}},
+)
 async def get_worst_landlords(
+    request: Request,
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: ReadOnlyConnection = Depends(get_readonly_conn),
 ):
     """
     Get worst landlords ranked by portfolio score.
@@ -61,19 +72,19 @@ async def get_worst_landlords(
     Only includes landlords with more than one building.
     Higher scores indicate worse conditions across their portfolio.
     Returns paginated results with total count.
-    Results are cached for 15 minutes.
+    Results are cached until the next ingest (at most 6 hours) and carry
+    an ETag for conditional requests.
     """
     service = CachedLeaderboardService(db)
 
-    total = await service.get_worst_landlords_count()
-    landlords = await service.get_worst_landlords(
+    page = await service.get_worst_landlords_page(
         limit=limit,
         offset=offset,
     )
 
-    return LandlordsLeaderboardResponse(
-        items=[LeaderboardLandlord(**l) for l in landlords],
-        total=total,
-        offset=offset,
-        limit=limit,
-    )
+    return etag_json_response(request, {
+        "items": page["items"],
+        "total": page["total"],
+        "offset": offset,
+        "limit": limit,
+    })
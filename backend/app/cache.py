@@ -6,11 +6,15 @@ Uses in-memory by default, can switch to Redis by setting REDIS_URL env var.
 
 import asyncio
 import hashlib
-import json
+import inspect
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from functools import wraps
-from typing import Any, Callable, Optional, TypeVar
+from collections import OrderedDict
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
+
+import orjson
+import zstandard
 
 from app.config import get_settings
 from app.logging_config import get_logger
@@ -33,6 +37,24 @@ class CacheBackend(ABC):
         """Set a value in the cache with TTL in seconds."""
         pass
 
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        """Get several values at once, None for each missing key."""
+        return [await self.get(key) for key in keys]
+
+    @abstractmethod
+    async def set_indexed(self, index: str, items: list[tuple[str, Any, int]], ttl: int) -> None:
+        """Set (key, value, ttl) entries and record their keys under an index.
+
+        The index lives for ttl seconds from its last write, so it should be at
+        least as long as any entry's TTL.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_index(self, index: str) -> int:
+        """Delete every key recorded under an index, and the index. Returns count deleted."""
+        pass
+
     @abstractmethod
     async def delete(self, key: str) -> None:
         """Delete a key from the cache."""
@@ -50,91 +72,162 @@ class CacheBackend(ABC):
 
 
 class InMemoryCache(CacheBackend):
-    """Simple in-memory cache with TTL support.
+    """Simple in-memory LRU cache with TTL support.
 
-    Good for single-instance deployments or development.
+    Good for single-instance deployments or development. Expired entries are
+    dropped lazily on read; when full, the least recently used entry is
+    evicted, and evicting an index evicts the entries recorded under it so
+    none outlive their index uncleared. No operation awaits while touching the dict, so each call is
+    atomic on the event loop and no lock is needed.
     """
 
-    def __init__(self, max_size: int = 10000):
-        self._cache: dict[str, tuple[Any, datetime]] = {}
+    def __init__(self, max_size: int = 10000, clock: Callable[[], float] = time.monotonic):
+        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
         self._max_size = max_size
-        self._lock = asyncio.Lock()
+        self._clock = clock
+        # Keys of entries written by set_indexed as an index
+        self._indexes: set[str] = set()
 
     async def get(self, key: str) -> Optional[Any]:
-        async with self._lock:
-            if key not in self._cache:
-                return None
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
 
-            value, expires_at = self._cache[key]
+        value, expires_at = entry
 
-            if datetime.utcnow() > expires_at:
-                del self._cache[key]
-                return None
+        if self._clock() > expires_at:
+            self._cache.pop(key, None)
+            self._indexes.discard(key)
+            return None
 
-            return value
+        self._cache.move_to_end(key)
+        return value
 
     async def set(self, key: str, value: Any, ttl: int = 300) -> None:
-        async with self._lock:
-            # Evict oldest entries if at capacity
-            if len(self._cache) >= self._max_size:
-                # Remove expired entries first
-                now = datetime.utcnow()
-                expired = [k for k, (_, exp) in self._cache.items() if now > exp]
-                for k in expired:
-                    del self._cache[k]
-
-                # If still at capacity, remove oldest 10%
-                if len(self._cache) >= self._max_size:
-                    to_remove = list(self._cache.keys())[:self._max_size // 10]
-                    for k in to_remove:
-                        del self._cache[k]
-
-            expires_at = datetime.utcnow() + timedelta(seconds=ttl)
-            self._cache[key] = (value, expires_at)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            # Evict least recently used entries if at capacity
+            while self._cache and len(self._cache) >= self._max_size:
+                evicted, (members, _) = self._cache.popitem(last=False)
+                if evicted in self._indexes:
+                    self._indexes.discard(evicted)
+                    for member in members:
+                        self._cache.pop(member, None)
+
+        # Monotonic float deadline: cheap to compare and immune to clock changes
+        self._cache[key] = (value, self._clock() + ttl)
+
+    async def set_indexed(self, index: str, items: list[tuple[str, Any, int]], ttl: int) -> None:
+        # The index is an entry holding a set, so it ages out like everything
+        # else; evicting it takes its members along (see set)
+        keys = await self.get(index) or set()
+        for key, value, item_ttl in items:
+            await self.set(key, value, item_ttl)
+            keys.add(key)
+        await self.set(index, keys, ttl)
+        self._indexes.add(index)
+
+    async def delete_index(self, index: str) -> int:
+        return (await self.pop_index(index))[0]
+
+    async def pop_index(self, index: str) -> tuple[int, list[str]]:
+        """Delete an index and its keys; returns the count deleted and the keys."""
+        self._indexes.discard(index)
+        keys = self._cache.pop(index, (set(), 0))[0]
+        return sum(self._cache.pop(k, None) is not None for k in keys), list(keys)
 
     async def delete(self, key: str) -> None:
-        async with self._lock:
-            self._cache.pop(key, None)
+        self._cache.pop(key, None)
+        self._indexes.discard(key)
 
     async def clear_pattern(self, pattern: str) -> int:
         """Clear keys matching a simple prefix pattern (e.g., 'building:*')."""
-        async with self._lock:
-            prefix = pattern.rstrip('*')
-            to_delete = [k for k in self._cache.keys() if k.startswith(prefix)]
-            for k in to_delete:
-                del self._cache[k]
-            return len(to_delete)
+        prefix = pattern.rstrip('*')
+        to_delete = [k for k in self._cache.keys() if k.startswith(prefix)]
+        for k in to_delete:
+            del self._cache[k]
+        self._indexes.difference_update(to_delete)
+        return len(to_delete)
 
     async def close(self) -> None:
-        async with self._lock:
-            self._cache.clear()
+        self._cache.clear()
+        self._indexes.clear()
+
+
+# Keys scanned and unlinked per pipeline flush in RedisCache.clear_pattern
+CLEAR_BATCH_SIZE = 500
+
+# Serialized values at least this large are stored zstd-compressed: reports
+# and leaderboard lists shrink several-fold, small entries aren't worth it
+COMPRESS_MIN_BYTES = 1024
+# Leading byte of a compressed value; orjson output never starts with it, so
+# uncompressed values need no marker
+ZSTD_PREFIX = b"\x02"
+
+_compressor = zstandard.ZstdCompressor(level=3)
+_decompressor = zstandard.ZstdDecompressor()
+
+
+def _dumps(value: Any) -> bytes:
+    """Serialize a value for Redis, compressing large payloads."""
+    data = orjson.dumps(value, default=str)
+    if len(data) >= COMPRESS_MIN_BYTES:
+        return ZSTD_PREFIX + _compressor.compress(data)
+    return data
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize a value written by _dumps."""
+    if data[:1] == ZSTD_PREFIX:
+        data = _decompressor.decompress(data[1:])
+    return orjson.loads(data)
 
 
 class RedisCache(CacheBackend):
     """Redis-based cache backend for distributed deployments."""
 
-    def __init__(self, redis_url: str):
+    def __init__(self, redis_url: str, max_connections: int = 64):
         self._redis_url = redis_url
+        self._max_connections = max_connections
         self._redis = None
 
     async def _get_redis(self):
         if self._redis is None:
             try:
                 import redis.asyncio as redis
-                self._redis = redis.from_url(self._redis_url, decode_responses=True)
+                # Bounded pool: under a burst, callers wait briefly for a free
+                # connection instead of opening sockets without limit. RESP3
+                # replies are typed, so the client skips string parsing.
+                # Values are (possibly compressed) orjson bytes, so leave
+                # responses undecoded.
+                pool = redis.BlockingConnectionPool.from_url(
+                    self._redis_url,
+                    max_connections=self._max_connections,
+                    protocol=3,
+                )
+                self._redis = redis.Redis.from_pool(pool)
                 logger.info("Connected to Redis cache")
             except ImportError:
                 logger.error("redis package not installed. Run: pip install redis")
                 raise
         return self._redis
 
+    async def connect(self) -> None:
+        """Open the Redis connection eagerly."""
+        try:
+            r = await self._get_redis()
+            await r.ping()
+        except Exception as e:
+            logger.error(f"Redis CONNECT error: {e}")
+
     async def get(self, key: str) -> Optional[Any]:
         try:
             r = await self._get_redis()
             value = await r.get(key)
-            if value:
-                return json.loads(value)
-            return None
+            if value is None:
+                return None
+            return _loads(value)
         except Exception as e:
             logger.error(f"Redis GET error: {e}")
             return None
@@ -142,10 +235,50 @@ class RedisCache(CacheBackend):
     async def set(self, key: str, value: Any, ttl: int = 300) -> None:
         try:
             r = await self._get_redis()
-            await r.setex(key, ttl, json.dumps(value, default=str))
+            await r.set(key, _dumps(value), ex=ttl)
+        except Exception as e:
+            logger.error(f"Redis SET error: {e}")
+
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        try:
+            r = await self._get_redis()
+            values = await r.mget(keys)
+            return [None if value is None else _loads(value) for value in values]
+        except Exception as e:
+            logger.error(f"Redis MGET error: {e}")
+            return [None] * len(keys)
+
+    async def set_indexed(self, index: str, items: list[tuple[str, Any, int]], ttl: int) -> None:
+        try:
+            r = await self._get_redis()
+            # MSET can't carry per-key TTLs, so pipeline the SETs instead
+            async with r.pipeline(transaction=False) as pipe:
+                for key, value, item_ttl in items:
+                    pipe.set(key, _dumps(value), ex=item_ttl)
+                pipe.sadd(index, *(key for key, _, _ in items))
+                pipe.expire(index, ttl)
+                await pipe.execute()
         except Exception as e:
             logger.error(f"Redis SET error: {e}")
 
+    async def delete_index(self, index: str) -> int:
+        return (await self.pop_index(index))[0]
+
+    async def pop_index(self, index: str) -> tuple[int, list[str]]:
+        """Delete an index and its keys; returns the count deleted and the keys."""
+        try:
+            r = await self._get_redis()
+            keys = await r.smembers(index)
+            async with r.pipeline(transaction=True) as pipe:
+                if keys:
+                    pipe.unlink(*keys)
+                pipe.unlink(index)
+                results = await pipe.execute()
+            return (results[0] if keys else 0), [key.decode() for key in keys]
+        except Exception as e:
+            logger.error(f"Redis DELETE error: {e}")
+            return 0, []
+
     async def delete(self, key: str) -> None:
         try:
             r = await self._get_redis()
@@ -156,44 +289,205 @@ class RedisCache(CacheBackend):
     async def clear_pattern(self, pattern: str) -> int:
         try:
             r = await self._get_redis()
-            cursor = 0
             deleted = 0
-            while True:
-                cursor, keys = await r.scan(cursor, match=pattern, count=100)
-                if keys:
-                    await r.delete(*keys)
-                    deleted += len(keys)
-                if cursor == 0:
-                    break
+            # Queue UNLINKs (freed off the main Redis thread) and flush them
+            # in batches rather than paying a round-trip per SCAN page
+            async with r.pipeline(transaction=False) as pipe:
+                queued = 0
+                async for key in r.scan_iter(match=pattern, count=CLEAR_BATCH_SIZE):
+                    pipe.unlink(key)
+                    queued += 1
+                    if queued == CLEAR_BATCH_SIZE:
+                        deleted += sum(await pipe.execute())
+                        queued = 0
+                if queued:
+                    deleted += sum(await pipe.execute())
             return deleted
         except Exception as e:
             logger.error(f"Redis CLEAR error: {e}")
             return 0
 
+    async def publish(self, channel: str, message: Any) -> None:
+        try:
+            r = await self._get_redis()
+            await r.publish(channel, orjson.dumps(message))
+        except Exception as e:
+            logger.error(f"Redis PUBLISH error: {e}")
+
+    async def listen(self, channel: str):
+        """Yield messages published on a channel, forever."""
+        r = await self._get_redis()
+        pubsub = r.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield orjson.loads(message["data"])
+        finally:
+            await pubsub.close()
+
     async def close(self) -> None:
         if self._redis:
-            await self._redis.close()
+            await self._redis.aclose()
             self._redis = None
 
 
-# Global cache instance
+# Per-worker L1 in front of Redis: size, and how long an entry may be served
+# locally before Redis is asked again (bounds staleness if an eviction
+# message is missed)
+L1_MAX_SIZE = 1024
+L1_TTL = 30
+
+# Pub/sub channel carrying invalidations to every worker's L1
+INVALIDATION_CHANNEL = "cache_invalidate"
+
+
+class TwoTierCache(CacheBackend):
+    """Per-process LRU (L1) in front of a shared Redis cache (L2).
+
+    Repeated reads of a hot key within a worker are served from memory.
+    Invalidations are applied to L2 and broadcast on INVALIDATION_CHANNEL so
+    every worker (including this one) evicts its L1 copy; deleting an index
+    broadcasts its member keys too.
+    """
+
+    def __init__(self, l2: RedisCache):
+        self._l1 = InMemoryCache(max_size=L1_MAX_SIZE)
+        self._l2 = l2
+        self._listener: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
+        await self._l2.connect()
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async for message in self._l2.listen(INVALIDATION_CHANNEL):
+                    await self._evict_local(message["op"], message["target"], message.get("keys", ()))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache invalidation listener error: {e}")
+                # Drop everything we may have missed, then resubscribe
+                await self._l1.close()
+                await asyncio.sleep(5)
+
+    async def _evict_local(self, op: str, target: str, keys: Iterable[str] = ()) -> None:
+        if op == "delete":
+            await self._l1.delete(target)
+        elif op == "pattern":
+            await self._l1.clear_pattern(target)
+        elif op == "index":
+            await self._l1.delete_index(target)
+            # Keys a worker filled from L2 aren't in its own L1 index
+            for key in keys:
+                await self._l1.delete(key)
+
+    async def _invalidate(self, op: str, target: str, keys: Iterable[str] = ()) -> None:
+        await self._evict_local(op, target, keys)
+        message = {"op": op, "target": target}
+        if keys:
+            message["keys"] = keys
+        await self._l2.publish(INVALIDATION_CHANNEL, message)
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = await self._l1.get(key)
+        if value is None:
+            value = await self._l2.get(key)
+            if value is not None:
+                await self._l1.set(key, value, L1_TTL)
+        return value
+
+    async def get_many(self, keys: list[str]) -> list[Optional[Any]]:
+        values = await self._l1.get_many(keys)
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing:
+            fetched = await self._l2.get_many([keys[i] for i in missing])
+            for i, value in zip(missing, fetched):
+                if value is not None:
+                    values[i] = value
+                    await self._l1.set(keys[i], value, L1_TTL)
+        return values
+
+    async def set(self, key: str, value: Any, ttl: int = 300) -> None:
+        await self._l1.set(key, value, min(ttl, L1_TTL))
+        await self._l2.set(key, value, ttl)
+
+    async def set_indexed(self, index: str, items: list[tuple[str, Any, int]], ttl: int) -> None:
+        # L1 keeps its own index of the keys it holds, for delete_index
+        await self._l1.set_indexed(
+            index, [(key, value, min(item_ttl, L1_TTL)) for key, value, item_ttl in items], L1_TTL
+        )
+        await self._l2.set_indexed(index, items, ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._l2.delete(key)
+        await self._invalidate("delete", key)
+
+    async def delete_index(self, index: str) -> int:
+        # The index's members go out with the broadcast: other workers may
+        # hold them in L1 from a plain L2 read, outside their own L1 index
+        deleted, keys = await self._l2.pop_index(index)
+        await self._invalidate("index", index, keys)
+        return deleted
+
+    async def clear_pattern(self, pattern: str) -> int:
+        deleted = await self._l2.clear_pattern(pattern)
+        await self._invalidate("pattern", pattern)
+        return deleted
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        await self._l1.close()
+        await self._l2.close()
+
+
+# Global cache instance, built once at startup by init_cache()
 _cache: Optional[CacheBackend] = None
 
 
-def get_cache() -> CacheBackend:
-    """Get the global cache instance."""
+def _build_cache() -> CacheBackend:
+    """Build the configured cache backend."""
+    settings = get_settings()
+    redis_url = getattr(settings, 'redis_url', None)
+
+    if redis_url:
+        logger.info("Using Redis cache backend with in-process L1")
+        return TwoTierCache(RedisCache(redis_url, settings.redis_max_connections))
+
+    logger.info("Using in-memory cache backend")
+    return InMemoryCache()
+
+
+async def init_cache() -> CacheBackend:
+    """Create the global cache and open its connection ahead of traffic.
+
+    Called from the app lifespan so the first request does not pay for
+    backend selection, the redis import, or the initial connect.
+    """
     global _cache
     if _cache is None:
-        settings = get_settings()
-        redis_url = getattr(settings, 'redis_url', None)
+        _cache = _build_cache()
 
-        if redis_url:
-            logger.info("Using Redis cache backend")
-            _cache = RedisCache(redis_url)
-        else:
-            logger.info("Using in-memory cache backend")
-            _cache = InMemoryCache()
+    if isinstance(_cache, TwoTierCache):
+        await _cache.connect()
+
+    return _cache
+
+
+def get_cache() -> CacheBackend:
+    """Get the global cache instance.
 
+    Falls back to building it lazily for callers outside the app lifespan
+    (tests, pipeline scripts).
+    """
+    global _cache
+    if _cache is None:
+        _cache = _build_cache()
     return _cache
 
 
@@ -205,31 +499,74 @@ async def close_cache() -> None:
         _cache = None
 
 
+# Key suffixes (everything after the prefix) longer than this are replaced
+# by a fixed-width digest. Bare BBLs and IDs stay readable; filtered and
+# paginated keys shrink to the digest, which keeps Redis' keyspace and every
+# GET/MGET frame small. Invalidation only matches on prefixes or goes through
+# per-BBL key indexes, so hashed suffixes never need to be pattern-matched.
+MAX_KEY_SUFFIX_LENGTH = 32
+
+
+def _join_key(prefix: str, parts: list[str]) -> str:
+    """Join key parts under a prefix, hashing a long suffix."""
+    suffix = ":".join(parts)
+    if len(suffix) > MAX_KEY_SUFFIX_LENGTH:
+        suffix = "hash:" + hashlib.blake2b(suffix.encode(), digest_size=8).hexdigest()
+    return f"{prefix}:{suffix}" if suffix else prefix
+
+
 def make_cache_key(prefix: str, *args, **kwargs) -> str:
     """Generate a cache key from prefix and arguments."""
-    key_parts = [prefix]
+    key_parts = [str(arg) for arg in args if arg is not None]
+
+    # Most keys are a prefix and a BBL or ID; skip sorting an empty dict
+    if kwargs:
+        key_parts += [f"{k}={v}" for k, v in sorted(kwargs.items()) if v is not None]
+
+    return _join_key(prefix, key_parts)
+
 
-    for arg in args:
-        if arg is not None:
-            key_parts.append(str(arg))
+# Tasks computing cache misses, keyed by cache key
+_inflight: dict[str, asyncio.Task] = {}
 
-    for k, v in sorted(kwargs.items()):
-        if v is not None:
-            key_parts.append(f"{k}={v}")
 
-    key_str = ":".join(key_parts)
+def _finish_inflight(key: str, task: asyncio.Task) -> None:
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        # Mark retrieved in case every caller was cancelled before it finished
+        task.exception()
 
-    # Hash long keys to avoid issues with key length limits
-    if len(key_str) > 200:
-        hash_suffix = hashlib.md5(key_str.encode()).hexdigest()[:16]
-        key_str = f"{prefix}:hash:{hash_suffix}"
 
-    return key_str
+async def coalesce(key: str, load: Callable[[], Awaitable[T]]) -> T:
+    """Run load() for a cache miss, sharing one run among concurrent callers.
+
+    The first caller for a key starts load() (which should also populate the
+    cache) in its own task; it and callers arriving while it runs all await
+    that task instead of repeating the query, so cancelling any one caller
+    doesn't fail the others. Coalescing is per process.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(load())
+        _inflight[key] = task
+        task.add_done_callback(partial(_finish_inflight, key))
+    else:
+        logger.debug(f"Cache MISS (coalesced): {key}")
+    return await asyncio.shield(task)
+
+
+# Placeholder in a cached() key for a parameter left to its default
+_OMITTED = object()
 
 
 def cached(prefix: str, ttl: int = 300):
     """Decorator to cache function results.
 
+    Concurrent misses on the same key are coalesced: the first caller runs
+    the function and the rest await its result instead of repeating the
+    query.
+
     Args:
         prefix: Cache key prefix (e.g., 'building', 'search')
         ttl: Time to live in seconds (default 5 minutes)
@@ -240,14 +577,37 @@ def cached(prefix: str, ttl: int = 300):
             ...
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        # Resolve the parameter layout once so building a key per call is a
+        # single join over the argument values
+        param_names = list(inspect.signature(func).parameters)
+        skip_self = bool(param_names) and param_names[0] in ("self", "cls")
+        if skip_self:
+            param_names = param_names[1:]
+        known_params = frozenset(param_names)
+
+        def build_key(args: tuple, kwargs: dict) -> str:
+            if skip_self:
+                args = args[1:]
+            if kwargs and kwargs.keys() <= known_params:
+                # Order keyword values by signature so f(1, b=2) == f(a=1, b=2),
+                # keeping a slot for every parameter up to the last one given
+                # so the position still names the argument
+                rest = [kwargs.get(n, _OMITTED) for n in param_names[len(args):]]
+                while rest and rest[-1] is _OMITTED:
+                    rest.pop()
+                values = [*args, *rest]
+            elif kwargs:
+                return make_cache_key(prefix, *args, **kwargs)
+            else:
+                values = args
+
+            # None keeps its slot too, or f(x, None, "C") == f(x, "C", None)
+            return _join_key(prefix, ["" if v is _OMITTED else str(v) for v in values])
+
         @wraps(func)
         async def wrapper(*args, **kwargs) -> T:
             cache = get_cache()
-
-            # Generate cache key from function arguments
-            # Skip 'self' argument if present
-            cache_args = args[1:] if args and hasattr(args[0], '__class__') else args
-            key = make_cache_key(prefix, *cache_args, **kwargs)
+            key = build_key(args, kwargs)
 
             # Try to get from cache
             cached_value = await cache.get(key)
@@ -255,15 +615,15 @@ def cached(prefix: str, ttl: int = 300):
                 logger.debug(f"Cache HIT: {key}")
                 return cached_value
 
-            logger.debug(f"Cache MISS: {key}")
-
-            # Call the function and cache the result
-            result = await func(*args, **kwargs)
-
-            if result is not None:
-                await cache.set(key, result, ttl)
+            async def load() -> T:
+                logger.debug(f"Cache MISS: {key}")
+                # Call the function and cache the result
+                result = await func(*args, **kwargs)
+                if result is not None:
+                    await cache.set(key, result, ttl)
+                return result
 
-            return result
+            return await coalesce(key, load)
 
         return wrapper
     return decorator
@@ -276,6 +636,7 @@ class CacheTTL:
     MEDIUM = 300        # 5 minutes - default
     LONG = 900          # 15 minutes - for stable data
     VERY_LONG = 3600    # 1 hour - for rarely changing data
+    QUARTER_DAY = 21600 # 6 hours - for data invalidated on ingest
     DAILY = 86400       # 24 hours - for static data
 
 
@@ -284,8 +645,12 @@ class CacheKeys:
     """Standard cache key prefixes."""
     BUILDING = "building"
     BUILDING_REPORT = "building:report"
+    BUILDING_MISSING = "building:missing"
     BUILDING_VIOLATIONS = "building:violations"
+    BUILDING_TIMELINE = "building:timeline"
+    BUILDING_KEYS = "building:keys"  # set of cached keys per BBL
     SEARCH = "search"
     LEADERBOARD_BUILDINGS = "leaderboard:buildings"
     LEADERBOARD_LANDLORDS = "leaderboard:landlords"
     OWNER = "owner"
+    OWNER_MISSING = "owner:missing"
@@ -25,6 +25,10 @@ class Settings(BaseSettings):
     socrata_base_url: str = "https://data.cityofnewyork.us"
     socrata_rate_limit: int = 10  # requests per second
     socrata_page_size: int = 50000
+    socrata_concurrency: int = 3  # pages requested ahead while one is consumed
+
+    # Data pipeline
+    pipeline_concurrency: int = 4  # extractors loading at once (one pipeline connection each)
 
     # Logging
     log_level: str = "INFO"
@@ -32,8 +36,22 @@ class Settings(BaseSettings):
     # Database lifecycle
     auto_create_tables: bool = True
 
+    # Database connection pool (per worker process)
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30  # seconds to wait for a free connection
+    db_pool_recycle: int = 3600  # seconds before a connection is replaced
+    db_statement_cache_size: int = 1024  # asyncpg prepared statements per connection
+    db_prepared_statement_cache_size: int = 500  # SQLAlchemy's prepared statement LRU per connection
+
+    # Set when DATABASE_URL points at PgBouncer in transaction pooling mode;
+    # DIRECT_DATABASE_URL (optional) bypasses it for the data pipeline
+    db_pgbouncer: bool = False
+    direct_database_url: str = ""
+
     # Cache (optional - uses in-memory if not set)
     redis_url: str = ""
+    redis_max_connections: int = 64  # per worker; callers wait for a free one past this
 
     # Dataset IDs
     hpd_violations_dataset: str = "wvxf-dwi5"
@@ -47,7 +65,7 @@ class Settings(BaseSettings):
     acris_legals_dataset: str = "8h5j-fqxa"
     pluto_dataset: str = "64uk-42ks"
 
-    @field_validator("database_url", mode="after")
+    @field_validator("database_url", "direct_database_url", mode="after")
     @classmethod
     def convert_database_url(cls, v: str) -> str:
         """Convert to asyncpg dialect and normalize SSL query parameters."""
@@ -1,7 +1,14 @@
+import asyncio
+import hashlib
 import os
 import sys
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from uuid import uuid4
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 from app.config import get_settings
 
 # Debug: Print raw environment variable BEFORE any processing
@@ -18,14 +25,70 @@ print(f"DEBUG: After pydantic: {settings.database_url}", file=sys.stderr, flush=
 database_url = settings.database_url
 print(f"DEBUG: Using database_url: {database_url}", file=sys.stderr, flush=True)
 
-engine = create_async_engine(
-    database_url,
-    echo=False,
-    pool_size=5,
-    max_overflow=5,
-    pool_recycle=300,
-    pool_pre_ping=True,
-)
+POOL_SIZE = settings.db_pool_size
+# Connections opened at startup; the rest of the pool fills on demand
+WARM_POOL_SIZE = min(POOL_SIZE, 5)
+
+
+def _connect_args(url: str, pgbouncer: bool) -> dict:
+    """asyncpg-only connection options."""
+    if not url.startswith("postgresql+asyncpg"):
+        return {}
+
+    if pgbouncer:
+        # Transaction pooling hands each transaction to any server connection,
+        # so named prepared statements can't be reused, and PgBouncer rejects
+        # unknown startup parameters such as jit. SQLAlchemy still prepares
+        # each statement, so give every one a unique name: asyncpg's numbered
+        # names collide with statements other clients left on the server.
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+
+    # JIT compilation only slows the short OLTP queries the API runs, and
+    # larger statement caches keep every hot query prepared per connection.
+    # SQLAlchemy prepares statements itself and keeps them in its own LRU
+    # (100 by default), separate from asyncpg's statement_cache_size.
+    return {
+        "server_settings": {"jit": "off"},
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    }
+
+
+def _pool_args(pgbouncer: bool) -> dict:
+    """Connection pool options for an engine."""
+    if pgbouncer:
+        # PgBouncer already pools server connections; a second pool here
+        # would only hold client connections open
+        return {"poolclass": NullPool}
+
+    return {
+        "pool_size": POOL_SIZE,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+        # Reuse the most recently returned connection so idle ones can age out
+        "pool_use_lifo": True,
+    }
+
+
+def _create_engine(url: str, pgbouncer: bool) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        **_pool_args(pgbouncer),
+        # Room for every statement shape the API and pipeline compile, so hot
+        # queries are never evicted from SQLAlchemy's compiled SQL cache
+        query_cache_size=1200,
+        connect_args=_connect_args(url, pgbouncer),
+    )
+
+
+engine = _create_engine(database_url, settings.db_pgbouncer)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -33,12 +96,172 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Bulk loads, entity resolution and scoring connect straight to Postgres when
+# a direct URL is configured, keeping their prepared statements
+if settings.direct_database_url:
+    pipeline_engine = _create_engine(settings.direct_database_url, pgbouncer=False)
+else:
+    pipeline_engine = engine
+
+PipelineSessionLocal = async_sessionmaker(
+    pipeline_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 
+def schema_fingerprint() -> str:
+    """Digest of every table's name and column signatures in Base.metadata."""
+    parts = []
+    for table in sorted(Base.metadata.sorted_tables, key=lambda t: t.name):
+        columns = ",".join(
+            f"{c.name}:{c.type}:{c.nullable}:{c.primary_key}" for c in table.columns
+        )
+        parts.append(f"{table.name}({columns})")
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+async def create_tables_if_changed(bind: AsyncEngine = engine) -> bool:
+    """Run metadata.create_all only when the models changed since the last run.
+
+    create_all checks every table against the catalog, which slows each boot;
+    the fingerprint of the models it last created is kept in schema_version.
+    Returns True if the DDL pass ran.
+    """
+    fingerprint = schema_fingerprint()
+
+    try:
+        async with bind.connect() as conn:
+            stored = await conn.scalar(text("SELECT hash FROM schema_version LIMIT 1"))
+    except DBAPIError:
+        stored = None  # first boot - table doesn't exist yet
+
+    if stored == fingerprint:
+        return False
+
+    async with bind.begin() as conn:
+        await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, checkfirst=True))
+        await conn.execute(text("CREATE TABLE IF NOT EXISTS schema_version (hash VARCHAR(64) NOT NULL)"))
+        await conn.execute(text("DELETE FROM schema_version"))
+        await conn.execute(text("INSERT INTO schema_version (hash) VALUES (:hash)"), {"hash": fingerprint})
+    return True
+
+
+async def warm_pool(size: int = WARM_POOL_SIZE) -> None:
+    """Open pool connections up front so early requests skip connect setup."""
+    if settings.db_pgbouncer:
+        return  # nothing to warm: the engine keeps no pool behind PgBouncer
+    conns = await asyncio.gather(
+        *(engine.connect() for _ in range(size)), return_exceptions=True
+    )
+    errors = [c for c in conns if isinstance(c, BaseException)]
+    for conn in conns:
+        if not isinstance(conn, BaseException):
+            await conn.close()
+    if errors:
+        raise errors[0]
+
+
+def _asyncpg_dsn(url: str) -> str:
+    """Plain asyncpg DSN for a SQLAlchemy URL (asyncpg's DSN wants sslmode)."""
+    parts = urlsplit(url.replace("postgresql+asyncpg", "postgresql", 1))
+    query = [
+        ("sslmode" if key == "ssl" else key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+async def create_health_pool():
+    """Open a two-connection asyncpg pool reserved for health probes.
+
+    Probes then ping at the driver level without competing with API queries
+    for the main pool. Returns None when the database is not PostgreSQL.
+    """
+    if not database_url.startswith("postgresql+asyncpg"):
+        return None
+
+    import asyncpg
+
+    return await asyncpg.create_pool(
+        _asyncpg_dsn(database_url),
+        min_size=1,
+        max_size=2,
+        statement_cache_size=0 if settings.db_pgbouncer else 100,
+    )
+
+
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
             await session.close()
+
+
+class ReadOnlyConnection:
+    """Core connection for read-only queries, checked out on first use.
+
+    Skips the ORM session (identity map, unit of work) for endpoints that only
+    run textual/Core SELECTs, and requests served from the cache never touch
+    the pool at all.
+    """
+
+    def __init__(self, bind: AsyncEngine):
+        self._bind = bind
+        self._conn: AsyncConnection | None = None
+
+    @property
+    def bind(self) -> AsyncEngine:
+        return self._bind
+
+    async def _connection(self) -> AsyncConnection:
+        if self._conn is None:
+            self._conn = await self._bind.connect()
+        return self._conn
+
+    async def execute(self, statement, parameters=None):
+        conn = await self._connection()
+        return await conn.execute(statement, parameters)
+
+    async def scalar(self, statement, parameters=None):
+        conn = await self._connection()
+        return await conn.scalar(statement, parameters)
+
+    async def rollback(self) -> None:
+        if self._conn is not None:
+            await self._conn.rollback()
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+
+# Optional relations (materialized views) found or missing, per process
+_relation_exists: dict[str, bool] = {}
+
+
+async def relation_exists(db: AsyncSession | ReadOnlyConnection, name: str) -> bool:
+    """Whether a materialized view or table exists, checked once per process.
+
+    Only PostgreSQL databases built by the migrations have the views; on any
+    other database, e.g. SQLite under create_all(), this is always False.
+    """
+    exists = _relation_exists.get(name)
+    if exists is None:
+        exists = db.bind.dialect.name == "postgresql" and bool(
+            await db.scalar(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
+        )
+        _relation_exists[name] = exists
+    return exists
+
+
+async def get_readonly_conn() -> ReadOnlyConnection:
+    conn = ReadOnlyConnection(engine)
+    try:
+        yield conn
+    finally:
+        await conn.close()
@@ -2,11 +2,24 @@
 
 import logging
 import sys
+from contextvars import ContextVar
 from typing import Any
 
 from app.config import get_settings
 
 
+# ID of the HTTP request being handled, set by RequestLoggingMiddleware
+request_id_ctx: ContextVar[str] = ContextVar("request_id", default="-")
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamp each log record with the current request ID."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_ctx.get()
+        return True
+
+
 def setup_logging() -> None:
     """Configure structured logging for the application."""
     settings = get_settings()
@@ -15,13 +28,13 @@ def setup_logging() -> None:
     log_level = getattr(settings, 'log_level', 'INFO').upper()
 
     # Configure root logger
+    handler = logging.StreamHandler(sys.stdout)
+    handler.addFilter(RequestIdFilter())
     logging.basicConfig(
         level=log_level,
-        format='%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+        format='%(asctime)s | %(levelname)-8s | %(name)s | %(request_id)s | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S',
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ],
+        handlers=[handler],
         force=True,
     )
 
@@ -1,74 +1,89 @@
+import asyncio
 from contextlib import asynccontextmanager
+from enum import Enum
 
-from fastapi import FastAPI, Depends, BackgroundTasks
+from fastapi import APIRouter, FastAPI, Depends, HTTPException, Request, WebSocket, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1 import router as v1_router
 from app.config import get_settings
-from app.database import engine, Base, get_db
+from app.database import (
+    engine,
+    ReadOnlyConnection,
+    create_health_pool,
+    create_tables_if_changed,
+    get_db,
+    get_readonly_conn,
+    relation_exists,
+    warm_pool,
+)
 from app.logging_config import setup_logging, get_logger
 from app.middleware import RequestLoggingMiddleware, ErrorHandlingMiddleware
-from app.cache import close_cache
-from pipeline.runner import run_all, run_extractor, run_scoring, run_entity_resolution, EXTRACTORS
+from app.cache import init_cache, close_cache
+from app.services.cached import flush_cache_writes, prewarm_leaderboard_cache
+from pipeline.jobs.launcher import get_pipeline_job, launch_pipeline_job
+from pipeline.jobs.progress import EXITED_STAGE, subscribe_progress
+from pipeline.runner import EXTRACTORS
 
-# Set up logging first
-setup_logging()
 logger = get_logger('main')
-settings = get_settings()
-logger.info("Configured CORS origins: %s", settings.allowed_origins)
+
+# Root, health and admin routes; the public API lives in app.api.v1
+router = APIRouter()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting IsMyLandlordShady.nyc API...")
+    settings = get_settings()
 
     if settings.auto_create_tables:
-        # Create tables if they don't exist (useful for local/dev).
-        async with engine.begin() as conn:
-            await conn.run_sync(lambda sync_conn: Base.metadata.create_all(sync_conn, checkfirst=True))
-        logger.info("Database tables verified")
+        # Create tables if they don't exist (useful for local/dev); skipped
+        # when the models are unchanged since the last boot.
+        if await create_tables_if_changed():
+            logger.info("Database tables verified")
+        else:
+            logger.info("Database schema unchanged; skipping metadata.create_all()")
     else:
         logger.info("AUTO_CREATE_TABLES disabled; skipping metadata.create_all()")
+
+    try:
+        await warm_pool()
+        logger.info("Database pool warmed")
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed: {e}")
+
+    try:
+        app.state.health_pool = await create_health_pool()
+    except Exception as e:
+        app.state.health_pool = None
+        logger.warning(f"Health check pool unavailable: {e}")
+
+    await init_cache()
+    logger.info("Cache initialized")
+    # Runs alongside the first requests rather than delaying startup
+    app.state.prewarm_task = asyncio.create_task(prewarm_leaderboard_cache(engine))
     logger.info("API startup complete")
 
     yield
 
     # Shutdown
     logger.info("Shutting down API...")
+    app.state.prewarm_task.cancel()
+    await flush_cache_writes()
     await close_cache()
     logger.info("Cache closed")
+    if app.state.health_pool is not None:
+        await app.state.health_pool.close()
     await engine.dispose()
     logger.info("Database connections closed")
 
 
-app = FastAPI(
-    title="IsMyLandlordShady.nyc API",
-    description="API for NYC landlord and building data transparency",
-    version="1.0.0",
-    lifespan=lifespan,
-)
-
-# Add middleware (order matters - last added is first executed)
-app.add_middleware(ErrorHandlingMiddleware)
-app.add_middleware(RequestLoggingMiddleware)
-
-# CORS middleware for frontend
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include API routes
-app.include_router(v1_router)
-
-
-@app.get("/")
+@router.get("/")
 async def root():
     return {
         "name": "IsMyLandlordShady.nyc API",
@@ -77,8 +92,11 @@ async def root():
     }
 
 
-@app.get("/health")
-async def health_check(db: AsyncSession = Depends(get_db)):
+@router.get("/health")
+async def health_check(
+    request: Request,
+    conn: ReadOnlyConnection = Depends(get_readonly_conn),
+):
     """Health check endpoint with database connectivity verification."""
     health_status = {
         "status": "healthy",
@@ -87,8 +105,14 @@ async def health_check(db: AsyncSession = Depends(get_db)):
 
     # Check database connectivity
     try:
-        result = await db.execute(text("SELECT 1"))
-        result.scalar()
+        health_pool = getattr(request.app.state, "health_pool", None)
+        if health_pool is not None:
+            # Driver-level ping on the dedicated pool; the lazy connection
+            # below is never checked out
+            async with health_pool.acquire() as health_conn:
+                await health_conn.fetchval("SELECT 1")
+        else:
+            await conn.scalar(text("SELECT 1"))
         health_status["database"] = "connected"
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
@@ -98,68 +122,131 @@ async def health_check(db: AsyncSession = Depends(get_db)):
     return health_status
 
 
-@app.post("/admin/pipeline/trigger")
-async def trigger_pipeline(
-    background_tasks: BackgroundTasks,
+class PipelineAction(str, Enum):
+    """Pipeline runs that can be triggered from the admin API."""
+    TRIGGER = "trigger"
+    SCORING = "scoring"
+    ENTITY_RESOLUTION = "entity-resolution"
+
+
+# Runner arguments for the post-extraction steps
+PIPELINE_STEP_ARGS = {
+    PipelineAction.SCORING: ("--skip-extraction", "--scoring"),
+    PipelineAction.ENTITY_RESOLUTION: ("--skip-extraction", "--entity-resolution"),
+}
+
+
+@router.post("/admin/pipeline/{action}")
+async def run_pipeline_action(
+    action: PipelineAction,
     dataset: str | None = None,
     full_refresh: bool = False
 ):
     """
-    Trigger the data pipeline as a background task.
+    Start a pipeline run in a separate worker process.
 
     Args:
-        dataset: Specific dataset to run (e.g., 'pluto', 'hpd_violations').
-                 If None, runs all datasets.
+        action: 'trigger' runs extraction; 'scoring' and 'entity-resolution'
+                recompute from the data already loaded.
+        dataset: Specific dataset to extract (e.g., 'pluto', 'hpd_violations').
+                 If None, runs all datasets. Only used by 'trigger'.
         full_refresh: If True, truncate and reload instead of upsert.
+                      Only used by 'trigger'.
     """
+    if action in PIPELINE_STEP_ARGS:
+        step = action.value.replace("-", " ")
+        logger.info(f"Received {step} trigger request")
+        job_id = await launch_pipeline_job(*PIPELINE_STEP_ARGS[action])
+        return {"message": f"{step.capitalize()} triggered in background", "job_id": job_id}
+
+    refresh_args = ["--full-refresh"] if full_refresh else []
     if dataset:
         if dataset not in EXTRACTORS:
             return {"error": f"Unknown dataset: {dataset}. Available: {list(EXTRACTORS.keys())}"}
         logger.info(f"Received pipeline trigger for dataset: {dataset}. Full refresh: {full_refresh}")
-        background_tasks.add_task(run_extractor, dataset, full_refresh)
-        return {"message": f"Pipeline triggered for {dataset}", "dataset": dataset, "full_refresh": full_refresh}
+        job_id = await launch_pipeline_job("--dataset", dataset, *refresh_args)
+        return {"message": f"Pipeline triggered for {dataset}", "dataset": dataset, "full_refresh": full_refresh, "job_id": job_id}
     else:
         logger.info(f"Received full pipeline trigger request. Full refresh: {full_refresh}")
-        background_tasks.add_task(run_all, full_refresh=full_refresh)
-        return {"message": "Full pipeline triggered in background", "full_refresh": full_refresh}
+        job_id = await launch_pipeline_job("--dataset", "all", *refresh_args)
+        return {"message": "Full pipeline triggered in background", "full_refresh": full_refresh, "job_id": job_id}
 
 
-@app.post("/admin/pipeline/scoring")
-async def trigger_scoring(background_tasks: BackgroundTasks):
-    """Trigger scoring recalculation as a background task."""
-    logger.info("Received scoring trigger request")
-    background_tasks.add_task(run_scoring)
-    return {"message": "Scoring triggered in background"}
+@router.get("/admin/pipeline/jobs/{job_id}")
+async def pipeline_job_status(job_id: int):
+    """Get the status of a pipeline job started by this API worker."""
+    job = get_pipeline_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"job_id": job_id, **job}
 
 
-@app.post("/admin/pipeline/entity-resolution")
-async def trigger_entity_resolution(background_tasks: BackgroundTasks):
-    """Trigger entity resolution as a background task."""
-    logger.info("Received entity resolution trigger request")
-    background_tasks.add_task(run_entity_resolution)
-    return {"message": "Entity resolution triggered in background"}
+@router.websocket("/admin/pipeline/ws/{job_id}")
+async def pipeline_job_progress(websocket: WebSocket, job_id: int):
+    """
+    Stream a pipeline job's progress events until it exits.
+
+    Events are relayed from the job's Redis pub/sub channel, so clients don't
+    need to poll the status endpoint. Without Redis, only the job's current
+    status is sent.
+    """
+    job = get_pipeline_job(job_id)
+    if job is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    async with subscribe_progress(job_id) as events:
+        # Subscribed before reading the status, so a job exiting in between
+        # still delivers its exit event
+        if events is not None and job["status"] == "running":
+            async for event in events:
+                await websocket.send_json(event)
+                if event["stage"] == EXITED_STAGE:
+                    break
+        else:
+            await websocket.send_json({"stage": job["status"], **job})
+    await websocket.close()
 
 
-@app.get("/admin/entity-resolution/stats")
+@router.get("/admin/entity-resolution/stats")
 async def entity_resolution_stats(db: AsyncSession = Depends(get_db)):
-    """Get entity resolution data quality stats."""
-    query = text("""
-        SELECT
-            COUNT(*) as total_contacts,
-            COUNT(CASE WHEN contact_type IN ('CorporateOwner', 'HeadOfficer', 'IndividualOwner', 'JointOwner', 'Officer', 'Shareholder', 'Owner') THEN 1 END) as owner_type_contacts,
-            COUNT(CASE WHEN contact_type IN ('CorporateOwner', 'HeadOfficer', 'IndividualOwner', 'JointOwner', 'Officer', 'Shareholder', 'Owner') AND name_hash IS NOT NULL THEN 1 END) as with_hash,
-            COUNT(CASE WHEN contact_type IN ('CorporateOwner', 'HeadOfficer', 'IndividualOwner', 'JointOwner', 'Officer', 'Shareholder', 'Owner') AND owner_portfolio_id IS NOT NULL THEN 1 END) as linked,
-            COUNT(CASE WHEN contact_type IN ('CorporateOwner', 'HeadOfficer', 'IndividualOwner', 'JointOwner', 'Officer', 'Shareholder', 'Owner') AND (full_name IS NULL OR full_name = '') THEN 1 END) as empty_name,
-            COUNT(CASE WHEN contact_type IN ('CorporateOwner', 'HeadOfficer', 'IndividualOwner', 'JointOwner', 'Officer', 'Shareholder', 'Owner') AND (business_address IS NULL OR business_address = '') THEN 1 END) as empty_address
-        FROM registration_contacts;
-    """)
-
-    result = await db.execute(query)
+    """
+    Get entity resolution data quality stats.
+
+    Served from the er_stats_mv materialized view (refreshed after each entity
+    resolution run); falls back to scanning registration_contacts when the
+    view has not been created, e.g. on databases built with create_all().
+    """
+    if await relation_exists(db, "er_stats_mv"):
+        result = await db.execute(text("SELECT * FROM er_stats_mv"))
+    else:
+        # Owner-type check is evaluated once per row, then reused by FILTERs
+        result = await db.execute(text("""
+            WITH contacts AS (
+                SELECT
+                    contact_type IN ('CorporateOwner', 'HeadOfficer', 'IndividualOwner', 'JointOwner', 'Officer', 'Shareholder', 'Owner') AS is_owner,
+                    name_hash,
+                    owner_portfolio_id,
+                    full_name,
+                    business_address
+                FROM registration_contacts
+            )
+            SELECT
+                COUNT(*) as total_contacts,
+                COUNT(*) FILTER (WHERE is_owner) as owner_type_contacts,
+                COUNT(*) FILTER (WHERE is_owner AND name_hash IS NOT NULL) as with_hash,
+                COUNT(*) FILTER (WHERE is_owner AND owner_portfolio_id IS NOT NULL) as linked,
+                COUNT(*) FILTER (WHERE is_owner AND (full_name IS NULL OR full_name = '')) as empty_name,
+                COUNT(*) FILTER (WHERE is_owner AND (business_address IS NULL OR business_address = '')) as empty_address
+            FROM contacts;
+        """))
+
     row = result.first()
 
     owner_contacts = row.owner_type_contacts
 
-    return {
+    return ORJSONResponse({
         "total_contacts": row.total_contacts,
         "owner_type_contacts": owner_contacts,
         "with_hash": row.with_hash,
@@ -170,4 +257,48 @@ async def entity_resolution_stats(db: AsyncSession = Depends(get_db)):
         "empty_name_pct": round(100 * row.empty_name / owner_contacts, 1) if owner_contacts else 0,
         "empty_address": row.empty_address,
         "empty_address_pct": round(100 * row.empty_address / owner_contacts, 1) if owner_contacts else 0,
-    }
+    })
+
+
+def create_app() -> FastAPI:
+    """Build the API app: logging, middleware stack and routes.
+
+    Called exactly once below; importing this module has no other side effects.
+    """
+    # Set up logging first
+    setup_logging()
+    settings = get_settings()
+    logger.info("Configured CORS origins: %s", settings.allowed_origins)
+
+    app = FastAPI(
+        title="IsMyLandlordShady.nyc API",
+        description="API for NYC landlord and building data transparency",
+        version="1.0.0",
+        lifespan=lifespan,
+        # orjson renders responses several times faster than stdlib json
+        default_response_class=ORJSONResponse,
+    )
+
+    # Add middleware (order matters - last added is first executed)
+    # Reports and leaderboard pages are large JSON; skip tiny bodies
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+    app.add_middleware(ErrorHandlingMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+
+    # CORS middleware for frontend
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.allowed_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Include API routes
+    app.include_router(v1_router)
+    app.include_router(router)
+
+    return app
+
+
+app = create_app()
@@ -1,68 +1,121 @@
-"""Middleware for IsMyLandlordShady.nyc API."""
+"""Middleware for IsMyLandlordShady.nyc API.
 
+Written as plain ASGI middleware rather than BaseHTTPMiddleware, which spawns
+a task group and re-streams every response body through a memory stream.
+"""
+
+import logging
+import re
 import time
-from typing import Callable
+import uuid
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.logging_config import get_logger
+from app.logging_config import get_logger, request_id_ctx
 
 logger = get_logger('middleware')
 
+# Client-supplied request IDs are echoed into logs, so only accept plain tokens
+_VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._-]{1,128}")
+
+
+def _request_id(scope: Scope) -> str:
+    """Use the caller's X-Request-ID when it looks sane, else generate one."""
+    for name, value in scope["headers"]:
+        if name == b"x-request-id":
+            candidate = value.decode("latin-1")
+            if _VALID_REQUEST_ID.fullmatch(candidate):
+                return candidate
+            break
+    return uuid.uuid4().hex
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+
+class RequestLoggingMiddleware:
     """Middleware to log request/response details."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Every log line for this request carries its ID (see RequestIdFilter)
+        request_id = _request_id(scope)
+        token = request_id_ctx.set(request_id)
+        try:
+            await self._handle(scope, receive, send, request_id)
+        finally:
+            request_id_ctx.reset(token)
+
+    async def _handle(self, scope: Scope, receive: Receive, send: Send, request_id: str) -> None:
         # Skip logging for health checks to reduce noise
-        if request.url.path in ('/health', '/'):
-            return await call_next(request)
+        if scope["path"] in ('/health', '/'):
+            async def send_with_request_id(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append('X-Request-ID', request_id)
+                await send(message)
 
+            await self.app(scope, receive, send_with_request_id)
+            return
+
+        method, path = scope["method"], scope["path"]
+        client = scope.get("client")
         start_time = time.perf_counter()
 
         # Log request start
-        logger.info(
-            f"Request: {request.method} {request.url.path} | "
-            f"Client: {request.client.host if request.client else 'unknown'}"
-        )
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "Request: %s %s | Client: %s",
+                method, path, client[0] if client else 'unknown',
+            )
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration_ms = (time.perf_counter() - start_time) * 1000
+
+                # Log response
+                if log_info:
+                    logger.info(
+                        "Response: %s %s | Status: %d | Duration: %.2fms",
+                        method, path, message['status'], duration_ms,
+                    )
+
+                # Add timing and correlation headers
+                headers = MutableHeaders(scope=message)
+                headers.append('X-Response-Time', f"{duration_ms:.2f}ms")
+                headers.append('X-Request-ID', request_id)
+
+            await send(message)
 
         # Process request
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_timing)
         except Exception as e:
             duration_ms = (time.perf_counter() - start_time) * 1000
             logger.error(
-                f"Request failed: {request.method} {request.url.path} | "
-                f"Duration: {duration_ms:.2f}ms | Error: {str(e)}",
+                "Request failed: %s %s | Duration: %.2fms | Error: %s",
+                method, path, duration_ms, e,
                 exc_info=True
             )
             raise
 
-        # Calculate duration
-        duration_ms = (time.perf_counter() - start_time) * 1000
-
-        # Log response
-        logger.info(
-            f"Response: {request.method} {request.url.path} | "
-            f"Status: {response.status_code} | Duration: {duration_ms:.2f}ms"
-        )
 
-        # Add timing header
-        response.headers['X-Response-Time'] = f"{duration_ms:.2f}ms"
-
-        return response
-
-
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """Middleware to handle and log unhandled exceptions."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send)
         except Exception as e:
             logger.error(
-                f"Unhandled exception: {type(e).__name__}: {str(e)}",
+                "Unhandled exception: %s: %s", type(e).__name__, e,
                 exc_info=True
             )
             raise
@@ -1,6 +1,5 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, Index
+from sqlalchemy import Column, Computed, String, Integer, Float, DateTime, Index, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.database import Base
 
 
@@ -17,13 +16,18 @@ class Building(Base):
     zip_code = Column(String(10))
     total_units = Column(Integer, default=0)
     residential_units = Column(Integer, default=0)
+    # Per-unit score denominator: at least 1, even when total_units is unknown
+    scoring_units = Column(
+        Integer,
+        Computed("CASE WHEN total_units > 1 THEN total_units ELSE 1 END", persisted=True),
+    )
     year_built = Column(Integer)
     building_class = Column(String(10))
     latitude = Column(Float)
     longitude = Column(Float)
     # Note: geom column omitted - using lat/long instead
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships - Only keep relationships where FK exists
     # Note: HPDRegistration, HPDViolation, Complaint311 FKs were removed for flexible loading
@@ -1,6 +1,5 @@
-from sqlalchemy import Column, String, Integer, DateTime, Date, ForeignKey, Text, Index
+from sqlalchemy import Column, Computed, String, Integer, DateTime, Date, ForeignKey, Text, Index, cast, extract, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.database import Base
 
 
@@ -27,10 +26,15 @@ class Complaint311(Base):
     latitude = Column(String(50))
     longitude = Column(String(50))
 
-    # Computed fields
-    days_to_resolve = Column(Integer)
+    # Computed fields (whole days elapsed, filled in by Postgres on write).
+    # Built as an expression rather than text so create_all() can render it
+    # on SQLite too.
+    days_to_resolve = Column(
+        Integer,
+        Computed(cast(extract("day", closed_date - created_date), Integer), persisted=True),
+    )
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
     # No ORM relationships - BBL field used for explicit joins
 
@@ -1,6 +1,5 @@
-from sqlalchemy import Column, String, Integer, DateTime, Date, ForeignKey, Text, Index
+from sqlalchemy import Column, String, Integer, DateTime, Date, ForeignKey, Text, Index, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.database import Base
 
 
@@ -27,7 +26,7 @@ class DOBViolation(Base):
     violation_category = Column(String(100))
     violation_type = Column(String(100))
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
     # No ORM relationships - BBL field used for explicit joins
 
@@ -1,6 +1,5 @@
-from sqlalchemy import Column, String, Integer, DateTime, Date, ForeignKey, Text, Index, UniqueConstraint
+from sqlalchemy import Column, String, Integer, DateTime, Date, ForeignKey, Text, Index, UniqueConstraint, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.database import Base
 
 
@@ -19,7 +18,7 @@ class HPDRegistration(Base):
     lot = Column(Integer)
     last_registration_date = Column(Date)
     registration_end_date = Column(Date)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     contacts = relationship("RegistrationContact", back_populates="registration")
@@ -52,7 +51,7 @@ class RegistrationContact(Base):
     name_hash = Column(String(32), index=True)
     owner_portfolio_id = Column(Integer, ForeignKey("owner_portfolios.id"))
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
     # Relationships
     registration = relationship("HPDRegistration", back_populates="contacts")
@@ -92,7 +91,7 @@ class HPDViolation(Base):
     violation_status = Column(String(50))
     violation_class = Column(String(5))  # A, B, C
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
     # No ORM relationships - BBL field used for explicit joins
 
@@ -1,6 +1,5 @@
-from sqlalchemy import Column, String, Integer, DateTime, Float, Text, Index
+from sqlalchemy import Column, Computed, String, Integer, DateTime, Float, Text, Index, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.database import Base
 
 
@@ -26,13 +25,21 @@ class OwnerPortfolio(Base):
 
     # Scoring
     portfolio_score = Column(Float)
-    portfolio_grade = Column(String(2))
+    portfolio_grade = Column(
+        String(2),
+        Computed(
+            "CASE WHEN portfolio_score < 20 THEN 'A' WHEN portfolio_score < 40 THEN 'B' "
+            "WHEN portfolio_score < 60 THEN 'C' WHEN portfolio_score < 80 THEN 'D' "
+            "WHEN portfolio_score >= 80 THEN 'F' END",
+            persisted=True,
+        ),
+    )
 
     # Flags
     is_llc = Column(Integer, default=0)  # 1 if owner uses LLC structure
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     contacts = relationship("RegistrationContact", back_populates="portfolio")
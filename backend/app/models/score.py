@@ -1,6 +1,5 @@
-from sqlalchemy import Column, String, Integer, DateTime, Float, ForeignKey, Index
+from sqlalchemy import Column, Computed, String, Integer, DateTime, Float, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.database import Base
 
 
@@ -18,7 +17,16 @@ class BuildingScore(Base):
 
     # Overall score and grade
     overall_score = Column(Float, default=0)
-    grade = Column(String(2))  # A, B, C, D, F
+    # A, B, C, D, F (filled in by Postgres on write)
+    grade = Column(
+        String(2),
+        Computed(
+            "CASE WHEN overall_score < 20 THEN 'A' WHEN overall_score < 40 THEN 'B' "
+            "WHEN overall_score < 60 THEN 'C' WHEN overall_score < 80 THEN 'D' "
+            "WHEN overall_score >= 80 THEN 'F' END",
+            persisted=True,
+        ),
+    )
 
     # Raw counts for display
     total_violations = Column(Integer, default=0)
@@ -39,8 +47,8 @@ class BuildingScore(Base):
     percentile_borough = Column(Float)
     percentile_city = Column(Float)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     # Relationships
     building = relationship("Building", back_populates="score")
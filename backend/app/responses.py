@@ -0,0 +1,41 @@
+"""Conditional GET support for cacheable endpoints."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a serialized response body."""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header (which may list several tags) against etag."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def etag_response(request: Request, body: bytes) -> Response:
+    """Send a serialized JSON body with an ETag, or 304 if the client has it.
+
+    A matching If-None-Match skips sending (and gzipping) the body entirely.
+    """
+    etag = make_etag(body)
+    headers = {"ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def etag_json_response(request: Request, payload: Any) -> Response:
+    """Serialize payload with orjson and send it via etag_response."""
+    return etag_response(request, orjson.dumps(payload, default=str))
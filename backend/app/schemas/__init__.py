@@ -8,6 +8,7 @@ from app.schemas.building import (
 )
 from app.schemas.owner import OwnerInfo, OwnerPortfolio, PortfolioBuilding
 from app.schemas.leaderboard import LeaderboardBuilding, LeaderboardLandlord
+from app.schemas.batch import BatchRequest, BatchResponse
 
 __all__ = [
     "BuildingSearch",
@@ -21,4 +22,6 @@ __all__ = [
     "PortfolioBuilding",
     "LeaderboardBuilding",
     "LeaderboardLandlord",
+    "BatchRequest",
+    "BatchResponse",
 ]
@@ -0,0 +1,55 @@
+import re
+from typing import Any, Literal, Optional
+from urllib.parse import unquote
+
+from pydantic import BaseModel, Field, field_validator
+
+API_PREFIX = "/api/v1/"
+MAX_BATCH_SIZE = 10
+
+# Characters a URL-encoded path or query may contain, with well-formed escapes
+_ENCODED_URL = re.compile(r"(?:[A-Za-z0-9\-._~!$&'()*+,;=:@/?]|%[0-9A-Fa-f]{2})*")
+
+
+class BatchRequestItem(BaseModel):
+    """Single sub-request in a batch."""
+    id: str
+    url: str
+    method: Literal["GET"] = "GET"
+
+    @field_validator("url")
+    @classmethod
+    def validate_url(cls, v: str) -> str:
+        """Only read-only API routes may be batched (and never the batch route).
+
+        The client resolves dot segments before dispatch, so those (and empty
+        segments) are rejected rather than letting a URL climb out of the
+        prefix; anything else must already be URL-encoded.
+        """
+        if not _ENCODED_URL.fullmatch(v):
+            raise ValueError("url must be URL-encoded")
+        path = v.partition("?")[0]
+        segments = [unquote(segment) for segment in path.split("/")[1:]]
+        # A trailing slash leaves the last segment empty
+        if "" in segments[:-1] or "." in segments or ".." in segments:
+            raise ValueError("url must not contain empty or dot segments")
+        if not v.startswith(API_PREFIX) or v.startswith(f"{API_PREFIX}batch"):
+            raise ValueError(f"url must be an {API_PREFIX} route")
+        return v
+
+
+class BatchRequest(BaseModel):
+    """Batch of API lookups to run in one round-trip."""
+    requests: list[BatchRequestItem] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchResponseItem(BaseModel):
+    """Result of a single sub-request."""
+    id: str
+    status: int
+    body: Optional[Any]
+
+
+class BatchResponse(BaseModel):
+    """Results in the same order as the requests."""
+    responses: list[BatchResponseItem]
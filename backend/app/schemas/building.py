@@ -1,6 +1,6 @@
 from typing import Optional
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class BuildingSearch(BaseModel):
@@ -71,8 +71,7 @@ class ViolationItem(BaseModel):
     apartment: Optional[str]
     story: Optional[str]
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class BuildingReport(BaseModel):
@@ -117,6 +116,13 @@ class TimelineResponse(BaseModel):
     bbl: str
 
 
+class BuildingOverview(BaseModel):
+    """Report, first violations page and timeline for a building page."""
+    report: BuildingReport
+    violations: ViolationsResponse
+    timeline: TimelineResponse
+
+
 class RecentViolationItem(BaseModel):
     """Recent violation with building info."""
     id: int
@@ -130,8 +136,7 @@ class RecentViolationItem(BaseModel):
     address: Optional[str]
     borough: Optional[str]
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class RecentViolationsResponse(BaseModel):
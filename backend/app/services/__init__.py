@@ -1,9 +1,23 @@
-from app.services.entity_resolution import EntityResolutionService
-from app.services.scoring import ScoringService
-from app.services.buildings import BuildingService
+import importlib
+
+# Resolved on first access, so importing one service module (the pipeline
+# only needs app.services.cached) doesn't load the others and what they pull
+# in, like rapidfuzz for entity resolution
+_SERVICE_MODULES = {
+    "EntityResolutionService": "app.services.entity_resolution",
+    "ScoringService": "app.services.scoring",
+    "BuildingService": "app.services.buildings",
+}
 
 __all__ = [
     "EntityResolutionService",
     "ScoringService",
     "BuildingService",
 ]
+
+
+def __getattr__(name: str):
+    module = _SERVICE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -1,9 +1,12 @@
-from typing import Optional
+import asyncio
+from typing import Awaitable, Callable, Optional, Union
 from datetime import datetime, timedelta
 
-from sqlalchemy import select, func, text, or_, and_
+from sqlalchemy import select, func, text, exists, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
+
+from app.database import POOL_SIZE, ReadOnlyConnection, relation_exists
 
 from app.models.building import Building
 from app.models.hpd import HPDViolation, HPDRegistration, RegistrationContact
@@ -13,6 +16,96 @@ from app.models.score import BuildingScore
 from app.models.owner import OwnerPortfolio
 
 
+# Extra sessions report reads may hold at once across this process, kept well
+# below the pool so a burst of uncached reports can't starve other requests;
+# past this the reads wait for a slot
+REPORT_READ_CONCURRENCY = max(1, POOL_SIZE // 4)
+_report_read_slots = asyncio.Semaphore(REPORT_READ_CONCURRENCY)
+
+
+# Hot leaderboard statements are built once at import rather than per call;
+# the fixed SQL text also keeps SQLAlchemy's compiled cache and the driver's
+# prepared statement cache hitting the same entry every time.
+_WORST_BUILDINGS_SELECT = """
+    SELECT
+        b.bbl,
+        b.full_address,
+        b.borough,
+        b.zip_code,
+        b.total_units,
+        bs.overall_score,
+        bs.grade,
+        bs.total_violations,
+        bs.class_c_violations,
+        bs.total_complaints,
+        bs.total_evictions,
+        COUNT(*) OVER() AS total
+    FROM buildings b
+    JOIN building_scores bs ON b.bbl = bs.bbl
+"""
+_WORST_BUILDINGS_PAGE = """
+    ORDER BY bs.overall_score DESC
+    LIMIT :limit
+    OFFSET :offset
+"""
+_WORST_BUILDINGS_SQL = text(_WORST_BUILDINGS_SELECT + _WORST_BUILDINGS_PAGE)
+_WORST_BUILDINGS_BY_BOROUGH_SQL = text(
+    _WORST_BUILDINGS_SELECT + "    WHERE b.borough = :borough\n" + _WORST_BUILDINGS_PAGE
+)
+
+# Same rows served from worst_buildings_mv, which stores each building's rank
+# and the totals, so a page is an index range scan rather than a full sort
+_WORST_BUILDINGS_MV_SELECT = """
+    SELECT
+        bbl,
+        full_address,
+        borough,
+        zip_code,
+        total_units,
+        overall_score,
+        grade,
+        total_violations,
+        class_c_violations,
+        total_complaints,
+        total_evictions,
+"""
+_WORST_BUILDINGS_MV_SQL = text(_WORST_BUILDINGS_MV_SELECT + """
+        city_total AS total
+    FROM worst_buildings_mv
+    WHERE city_rank > :offset
+    ORDER BY city_rank
+    LIMIT :limit
+""")
+_WORST_BUILDINGS_MV_BY_BOROUGH_SQL = text(_WORST_BUILDINGS_MV_SELECT + """
+        borough_total AS total
+    FROM worst_buildings_mv
+    WHERE borough = :borough
+    AND borough_rank > :offset
+    ORDER BY borough_rank
+    LIMIT :limit
+""")
+
+_WORST_LANDLORDS_SQL = text("""
+    SELECT
+        id,
+        primary_name,
+        total_buildings,
+        total_units,
+        total_violations,
+        class_c_violations,
+        portfolio_score,
+        portfolio_grade,
+        is_llc,
+        COUNT(*) OVER() AS total
+    FROM owner_portfolios
+    WHERE portfolio_score IS NOT NULL
+    AND total_buildings > 1
+    ORDER BY portfolio_score DESC
+    LIMIT :limit
+    OFFSET :offset
+""")
+
+
 class BuildingService:
     """Service for building-related queries."""
 
@@ -65,32 +158,36 @@ class BuildingService:
         """Get building by BBL with related data."""
         query = (
             select(Building)
-            .options(selectinload(Building.score))
+            # Joined rather than selectin: one round-trip instead of two
+            .options(joinedload(Building.score))
             .where(Building.bbl == bbl)
         )
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def building_exists(self, bbl: str) -> bool:
+        """Check whether a building row exists for the BBL."""
+        query = select(exists().where(Building.bbl == bbl))
+        result = await self.session.execute(query)
+        return bool(result.scalar())
+
     async def get_building_report(self, bbl: str) -> Optional[dict]:
         """Get comprehensive building report."""
         building = await self.get_building_by_bbl(bbl)
         if not building:
             return None
 
-        # Get owner info
-        owner = await self._get_building_owner(bbl)
-
-        # Get violation summary
-        violations = await self._get_violation_summary(bbl)
-
-        # Get recent violations
-        recent_violations = await self.get_violations(bbl, limit=10)
-
-        # Get complaint summary
-        complaints = await self._get_complaint_summary(bbl)
-
-        # Get eviction count
-        eviction_count = await self._get_eviction_count(bbl)
+        # The sections are independent, so they load concurrently and the
+        # report costs the slowest one rather than the sum
+        owner, violations, recent_violations, complaints, eviction_count = (
+            await self._gather_reads(
+                lambda service: service._get_building_owner(bbl),
+                lambda service: service._get_violation_summary(bbl),
+                lambda service: service.get_violations(bbl, limit=10),
+                lambda service: service._get_complaint_summary(bbl),
+                lambda service: service._get_eviction_count(bbl),
+            )
+        )
 
         score = building.score
 
@@ -122,6 +219,19 @@ class BuildingService:
             "evictions": {"total": eviction_count},
         }
 
+    async def _gather_reads(self, *reads: Callable[["BuildingService"], Awaitable]) -> list:
+        """Run reads concurrently, each on its own session from the same engine.
+
+        A session runs one statement at a time, so concurrent reads can't
+        share the request's. The extra sessions across all requests are capped
+        at REPORT_READ_CONCURRENCY.
+        """
+        async def run(read):
+            async with _report_read_slots, AsyncSession(self.session.bind) as session:
+                return await read(BuildingService(session))
+
+        return await asyncio.gather(*(run(read) for read in reads))
+
     async def _get_building_owner(self, bbl: str) -> Optional[dict]:
         """Get current owner info for a building."""
         query = text("""
@@ -195,23 +305,18 @@ class BuildingService:
 
     async def _get_complaint_summary(self, bbl: str) -> dict:
         """Get complaint summary."""
-        # Total count
-        total_query = (
-            select(func.count(Complaint311.unique_key))
-            .where(Complaint311.bbl == bbl)
-        )
-        total = (await self.session.execute(total_query)).scalar() or 0
-
-        # Recent count (last year)
+        # Total and recent (last year) counts in a single scan
         one_year_ago = datetime.now() - timedelta(days=365)
-        recent_query = (
-            select(func.count(Complaint311.unique_key))
-            .where(
-                Complaint311.bbl == bbl,
-                Complaint311.created_date >= one_year_ago,
+        counts_query = (
+            select(
+                func.count(Complaint311.unique_key),
+                func.count(Complaint311.unique_key).filter(
+                    Complaint311.created_date >= one_year_ago
+                ),
             )
+            .where(Complaint311.bbl == bbl)
         )
-        recent = (await self.session.execute(recent_query)).scalar() or 0
+        total, recent = (await self.session.execute(counts_query)).one()
 
         # By type
         type_query = (
@@ -227,8 +332,8 @@ class BuildingService:
         type_result = await self.session.execute(type_query)
 
         return {
-            "total": total,
-            "last_year": recent,
+            "total": total or 0,
+            "last_year": recent or 0,
             "by_type": [
                 {"type": row[0], "count": row[1]}
                 for row in type_result
@@ -244,20 +349,46 @@ class BuildingService:
         result = await self.session.execute(query)
         return result.scalar() or 0
 
-    async def get_violations_count(
-        self,
+    @staticmethod
+    def _filter_violations(
+        query,
         bbl: str,
         status: Optional[str] = None,
         violation_class: Optional[str] = None,
-    ) -> int:
-        """Get total count of violations for a building with optional filters."""
-        query = select(func.count(HPDViolation.violation_id)).where(HPDViolation.bbl == bbl)
+    ):
+        """Apply the building/status/class filters shared by the violation queries."""
+        query = query.where(HPDViolation.bbl == bbl)
 
         if status:
             query = query.where(HPDViolation.current_status == status)
         if violation_class:
             query = query.where(HPDViolation.violation_class == violation_class)
 
+        return query
+
+    @staticmethod
+    def _violation_to_dict(v: HPDViolation) -> dict:
+        return {
+            "id": v.violation_id,
+            "violation_class": v.violation_class,
+            "status": v.current_status,
+            "inspection_date": v.inspection_date.isoformat() if v.inspection_date else None,
+            "description": v.nov_description,
+            "apartment": v.apartment,
+            "story": v.story,
+        }
+
+    async def get_violations_count(
+        self,
+        bbl: str,
+        status: Optional[str] = None,
+        violation_class: Optional[str] = None,
+    ) -> int:
+        """Get total count of violations for a building with optional filters."""
+        query = self._filter_violations(
+            select(func.count(HPDViolation.violation_id)), bbl, status, violation_class
+        )
+
         result = await self.session.execute(query)
         return result.scalar() or 0
 
@@ -271,40 +402,75 @@ class BuildingService:
     ) -> list[dict]:
         """Get paginated violations for a building."""
         query = (
-            select(HPDViolation)
-            .where(HPDViolation.bbl == bbl)
+            self._filter_violations(select(HPDViolation), bbl, status, violation_class)
+            .order_by(HPDViolation.inspection_date.desc().nulls_last())
+            .offset(offset)
+            .limit(limit)
         )
 
-        if status:
-            query = query.where(HPDViolation.current_status == status)
-        if violation_class:
-            query = query.where(HPDViolation.violation_class == violation_class)
+        result = await self.session.execute(query)
+        violations = result.scalars().all()
 
+        return [self._violation_to_dict(v) for v in violations]
+
+    async def get_violations_page(
+        self,
+        bbl: str,
+        limit: int = 50,
+        offset: int = 0,
+        status: Optional[str] = None,
+        violation_class: Optional[str] = None,
+    ) -> Optional[dict]:
+        """Get a page of violations and the total match count in one query.
+
+        The total and the building's existence ride along on every row, so
+        a building with violations costs a single round-trip. Returns None
+        if the building does not exist.
+        """
+        building_exists = exists().where(Building.bbl == bbl).label("building_exists")
         query = (
-            query
+            self._filter_violations(
+                select(
+                    HPDViolation,
+                    func.count().over().label("total"),
+                    building_exists,
+                ),
+                bbl,
+                status,
+                violation_class,
+            )
             .order_by(HPDViolation.inspection_date.desc().nulls_last())
             .offset(offset)
             .limit(limit)
         )
 
         result = await self.session.execute(query)
-        violations = result.scalars().all()
+        rows = result.all()
 
-        return [
-            {
-                "id": v.violation_id,
-                "violation_class": v.violation_class,
-                "status": v.current_status,
-                "inspection_date": v.inspection_date.isoformat() if v.inspection_date else None,
-                "description": v.nov_description,
-                "apartment": v.apartment,
-                "story": v.story,
-            }
-            for v in violations
-        ]
+        if rows:
+            if not rows[0].building_exists:
+                return None
+            total = rows[0].total
+        else:
+            # No row to carry the window columns - check existence directly
+            if not await self.building_exists(bbl):
+                return None
+            if offset:
+                total = await self.get_violations_count(bbl, status, violation_class)
+            else:
+                total = 0
 
-    async def get_timeline(self, bbl: str, limit: int = 50) -> list[dict]:
-        """Get combined timeline of events for a building."""
+        return {
+            "items": [self._violation_to_dict(row[0]) for row in rows],
+            "total": total,
+        }
+
+    async def get_timeline(self, bbl: str, limit: int = 50) -> Optional[list[dict]]:
+        """Get combined timeline of events for a building.
+
+        Returns None if the building does not exist; existence is checked in
+        the same statement as the events.
+        """
         # Get violations
         violations_query = text("""
             SELECT
@@ -346,16 +512,28 @@ class BuildingService:
 
         # Combine and order
         combined_query = text(f"""
-            ({violations_query.text})
-            UNION ALL
-            ({complaints_query.text})
-            UNION ALL
-            ({evictions_query.text})
+            SELECT
+                events.*,
+                EXISTS (SELECT 1 FROM buildings WHERE bbl = :bbl) AS building_exists
+            FROM (
+                {violations_query.text}
+                UNION ALL
+                {complaints_query.text}
+                UNION ALL
+                {evictions_query.text}
+            ) events
             ORDER BY event_date DESC NULLS LAST
             LIMIT :limit
         """)
 
         result = await self.session.execute(combined_query, {"bbl": bbl, "limit": limit})
+        rows = result.all()
+
+        if rows:
+            if not rows[0].building_exists:
+                return None
+        elif not await self.building_exists(bbl):
+            return None
 
         return [
             {
@@ -365,7 +543,7 @@ class BuildingService:
                 "description": row.description,
                 "status": row.status,
             }
-            for row in result
+            for row in rows
         ]
 
     async def get_recent_violations(
@@ -488,9 +666,12 @@ class OwnerService:
 
 
 class LeaderboardService:
-    """Service for leaderboard/ranking queries."""
+    """Service for leaderboard/ranking queries.
 
-    def __init__(self, session: AsyncSession):
+    Only runs Core/text queries, so it also accepts a ReadOnlyConnection.
+    """
+
+    def __init__(self, session: Union[AsyncSession, ReadOnlyConnection]):
         self.session = session
 
     async def get_worst_buildings_count(
@@ -527,6 +708,45 @@ class LeaderboardService:
         result = await self.session.execute(query)
         return result.scalar() or 0
 
+    async def _fetch_worst_buildings(
+        self,
+        borough: Optional[str],
+        limit: int,
+        offset: int,
+    ):
+        """Fetch a page of ranked buildings with the total count on every row.
+
+        Reads worst_buildings_mv (refreshed after each scoring run); falls
+        back to ranking the join directly when the view has not been
+        created, e.g. on databases built with create_all().
+        """
+        params = {"limit": limit, "offset": offset}
+        if borough:
+            params["borough"] = borough
+
+        if await relation_exists(self.session, "worst_buildings_mv"):
+            query = _WORST_BUILDINGS_MV_BY_BOROUGH_SQL if borough else _WORST_BUILDINGS_MV_SQL
+        else:
+            query = _WORST_BUILDINGS_BY_BOROUGH_SQL if borough else _WORST_BUILDINGS_SQL
+        result = await self.session.execute(query, params)
+        return result.all()
+
+    @staticmethod
+    def _building_row_to_dict(row) -> dict:
+        return {
+            "bbl": row.bbl,
+            "address": row.full_address,
+            "borough": row.borough,
+            "zip_code": row.zip_code,
+            "units": row.total_units,
+            "score": row.overall_score,
+            "grade": row.grade,
+            "violations": row.total_violations,
+            "class_c": row.class_c_violations,
+            "complaints": row.total_complaints,
+            "evictions": row.total_evictions,
+        }
+
     async def get_worst_buildings(
         self,
         borough: Optional[str] = None,
@@ -534,70 +754,51 @@ class LeaderboardService:
         offset: int = 0,
     ) -> list[dict]:
         """Get worst buildings by score."""
-        if borough:
-            query = text("""
-                SELECT
-                    b.bbl,
-                    b.full_address,
-                    b.borough,
-                    b.zip_code,
-                    b.total_units,
-                    bs.overall_score,
-                    bs.grade,
-                    bs.total_violations,
-                    bs.class_c_violations,
-                    bs.total_complaints,
-                    bs.total_evictions
-                FROM buildings b
-                JOIN building_scores bs ON b.bbl = bs.bbl
-                WHERE b.borough = :borough
-                ORDER BY bs.overall_score DESC
-                LIMIT :limit
-                OFFSET :offset
-            """)
-            result = await self.session.execute(
-                query, {"borough": borough, "limit": limit, "offset": offset}
-            )
+        rows = await self._fetch_worst_buildings(borough, limit, offset)
+        return [self._building_row_to_dict(row) for row in rows]
+
+    async def get_worst_buildings_page(
+        self,
+        borough: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> dict:
+        """Get a page of worst buildings and the total ranked count in one query."""
+        rows = await self._fetch_worst_buildings(borough, limit, offset)
+
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Paged past the end - no row to carry the window count
+            total = await self.get_worst_buildings_count(borough)
         else:
-            query = text("""
-                SELECT
-                    b.bbl,
-                    b.full_address,
-                    b.borough,
-                    b.zip_code,
-                    b.total_units,
-                    bs.overall_score,
-                    bs.grade,
-                    bs.total_violations,
-                    bs.class_c_violations,
-                    bs.total_complaints,
-                    bs.total_evictions
-                FROM buildings b
-                JOIN building_scores bs ON b.bbl = bs.bbl
-                ORDER BY bs.overall_score DESC
-                LIMIT :limit
-                OFFSET :offset
-            """)
-            result = await self.session.execute(
-                query, {"limit": limit, "offset": offset}
-            )
+            total = 0
 
-        return [
-            {
-                "bbl": row.bbl,
-                "address": row.full_address,
-                "borough": row.borough,
-                "zip_code": row.zip_code,
-                "units": row.total_units,
-                "score": row.overall_score,
-                "grade": row.grade,
-                "violations": row.total_violations,
-                "class_c": row.class_c_violations,
-                "complaints": row.total_complaints,
-                "evictions": row.total_evictions,
-            }
-            for row in result
-        ]
+        return {
+            "items": [self._building_row_to_dict(row) for row in rows],
+            "total": total,
+        }
+
+    async def _fetch_worst_landlords(self, limit: int, offset: int):
+        """Fetch a page of ranked landlords with the total count on every row."""
+        result = await self.session.execute(
+            _WORST_LANDLORDS_SQL, {"limit": limit, "offset": offset}
+        )
+        return result.all()
+
+    @staticmethod
+    def _landlord_row_to_dict(row) -> dict:
+        return {
+            "id": row.id,
+            "name": row.primary_name,
+            "buildings": row.total_buildings,
+            "units": row.total_units,
+            "violations": row.total_violations,
+            "class_c": row.class_c_violations,
+            "score": row.portfolio_score,
+            "grade": row.portfolio_grade,
+            "is_llc": bool(row.is_llc),
+        }
 
     async def get_worst_landlords(
         self,
@@ -605,40 +806,26 @@ class LeaderboardService:
         offset: int = 0,
     ) -> list[dict]:
         """Get worst landlords by portfolio score."""
-        query = text("""
-            SELECT
-                id,
-                primary_name,
-                total_buildings,
-                total_units,
-                total_violations,
-                class_c_violations,
-                portfolio_score,
-                portfolio_grade,
-                is_llc
-            FROM owner_portfolios
-            WHERE portfolio_score IS NOT NULL
-            AND total_buildings > 1
-            ORDER BY portfolio_score DESC
-            LIMIT :limit
-            OFFSET :offset
-        """)
+        rows = await self._fetch_worst_landlords(limit, offset)
+        return [self._landlord_row_to_dict(row) for row in rows]
 
-        result = await self.session.execute(
-            query, {"limit": limit, "offset": offset}
-        )
+    async def get_worst_landlords_page(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> dict:
+        """Get a page of worst landlords and the total ranked count in one query."""
+        rows = await self._fetch_worst_landlords(limit, offset)
+
+        if rows:
+            total = rows[0].total
+        elif offset:
+            # Paged past the end - no row to carry the window count
+            total = await self.get_worst_landlords_count()
+        else:
+            total = 0
 
-        return [
-            {
-                "id": row.id,
-                "name": row.primary_name,
-                "buildings": row.total_buildings,
-                "units": row.total_units,
-                "violations": row.total_violations,
-                "class_c": row.class_c_violations,
-                "score": row.portfolio_score,
-                "grade": row.portfolio_grade,
-                "is_llc": bool(row.is_llc),
-            }
-            for row in result
-        ]
+        return {
+            "items": [self._landlord_row_to_dict(row) for row in rows],
+            "total": total,
+        }
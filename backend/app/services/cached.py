@@ -5,16 +5,76 @@ Cache keys are based on the query parameters, and results are stored
 for a configurable TTL.
 """
 
-from typing import Optional
+import asyncio
+import random
+import time
+from typing import Awaitable, Iterable, Optional, Union
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
-from app.cache import get_cache, make_cache_key, CacheTTL, CacheKeys
+from app.database import ReadOnlyConnection
+from app.cache import CacheBackend, InMemoryCache, coalesce, get_cache, make_cache_key, CacheTTL, CacheKeys
 from app.services.buildings import BuildingService, LeaderboardService, OwnerService
 from app.logging_config import get_logger
 
 logger = get_logger('services.cached')
 
+# Fraction by which cache lifetimes are randomly stretched or shortened, so
+# entries written together (at startup, after an invalidation sweep) don't
+# all expire in the same instant and send their queries to the DB at once
+TTL_JITTER = 0.1
+
+
+def _jitter(ttl: float) -> int:
+    """Randomize a TTL by up to TTL_JITTER either way."""
+    return int(ttl * random.uniform(1 - TTL_JITTER, 1 + TTL_JITTER))
+
+
+# Cache writes still in flight, referenced so they aren't garbage collected
+_pending_writes: set[asyncio.Task] = set()
+
+
+async def _write_behind(cache: CacheBackend, write: Awaitable[None]) -> None:
+    """Issue a cache write without waiting for Redis to acknowledge it.
+
+    Responses never depend on the write, so on Redis it completes in the
+    background (the backend logs its own errors). The in-memory cache has no
+    I/O to overlap and is written inline.
+    """
+    if isinstance(cache, InMemoryCache):
+        await write
+        return
+    task = asyncio.ensure_future(write)
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+
+
+async def flush_cache_writes() -> None:
+    """Wait for background cache writes, e.g. before closing the cache."""
+    if _pending_writes:
+        await asyncio.gather(*_pending_writes, return_exceptions=True)
+
+
+# Next-page prefetches allowed in flight at once; past this they are skipped
+# rather than queued, so speculative loads never hold connections requests need
+PREFETCH_CONCURRENCY = 8
+
+# Violations pages being prefetched by this process, and the prefetch tasks
+_prefetching: set[str] = set()
+_prefetch_tasks: set[asyncio.Task] = set()
+_prefetch_slots = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+
+# Outlives every jittered building entry, so the index never expires first
+BUILDING_INDEX_TTL = int(CacheTTL.VERY_LONG * (1 + TTL_JITTER)) + 1
+
+
+def _normalize_filter(value: Optional[str]) -> Optional[str]:
+    """Canonicalize a status/class filter; the stored codes are upper case."""
+    if value is None:
+        return None
+    return value.strip().upper() or None
+
 
 class CachedBuildingService:
     """Building service with caching support."""
@@ -22,6 +82,8 @@ class CachedBuildingService:
     def __init__(self, session: AsyncSession):
         self._service = BuildingService(session)
         self._cache = get_cache()
+        # Prefetches outlive the request, so they open their own session
+        self._bind = session.bind
 
     async def search_buildings(self, query: str, limit: int = 10) -> list[dict]:
         """Search buildings with caching (short TTL since search results change)."""
@@ -35,16 +97,50 @@ class CachedBuildingService:
             logger.debug(f"Cache HIT: search '{normalized_query}'")
             return cached
 
-        logger.debug(f"Cache MISS: search '{normalized_query}'")
-        results = await self._service.search_buildings(query, limit=limit)
+        async def load() -> list[dict]:
+            logger.debug(f"Cache MISS: search '{normalized_query}'")
+            results = await self._service.search_buildings(query, limit=limit)
+
+            # Cache for short duration (search results may include new data)
+            await _write_behind(self._cache, self._cache.set(cache_key, results, ttl=_jitter(CacheTTL.SHORT)))
+            return results
+
+        return await coalesce(cache_key, load)
+
+    async def _set_building_entries(self, bbl: str, items: list[tuple[str, object, int]]) -> None:
+        """Cache (key, value, ttl) entries for a building and index them under its BBL.
 
-        # Cache for short duration (search results may include new data)
-        await self._cache.set(cache_key, results, ttl=CacheTTL.SHORT)
-        return results
+        The index lets invalidate_building_cache delete exactly these keys.
+        """
+        items = [(key, value, _jitter(ttl)) for key, value, ttl in items]
+        await _write_behind(self._cache, self._cache.set_indexed(
+            make_cache_key(CacheKeys.BUILDING_KEYS, bbl), items, ttl=BUILDING_INDEX_TTL
+        ))
+
+    async def _is_known_missing(self, bbl: str) -> bool:
+        """Check the negative cache for a BBL that recently 404'd."""
+        return await self._cache.get(make_cache_key(CacheKeys.BUILDING_MISSING, bbl)) is not None
+
+    async def _mark_missing(self, bbl: str) -> None:
+        """Remember a missing BBL briefly so repeat lookups skip the DB."""
+        await self._set_building_entries(
+            bbl, [(make_cache_key(CacheKeys.BUILDING_MISSING, bbl), True, CacheTTL.SHORT)]
+        )
 
     async def get_building_by_bbl(self, bbl: str):
-        """Get building by BBL (not cached - quick query)."""
-        return await self._service.get_building_by_bbl(bbl)
+        """Get building by BBL.
+
+        Found buildings are ORM objects and are not cached, but misses are
+        remembered for a short TTL so bad BBLs don't cost a query each time.
+        """
+        if await self._is_known_missing(bbl):
+            logger.debug(f"Cache HIT: missing building {bbl}")
+            return None
+
+        building = await self._service.get_building_by_bbl(bbl)
+        if building is None:
+            await self._mark_missing(bbl)
+        return building
 
     async def get_building_report(self, bbl: str) -> Optional[dict]:
         """Get comprehensive building report with caching."""
@@ -56,46 +152,87 @@ class CachedBuildingService:
             logger.debug(f"Cache HIT: building report {bbl}")
             return cached
 
-        logger.debug(f"Cache MISS: building report {bbl}")
-        report = await self._service.get_building_report(bbl)
+        if await self._is_known_missing(bbl):
+            logger.debug(f"Cache HIT: missing building {bbl}")
+            return None
+
+        async def load() -> Optional[dict]:
+            logger.debug(f"Cache MISS: building report {bbl}")
+            report = await self._service.get_building_report(bbl)
 
-        if report is not None:
-            # Cache for medium duration
-            await self._cache.set(cache_key, report, ttl=CacheTTL.MEDIUM)
+            if report is not None:
+                # Invalidated on ingest, so it can live for an hour
+                await self._set_building_entries(bbl, [(cache_key, report, CacheTTL.VERY_LONG)])
+            else:
+                await self._mark_missing(bbl)
 
-        return report
+            return report
 
-    async def get_violations_count(
+        return await coalesce(cache_key, load)
+
+    async def get_violations_page(
         self,
         bbl: str,
+        limit: int = 50,
+        offset: int = 0,
         status: Optional[str] = None,
         violation_class: Optional[str] = None,
-    ) -> int:
-        """Get violations count with caching."""
+    ) -> Optional[dict]:
+        """Get a page of violations plus the total count with caching.
+
+        Returns None if the building does not exist.
+        """
+        # "open", "Open" and "OPEN" share a cache entry (and all match)
+        status = _normalize_filter(status)
+        violation_class = _normalize_filter(violation_class)
         cache_key = make_cache_key(
-            f"{CacheKeys.BUILDING_VIOLATIONS}:count",
+            CacheKeys.BUILDING_VIOLATIONS,
             bbl,
+            limit=limit,
+            offset=offset,
             status=status,
             violation_class=violation_class
         )
 
-        cached = await self._cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        count = await self._service.get_violations_count(bbl, status, violation_class)
-        await self._cache.set(cache_key, count, ttl=CacheTTL.MEDIUM)
-        return count
-
-    async def get_violations(
+        page = await self._cache.get(cache_key)
+        if page is not None:
+            logger.debug(f"Cache HIT: violations {bbl}")
+        else:
+            if await self._is_known_missing(bbl):
+                return None
+
+            async def load() -> Optional[dict]:
+                logger.debug(f"Cache MISS: violations {bbl}")
+                page = await self._service.get_violations_page(
+                    bbl, limit=limit, offset=offset, status=status, violation_class=violation_class
+                )
+
+                if page is None:
+                    await self._mark_missing(bbl)
+                    return None
+
+                await self._set_building_entries(bbl, [(cache_key, page, CacheTTL.VERY_LONG)])
+                return page
+
+            page = await coalesce(cache_key, load)
+            if page is None:
+                return None
+
+        # Readers paging through violations almost always ask for the next
+        # page, so warm it unless this one was the last
+        if offset + limit < page["total"]:
+            self._prefetch_violations_page(bbl, limit, offset + limit, status, violation_class)
+        return page
+
+    def _prefetch_violations_page(
         self,
         bbl: str,
-        limit: int = 50,
-        offset: int = 0,
-        status: Optional[str] = None,
-        violation_class: Optional[str] = None,
-    ) -> list[dict]:
-        """Get paginated violations with caching."""
+        limit: int,
+        offset: int,
+        status: Optional[str],
+        violation_class: Optional[str],
+    ) -> None:
+        """Load a violations page into the cache in the background, if missing."""
         cache_key = make_cache_key(
             CacheKeys.BUILDING_VIOLATIONS,
             bbl,
@@ -104,31 +241,100 @@ class CachedBuildingService:
             status=status,
             violation_class=violation_class
         )
+        if cache_key in _prefetching or _prefetch_slots.locked():
+            return
+
+        async def prefetch() -> None:
+            async with _prefetch_slots:
+                try:
+                    if await self._cache.get(cache_key) is not None:
+                        return
+                    async with AsyncSession(self._bind) as session:
+                        page = await BuildingService(session).get_violations_page(
+                            bbl, limit=limit, offset=offset, status=status, violation_class=violation_class
+                        )
+                    if page is not None:
+                        await self._set_building_entries(bbl, [(cache_key, page, CacheTTL.VERY_LONG)])
+                        logger.debug(f"Cache PREFETCH: violations {bbl} offset={offset}")
+                except Exception as e:
+                    logger.warning(f"Violations prefetch failed for {bbl}: {e}")
+                finally:
+                    _prefetching.discard(cache_key)
+
+        _prefetching.add(cache_key)
+        task = asyncio.create_task(prefetch())
+        _prefetch_tasks.add(task)
+        task.add_done_callback(_prefetch_tasks.discard)
+
+    async def get_timeline(self, bbl: str, limit: int = 50) -> Optional[list[dict]]:
+        """Get building timeline with caching.
+
+        Returns None if the building does not exist.
+        """
+        cache_key = make_cache_key(CacheKeys.BUILDING_TIMELINE, bbl, limit=limit)
 
         cached = await self._cache.get(cache_key)
         if cached is not None:
-            logger.debug(f"Cache HIT: violations {bbl}")
             return cached
 
-        logger.debug(f"Cache MISS: violations {bbl}")
-        violations = await self._service.get_violations(
-            bbl, limit=limit, offset=offset, status=status, violation_class=violation_class
-        )
+        if await self._is_known_missing(bbl):
+            return None
 
-        await self._cache.set(cache_key, violations, ttl=CacheTTL.MEDIUM)
-        return violations
+        async def load() -> Optional[list[dict]]:
+            timeline = await self._service.get_timeline(bbl, limit=limit)
 
-    async def get_timeline(self, bbl: str, limit: int = 50) -> list[dict]:
-        """Get building timeline with caching."""
-        cache_key = make_cache_key(f"{CacheKeys.BUILDING}:timeline", bbl, limit=limit)
+            if timeline is None:
+                await self._mark_missing(bbl)
+                return None
 
-        cached = await self._cache.get(cache_key)
-        if cached is not None:
-            return cached
+            await self._set_building_entries(bbl, [(cache_key, timeline, CacheTTL.VERY_LONG)])
+            return timeline
 
-        timeline = await self._service.get_timeline(bbl, limit=limit)
-        await self._cache.set(cache_key, timeline, ttl=CacheTTL.MEDIUM)
-        return timeline
+        return await coalesce(cache_key, load)
+
+    async def get_building_bundle(
+        self,
+        bbl: str,
+        violations_limit: int = 50,
+        timeline_limit: int = 50,
+    ) -> Optional[dict]:
+        """Get the report, first violations page and timeline for a building.
+
+        Shares cache entries with the individual getters, but reads all of
+        them (and the negative cache) in one round trip and writes back any
+        misses together. Returns None if the building does not exist.
+        """
+        keys = [
+            make_cache_key(CacheKeys.BUILDING_MISSING, bbl),
+            make_cache_key(CacheKeys.BUILDING_REPORT, bbl),
+            make_cache_key(CacheKeys.BUILDING_VIOLATIONS, bbl, limit=violations_limit, offset=0),
+            make_cache_key(CacheKeys.BUILDING_TIMELINE, bbl, limit=timeline_limit),
+        ]
+        missing, report, violations, timeline = await self._cache.get_many(keys)
+        if missing is not None:
+            logger.debug(f"Cache HIT: missing building {bbl}")
+            return None
+
+        # Misses run one after another: they share the request's session
+        to_cache = []
+        if report is None:
+            report = await self._service.get_building_report(bbl)
+            if report is None:
+                await self._mark_missing(bbl)
+                return None
+            to_cache.append((keys[1], report, CacheTTL.VERY_LONG))
+        if violations is None:
+            violations = await self._service.get_violations_page(bbl, limit=violations_limit)
+            to_cache.append((keys[2], violations, CacheTTL.VERY_LONG))
+        if timeline is None:
+            timeline = await self._service.get_timeline(bbl, limit=timeline_limit)
+            to_cache.append((keys[3], timeline, CacheTTL.VERY_LONG))
+
+        if to_cache:
+            logger.debug(f"Cache MISS: {len(to_cache)} of 3 bundle entries for {bbl}")
+            await self._set_building_entries(bbl, to_cache)
+
+        return {"report": report, "violations": violations, "timeline": timeline}
 
     async def get_recent_violations(
         self,
@@ -136,6 +342,7 @@ class CachedBuildingService:
         violation_class: Optional[str] = None,
     ) -> list[dict]:
         """Get recent violations across all buildings with caching."""
+        violation_class = _normalize_filter(violation_class)
         cache_key = make_cache_key(
             f"{CacheKeys.BUILDING}:recent_violations",
             limit=limit,
@@ -146,95 +353,157 @@ class CachedBuildingService:
         if cached is not None:
             return cached
 
-        violations = await self._service.get_recent_violations(
-            limit=limit, violation_class=violation_class
-        )
-        await self._cache.set(cache_key, violations, ttl=CacheTTL.SHORT)
-        return violations
+        async def load() -> list[dict]:
+            violations = await self._service.get_recent_violations(
+                limit=limit, violation_class=violation_class
+            )
+            await _write_behind(self._cache, self._cache.set(cache_key, violations, ttl=_jitter(CacheTTL.SHORT)))
+            return violations
+
+        return await coalesce(cache_key, load)
+
+
+# Leaderboard rows kept per list (and borough) so pages can be sliced in memory
+LEADERBOARD_TOP_ROWS = 500
+
+# Leaderboard entries are fresh for this long, then served stale for as long
+# again while a single background refresh replaces them
+LEADERBOARD_FRESH_SECONDS = CacheTTL.QUARTER_DAY
+
+# Leaderboard keys being refreshed by this process, and the refresh tasks
+_refreshing: set[str] = set()
+_refresh_tasks: set[asyncio.Task] = set()
 
 
 class CachedLeaderboardService:
-    """Leaderboard service with caching support."""
+    """Leaderboard service with caching support.
 
-    def __init__(self, session: AsyncSession):
+    Entries are stale-while-revalidate: past LEADERBOARD_FRESH_SECONDS the
+    cached value is still returned while one background task reloads it, so
+    a TTL boundary never puts the full query on a request's path.
+    """
+
+    def __init__(self, session: Union[AsyncSession, ReadOnlyConnection]):
         self._service = LeaderboardService(session)
         self._cache = get_cache()
-
-    async def get_worst_buildings_count(self, borough: Optional[str] = None) -> int:
-        """Get total count of ranked buildings with caching."""
-        cache_key = make_cache_key(
-            f"{CacheKeys.LEADERBOARD_BUILDINGS}:count",
-            borough=borough
+        # Background refreshes outlive the request, so they open their own connection
+        self._bind = session.bind
+
+    async def _store(self, cache_key: str, value: dict) -> None:
+        fresh_for = _jitter(LEADERBOARD_FRESH_SECONDS)
+        entry = {"value": value, "fresh_until": time.time() + fresh_for}
+        await _write_behind(self._cache, self._cache.set(cache_key, entry, ttl=2 * fresh_for))
+
+    async def _refresh(self, cache_key: str, fetch) -> None:
+        conn = ReadOnlyConnection(self._bind)
+        try:
+            await self._store(cache_key, await fetch(LeaderboardService(conn)))
+            logger.debug(f"Cache REFRESH: {cache_key}")
+        except Exception as e:
+            logger.warning(f"Leaderboard refresh failed for {cache_key}: {e}")
+        finally:
+            await conn.close()
+            _refreshing.discard(cache_key)
+
+    async def _get_or_revalidate(self, cache_key: str, fetch) -> dict:
+        """Get a cached leaderboard entry, refreshing it in the background once stale.
+
+        ``fetch`` takes a LeaderboardService and loads the value.
+        """
+        entry = await self._cache.get(cache_key)
+        if entry is not None:
+            if time.time() >= entry["fresh_until"] and cache_key not in _refreshing:
+                _refreshing.add(cache_key)
+                task = asyncio.create_task(self._refresh(cache_key, fetch))
+                _refresh_tasks.add(task)
+                task.add_done_callback(_refresh_tasks.discard)
+            return entry["value"]
+
+        async def load() -> dict:
+            logger.debug(f"Cache MISS: {cache_key}")
+            value = await fetch(self._service)
+            await self._store(cache_key, value)
+            return value
+
+        return await coalesce(cache_key, load)
+
+    async def _get_top_page(
+        self,
+        cache_key: str,
+        fetch_page,
+        limit: int,
+        offset: int,
+    ) -> dict:
+        """Slice a page out of the cached top of a leaderboard.
+
+        Leaderboards only change on ingest, so the first LEADERBOARD_TOP_ROWS
+        rows are fetched once and every page within them is served from that
+        one entry. Deeper pages are cached individually.
+        """
+        if offset + limit > LEADERBOARD_TOP_ROWS:
+            return await self._get_or_revalidate(
+                make_cache_key(cache_key, limit=limit, offset=offset),
+                lambda service: fetch_page(service, limit, offset),
+            )
+
+        top = await self._get_or_revalidate(
+            cache_key,
+            lambda service: fetch_page(service, LEADERBOARD_TOP_ROWS, 0),
         )
+        return {"items": top["items"][offset:offset + limit], "total": top["total"]}
 
-        cached = await self._cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        count = await self._service.get_worst_buildings_count(borough)
-        await self._cache.set(cache_key, count, ttl=CacheTTL.LONG)
-        return count
-
-    async def get_worst_buildings(
+    async def get_worst_buildings_page(
         self,
         borough: Optional[str] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[dict]:
-        """Get worst buildings leaderboard with caching."""
-        cache_key = make_cache_key(
-            CacheKeys.LEADERBOARD_BUILDINGS,
-            borough=borough,
-            limit=limit,
-            offset=offset
+    ) -> dict:
+        """Get a page of the worst buildings leaderboard plus total with caching."""
+        return await self._get_top_page(
+            make_cache_key(CacheKeys.LEADERBOARD_BUILDINGS, "top", borough=borough),
+            lambda service, n, start: service.get_worst_buildings_page(borough, n, start),
+            limit,
+            offset,
         )
 
-        cached = await self._cache.get(cache_key)
-        if cached is not None:
-            logger.debug("Cache HIT: worst buildings leaderboard")
-            return cached
-
-        logger.debug("Cache MISS: worst buildings leaderboard")
-        buildings = await self._service.get_worst_buildings(borough, limit, offset)
-
-        # Leaderboards change less frequently - use longer TTL
-        await self._cache.set(cache_key, buildings, ttl=CacheTTL.LONG)
-        return buildings
-
-    async def get_worst_landlords_count(self) -> int:
-        """Get total count of ranked landlords with caching."""
-        cache_key = make_cache_key(f"{CacheKeys.LEADERBOARD_LANDLORDS}:count")
-
-        cached = await self._cache.get(cache_key)
-        if cached is not None:
-            return cached
-
-        count = await self._service.get_worst_landlords_count()
-        await self._cache.set(cache_key, count, ttl=CacheTTL.LONG)
-        return count
-
-    async def get_worst_landlords(
+    async def get_worst_landlords_page(
         self,
         limit: int = 100,
         offset: int = 0,
-    ) -> list[dict]:
-        """Get worst landlords leaderboard with caching."""
-        cache_key = make_cache_key(
-            CacheKeys.LEADERBOARD_LANDLORDS,
-            limit=limit,
-            offset=offset
+    ) -> dict:
+        """Get a page of the worst landlords leaderboard plus total with caching."""
+        return await self._get_top_page(
+            make_cache_key(CacheKeys.LEADERBOARD_LANDLORDS, "top"),
+            lambda service, n, start: service.get_worst_landlords_page(n, start),
+            limit,
+            offset,
         )
 
-        cached = await self._cache.get(cache_key)
-        if cached is not None:
-            logger.debug("Cache HIT: worst landlords leaderboard")
-            return cached
 
-        logger.debug("Cache MISS: worst landlords leaderboard")
-        landlords = await self._service.get_worst_landlords(limit, offset)
+# Upper bound on the random delay before warming each leaderboard, so their
+# entries are written (and later expire) at slightly different moments
+PREWARM_JITTER_SECONDS = 2.0
+
+
+async def prewarm_leaderboard_cache(bind: AsyncEngine) -> None:
+    """Fill the default (unfiltered) leaderboard entries before traffic arrives."""
 
-        await self._cache.set(cache_key, landlords, ttl=CacheTTL.LONG)
-        return landlords
+    async def warm(fetch) -> None:
+        await asyncio.sleep(random.uniform(0, PREWARM_JITTER_SECONDS))
+        conn = ReadOnlyConnection(bind)
+        try:
+            await fetch(CachedLeaderboardService(conn))
+        finally:
+            await conn.close()
+
+    results = await asyncio.gather(
+        warm(lambda service: service.get_worst_buildings_page()),
+        warm(lambda service: service.get_worst_landlords_page()),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning(f"Leaderboard cache warm-up failed: {result}")
 
 
 class CachedOwnerService:
@@ -253,27 +522,52 @@ class CachedOwnerService:
             logger.debug(f"Cache HIT: owner portfolio {portfolio_id}")
             return cached
 
-        logger.debug(f"Cache MISS: owner portfolio {portfolio_id}")
-        portfolio = await self._service.get_portfolio(portfolio_id)
+        # Unknown IDs are remembered briefly so enumerating them can't keep
+        # sending queries to the DB
+        missing_key = make_cache_key(CacheKeys.OWNER_MISSING, portfolio_id)
+        if await self._cache.get(missing_key) is not None:
+            logger.debug(f"Cache HIT: missing owner portfolio {portfolio_id}")
+            return None
+
+        async def load() -> Optional[dict]:
+            logger.debug(f"Cache MISS: owner portfolio {portfolio_id}")
+            portfolio = await self._service.get_portfolio(portfolio_id)
+
+            if portfolio is not None:
+                await _write_behind(self._cache, self._cache.set(cache_key, portfolio, ttl=_jitter(CacheTTL.MEDIUM)))
+            else:
+                await _write_behind(self._cache, self._cache.set(missing_key, True, ttl=_jitter(CacheTTL.SHORT)))
 
-        if portfolio is not None:
-            await self._cache.set(cache_key, portfolio, ttl=CacheTTL.MEDIUM)
+            return portfolio
 
-        return portfolio
+        return await coalesce(cache_key, load)
 
 
 async def invalidate_building_cache(bbl: str) -> None:
     """Invalidate all cache entries for a building."""
     cache = get_cache()
-    patterns = [
-        f"{CacheKeys.BUILDING}:{bbl}*",
-        f"{CacheKeys.BUILDING_REPORT}:{bbl}*",
-        f"{CacheKeys.BUILDING_VIOLATIONS}:{bbl}*",
-    ]
-    for pattern in patterns:
-        deleted = await cache.clear_pattern(pattern)
-        if deleted:
-            logger.info(f"Invalidated {deleted} cache entries for pattern {pattern}")
+    deleted = await cache.delete_index(make_cache_key(CacheKeys.BUILDING_KEYS, bbl))
+    if deleted:
+        logger.info(f"Invalidated {deleted} cache entries for building {bbl}")
+
+
+# Per-BBL invalidation costs two round trips, so past this many BBLs a single
+# sweep of every building entry (indexes included) is cheaper
+BULK_INVALIDATION_THRESHOLD = 100
+
+
+async def invalidate_buildings_cache(bbls: Optional[Iterable[str]] = None) -> None:
+    """Invalidate cache entries for a set of buildings, or all of them if None."""
+    if bbls is not None:
+        bbls = set(bbls)
+        if len(bbls) <= BULK_INVALIDATION_THRESHOLD:
+            for bbl in bbls:
+                await invalidate_building_cache(bbl)
+            return
+
+    cache = get_cache()
+    deleted = await cache.clear_pattern(f"{CacheKeys.BUILDING}:*")
+    logger.info(f"Invalidated {deleted} building cache entries")
 
 
 async def invalidate_leaderboard_cache() -> None:
@@ -282,3 +576,10 @@ async def invalidate_leaderboard_cache() -> None:
     deleted = await cache.clear_pattern(f"{CacheKeys.LEADERBOARD_BUILDINGS}*")
     deleted += await cache.clear_pattern(f"{CacheKeys.LEADERBOARD_LANDLORDS}*")
     logger.info(f"Invalidated {deleted} leaderboard cache entries")
+
+
+async def invalidate_owner_cache() -> None:
+    """Invalidate all owner portfolio cache entries."""
+    cache = get_cache()
+    deleted = await cache.clear_pattern(f"{CacheKeys.OWNER}:*")
+    logger.info(f"Invalidated {deleted} owner cache entries")
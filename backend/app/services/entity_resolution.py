@@ -6,7 +6,7 @@ from sqlalchemy import select, update, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from rapidfuzz import fuzz
 
-from app.database import AsyncSessionLocal
+from app.database import PipelineSessionLocal
 from app.models.hpd import RegistrationContact
 from app.models.owner import OwnerPortfolio
 
@@ -30,7 +30,7 @@ class EntityResolutionService:
         """
         logger.info("Starting entity resolution")
 
-        async with AsyncSessionLocal() as session:
+        async with PipelineSessionLocal() as session:
             # Step 1: Get distinct owner hashes with their contacts
             hash_groups = await self._get_hash_groups(session)
             logger.info(f"Found {len(hash_groups)} distinct owner hash groups")
@@ -233,7 +233,7 @@ class EntityResolutionService:
 
     async def update_portfolio_stats(self):
         """Update portfolio statistics after scoring is complete."""
-        async with AsyncSessionLocal() as session:
+        async with PipelineSessionLocal() as session:
             await session.execute(
                 text("""
                     UPDATE owner_portfolios op
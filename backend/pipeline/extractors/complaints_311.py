@@ -46,6 +46,16 @@ class Complaints311Extractor(BaseExtractor):
         """No filter - include all complaint types for comprehensive data."""
         return None
 
+    @property
+    def select_clause(self) -> str | None:
+        """Only fetch the fields transform_record reads (about half of the dataset's)."""
+        return (
+            "unique_key,bbl,created_date,closed_date,agency,agency_name,"
+            "complaint_type,descriptor,location_type,incident_zip,incident_address,"
+            "street_name,city,status,resolution_description,"
+            "resolution_action_updated_date,borough,latitude,longitude"
+        )
+
     @property
     def order_clause(self) -> str | None:
         """Order by created date descending to get newest complaints first."""
@@ -57,20 +67,13 @@ class Complaints311Extractor(BaseExtractor):
         if not unique_key:
             return None
 
-        # Extract BBL if available
-        bbl = record.get("bbl")
-        if not bbl:
-            # Try to construct from components
-            borough = self._borough_name_to_id(record.get("borough"))
-            # Unfortunately 311 doesn't always have block/lot
-            bbl = None
+        # 311 records carry no block/lot, so there's no BBL to build when
+        # the dataset leaves it blank
+        bbl = record.get("bbl") or None
 
-        # Calculate resolution time
+        # days_to_resolve is a generated column computed from these
         created = self.parse_date(record.get("created_date"))
         closed = self.parse_date(record.get("closed_date"))
-        days_to_resolve = None
-        if created and closed:
-            days_to_resolve = (closed - created).days
 
         return {
             "unique_key": unique_key,
@@ -94,19 +97,4 @@ class Complaints311Extractor(BaseExtractor):
             "borough": record.get("borough"),
             "latitude": record.get("latitude"),
             "longitude": record.get("longitude"),
-            "days_to_resolve": days_to_resolve,
-        }
-
-    @staticmethod
-    def _borough_name_to_id(name: str | None) -> str | None:
-        """Convert borough name to ID."""
-        if not name:
-            return None
-        mapping = {
-            "MANHATTAN": "1",
-            "BRONX": "2",
-            "BROOKLYN": "3",
-            "QUEENS": "4",
-            "STATEN ISLAND": "5",
         }
-        return mapping.get(name.upper())
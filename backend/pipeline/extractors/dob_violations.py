@@ -16,6 +16,11 @@ class DOBViolationsExtractor(BaseExtractor):
     def model_class(self):
         return DOBViolation
 
+    @property
+    def scored_bbls_query(self) -> str | None:
+        """DOB violations aren't a score input."""
+        return None
+
     @property
     def order_clause(self) -> str | None:
         """Order by issue date descending to get newest violations first."""
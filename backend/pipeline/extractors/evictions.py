@@ -31,12 +31,9 @@ class EvictionsExtractor(BaseExtractor):
         if not court_index:
             return None
 
-        # Build BBL if available (evictions dataset may have this)
-        bbl = record.get("bbl")
-        if not bbl:
-            borough = self._borough_name_to_id(record.get("borough"))
-            # Note: evictions data typically doesn't have block/lot
-            bbl = None
+        # Evictions records carry no block/lot, so there's no BBL to build
+        # when the dataset leaves it blank
+        bbl = record.get("bbl") or None
 
         return {
             "court_index_number": court_index,
@@ -55,17 +52,3 @@ class EvictionsExtractor(BaseExtractor):
             "latitude": record.get("latitude"),
             "longitude": record.get("longitude"),
         }
-
-    @staticmethod
-    def _borough_name_to_id(name: str | None) -> str | None:
-        """Convert borough name to ID."""
-        if not name:
-            return None
-        mapping = {
-            "MANHATTAN": "1",
-            "BRONX": "2",
-            "BROOKLYN": "3",
-            "QUEENS": "4",
-            "STATEN ISLAND": "5",
-        }
-        return mapping.get(name.upper())
@@ -7,6 +7,15 @@ from app.models.hpd import HPDRegistration, RegistrationContact
 from app.models.building import Building
 from pipeline.extractors.base import BaseExtractor
 
+# HPD borough IDs to the borough names stored on buildings
+BOROUGH_NAMES = {
+    "1": "Manhattan",
+    "2": "Bronx",
+    "3": "Brooklyn",
+    "4": "Queens",
+    "5": "Staten Island",
+}
+
 
 class HPDRegistrationsExtractor(BaseExtractor):
     """Extractor for HPD Registrations dataset."""
@@ -57,14 +66,7 @@ class HPDRegistrationsExtractor(BaseExtractor):
     @staticmethod
     def _get_borough_name(boro_id: str | int | None) -> str | None:
         """Convert borough ID to name."""
-        mapping = {
-            "1": "Manhattan",
-            "2": "Bronx",
-            "3": "Brooklyn",
-            "4": "Queens",
-            "5": "Staten Island",
-        }
-        return mapping.get(str(boro_id))
+        return BOROUGH_NAMES.get(str(boro_id))
 
 
 class RegistrationContactsExtractor(BaseExtractor):
@@ -78,6 +80,24 @@ class RegistrationContactsExtractor(BaseExtractor):
     )
     PUNCT_PATTERN = re.compile(r'[^\w\s]')
 
+    # Street-type words and their abbreviations, all replaced in one pass
+    ADDRESS_ABBREVIATIONS = {
+        'STREET': 'ST',
+        'AVENUE': 'AVE',
+        'BOULEVARD': 'BLVD',
+        'ROAD': 'RD',
+        'DRIVE': 'DR',
+        'LANE': 'LN',
+        'PLACE': 'PL',
+        'COURT': 'CT',
+        'APARTMENT': 'APT',
+        'SUITE': 'STE',
+        'FLOOR': 'FL',
+    }
+    ADDRESS_WORD_PATTERN = re.compile(r'\b(' + '|'.join(ADDRESS_ABBREVIATIONS) + r')\b')
+    ORDINAL_PATTERN = re.compile(r'\b(\d+)(ST|ND|RD|TH)\b')
+    UNIT_PATTERN = re.compile(r'\b(APT|STE|UNIT|FL|#)\s*[\w-]+\b')
+
     @property
     def dataset_id(self) -> str:
         return get_settings().registration_contacts_dataset
@@ -86,6 +106,16 @@ class RegistrationContactsExtractor(BaseExtractor):
     def model_class(self):
         return RegistrationContact
 
+    @property
+    def scored_bbls_query(self) -> str | None:
+        """Contacts reach their buildings through the registration."""
+        return """
+            SELECT DISTINCT hr.bbl
+            FROM registration_contacts rc
+            JOIN hpd_registrations hr ON hr.registration_id = rc.registration_id
+            WHERE hr.bbl IS NOT NULL
+        """
+
     def get_primary_key_columns(self) -> list[str]:
         """Override to handle auto-increment ID."""
         return ["registration_id", "contact_type", "full_name"]
@@ -163,32 +193,22 @@ class RegistrationContactsExtractor(BaseExtractor):
         result = " ".join(result.split())
         return result.strip()
 
+    @classmethod
+    def _abbreviate(cls, match: re.Match) -> str:
+        return cls.ADDRESS_ABBREVIATIONS[match[1]]
+
     def _normalize_address(self, address: str) -> str:
         """Normalize address for matching."""
         if not address:
             return ""
         result = address.upper()
 
-        # Standardize street types
-        replacements = [
-            (r'\bSTREET\b', 'ST'),
-            (r'\bAVENUE\b', 'AVE'),
-            (r'\bBOULEVARD\b', 'BLVD'),
-            (r'\bROAD\b', 'RD'),
-            (r'\bDRIVE\b', 'DR'),
-            (r'\bLANE\b', 'LN'),
-            (r'\bPLACE\b', 'PL'),
-            (r'\bCOURT\b', 'CT'),
-            (r'\bAPARTMENT\b', 'APT'),
-            (r'\bSUITE\b', 'STE'),
-            (r'\bFLOOR\b', 'FL'),
-            (r'\b(\d+)(ST|ND|RD|TH)\b', r'\1'),
-        ]
-        for pattern, repl in replacements:
-            result = re.sub(pattern, repl, result)
+        # Standardize street types and drop ordinal suffixes
+        result = self.ADDRESS_WORD_PATTERN.sub(self._abbreviate, result)
+        result = self.ORDINAL_PATTERN.sub(r'\1', result)
 
         # Remove apartment/suite numbers
-        result = re.sub(r'\b(APT|STE|UNIT|FL|#)\s*[\w-]+\b', '', result)
+        result = self.UNIT_PATTERN.sub('', result)
 
         # Remove punctuation and normalize whitespace
         result = self.PUNCT_PATTERN.sub("", result)
@@ -197,7 +217,13 @@ class RegistrationContactsExtractor(BaseExtractor):
         return result.strip()
 
     def _create_hash(self, normalized_name: str, normalized_address: str) -> str:
-        """Create hash for entity resolution grouping."""
+        """
+        Create hash for entity resolution grouping.
+
+        Only a grouping key (not a security boundary), but it's persisted as
+        owner_portfolios.name_hash, so changing the function re-keys every
+        existing portfolio.
+        """
         combined = f"{normalized_name}|{normalized_address}"
         return hashlib.sha256(combined.encode()).hexdigest()[:32]
 
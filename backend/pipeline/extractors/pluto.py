@@ -16,6 +16,10 @@ class PLUTOExtractor(BaseExtractor):
     and coordinates from the PLUTO dataset. It does NOT create new buildings.
     """
 
+    # Buildings added since the last run still need enriching, even when
+    # PLUTO itself hasn't changed
+    skip_unchanged_source = False
+
     @property
     def dataset_id(self) -> str:
         return get_settings().pluto_dataset
@@ -36,7 +40,7 @@ class PLUTOExtractor(BaseExtractor):
             return None
 
         # PLUTO BBLs come as decimals like "4110150001.00000000" - strip the decimal
-        bbl = bbl_raw.split(".")[0] if "." in str(bbl_raw) else str(bbl_raw)
+        bbl = str(bbl_raw).partition(".")[0]
 
         if len(bbl) != 10:
             return None
@@ -71,26 +75,41 @@ class PLUTOExtractor(BaseExtractor):
         if not records:
             return
 
-        # Deduplicate records by BBL (keep last occurrence)
-        seen = {}
-        for record in records:
-            bbl = record.get("bbl")
-            if bbl:
-                seen[bbl] = record
-        deduped_records = list(seen.values())
+        # Deduplicate records by BBL (keep last occurrence); transform_record
+        # only emits records with a BBL
+        deduped_records = list({record["bbl"]: record for record in records}.values())
 
-        # Use UPDATE to only modify existing buildings
+        # One UPDATE for the whole batch, joined to the records unpacked
+        # from per-column arrays, instead of a round trip per building.
+        # UPDATE (not INSERT) still only touches buildings that exist.
         sql = text("""
-            UPDATE buildings SET
-                residential_units = COALESCE(:residential_units, residential_units),
-                total_units = COALESCE(:total_units, total_units),
-                year_built = COALESCE(:year_built, year_built),
-                latitude = COALESCE(:latitude, latitude),
-                longitude = COALESCE(:longitude, longitude),
+            UPDATE buildings b SET
+                residential_units = COALESCE(v.residential_units, b.residential_units),
+                total_units = COALESCE(v.total_units, b.total_units),
+                year_built = COALESCE(v.year_built, b.year_built),
+                latitude = COALESCE(v.latitude, b.latitude),
+                longitude = COALESCE(v.longitude, b.longitude),
                 updated_at = NOW()
-            WHERE bbl = :bbl
+            FROM unnest(
+                CAST(:bbl AS VARCHAR[]),
+                CAST(:residential_units AS INTEGER[]),
+                CAST(:total_units AS INTEGER[]),
+                CAST(:year_built AS INTEGER[]),
+                CAST(:latitude AS DOUBLE PRECISION[]),
+                CAST(:longitude AS DOUBLE PRECISION[])
+            ) AS v(bbl, residential_units, total_units, year_built, latitude, longitude)
+            WHERE b.bbl = v.bbl
+            -- Leave rows PLUTO has nothing new for untouched, so they don't
+            -- fire the scoring queue trigger or get a new updated_at
+            AND (
+                COALESCE(v.residential_units, b.residential_units) IS DISTINCT FROM b.residential_units
+                OR COALESCE(v.total_units, b.total_units) IS DISTINCT FROM b.total_units
+                OR COALESCE(v.year_built, b.year_built) IS DISTINCT FROM b.year_built
+                OR COALESCE(v.latitude, b.latitude) IS DISTINCT FROM b.latitude
+                OR COALESCE(v.longitude, b.longitude) IS DISTINCT FROM b.longitude
+            )
         """)
-
-        # Execute updates for each record
-        for record in deduped_records:
-            await session.execute(sql, record)
+        columns = ("bbl", "residential_units", "total_units", "year_built", "latitude", "longitude")
+        await session.execute(sql, {
+            column: [record[column] for record in deduped_records] for column in columns
+        })
@@ -1,9 +1,13 @@
 import asyncio
 import logging
+import time
+from collections import deque
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import AsyncIterator, Any
-from datetime import datetime
 
 import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.config import get_settings
@@ -17,24 +21,34 @@ class RateLimiter:
     def __init__(self, rate: int):
         self.rate = rate
         self.tokens = rate
-        self.last_refill = datetime.now()
+        # Monotonic, so wall clock adjustments can't stall or burst requests
+        self.last_refill = time.monotonic()
         self._lock = asyncio.Lock()
 
     async def acquire(self):
         async with self._lock:
-            now = datetime.now()
-            elapsed = (now - self.last_refill).total_seconds()
+            now = time.monotonic()
+            elapsed = now - self.last_refill
             self.tokens = min(self.rate, self.tokens + elapsed * self.rate)
             self.last_refill = now
 
             if self.tokens < 1:
                 wait_time = (1 - self.tokens) / self.rate
                 await asyncio.sleep(wait_time)
+                # The wait earned exactly the token being spent; refill from
+                # here so the next caller isn't credited for it again
                 self.tokens = 0
+                self.last_refill = time.monotonic()
             else:
                 self.tokens -= 1
 
 
+@lru_cache()
+def get_rate_limiter() -> RateLimiter:
+    """Rate limiter shared by every client, so concurrent extractors split one quota."""
+    return RateLimiter(get_settings().socrata_rate_limit)
+
+
 class SocrataClient:
     """Async client for NYC Open Data Socrata API with pagination and rate limiting."""
 
@@ -43,7 +57,8 @@ class SocrataClient:
         self.base_url = self.settings.socrata_base_url
         self.app_token = self.settings.socrata_app_token
         self.page_size = self.settings.socrata_page_size
-        self.rate_limiter = RateLimiter(self.settings.socrata_rate_limit)
+        self.concurrency = self.settings.socrata_concurrency
+        self.rate_limiter = get_rate_limiter()
 
         self.headers = {"Accept": "application/json"}
         if self.app_token:
@@ -80,7 +95,9 @@ class SocrataClient:
 
         response = await client.get(url, params=params, headers=self.headers)
         response.raise_for_status()
-        return response.json()
+        # Pages run to tens of MB; orjson parses them several times faster
+        # than the stdlib json behind response.json()
+        return orjson.loads(response.content)
 
     async def fetch_all(
         self,
@@ -93,34 +110,54 @@ class SocrataClient:
         """
         Fetch all records from a dataset with automatic pagination.
 
-        Yields individual records as they are fetched.
+        Yields individual records as they are fetched. Up to ``concurrency``
+        pages are requested ahead (still paced by the rate limiter), so the
+        next pages download while earlier ones are consumed; records are
+        yielded in offset order.
         """
-        offset = start_offset
         total_fetched = 0
+        next_offset = start_offset
+        pages: deque[asyncio.Task] = deque()
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            while True:
+        limits = httpx.Limits(max_connections=self.concurrency)
+        async with httpx.AsyncClient(timeout=120.0, limits=limits) as client:
+
+            def request_page():
+                nonlocal next_offset
                 logger.info(
-                    f"Fetching {dataset_id}: offset={offset}, page_size={self.page_size}"
+                    f"Fetching {dataset_id}: offset={next_offset}, page_size={self.page_size}"
                 )
+                pages.append(asyncio.create_task(
+                    self._fetch_page(client, dataset_id, next_offset, where, select, order)
+                ))
+                next_offset += self.page_size
 
-                records = await self._fetch_page(
-                    client, dataset_id, offset, where, select, order
-                )
+            try:
+                for _ in range(self.concurrency):
+                    request_page()
 
-                if not records:
-                    logger.info(f"Finished fetching {dataset_id}: {total_fetched} total records")
-                    break
+                while pages:
+                    records = await pages.popleft()
 
-                for record in records:
-                    yield record
+                    if not records:
+                        break
 
-                total_fetched += len(records)
-                offset += self.page_size
+                    for record in records:
+                        yield record
 
-                if len(records) < self.page_size:
-                    logger.info(f"Finished fetching {dataset_id}: {total_fetched} total records")
-                    break
+                    total_fetched += len(records)
+
+                    # A short page is the last one; anything requested past
+                    # it is cancelled below
+                    if len(records) < self.page_size:
+                        break
+                    request_page()
+            finally:
+                for page in pages:
+                    page.cancel()
+                await asyncio.gather(*pages, return_exceptions=True)
+
+        logger.info(f"Finished fetching {dataset_id}: {total_fetched} total records")
 
     async def get_record_count(self, dataset_id: str, where: str | None = None) -> int:
         """Get total record count for a dataset."""
@@ -137,6 +174,21 @@ class SocrataClient:
             result = response.json()
             return int(result[0]["count"]) if result else 0
 
+    async def get_rows_updated_at(self, dataset_id: str) -> datetime | None:
+        """When the dataset's rows last changed (naive UTC), from its metadata."""
+        await self.rate_limiter.acquire()
+
+        url = f"{self.base_url}/api/views/{dataset_id}.json"
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.get(url, headers=self.headers)
+            response.raise_for_status()
+            rows_updated_at = orjson.loads(response.content).get("rowsUpdatedAt")
+
+        if not rows_updated_at:
+            return None
+        return datetime.fromtimestamp(rows_updated_at, tz=timezone.utc).replace(tzinfo=None)
+
     async def fetch_batch(
         self,
         dataset_id: str,
@@ -0,0 +1,64 @@
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+from pipeline.jobs.progress import EXITED_STAGE, publish_progress
+
+logger = logging.getLogger(__name__)
+
+# Directory the runner is importable from (backend/)
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Jobs started by this process, keyed by child pid
+_jobs: dict[int, dict] = {}
+_watchers: set[asyncio.Task] = set()
+
+
+async def launch_pipeline_job(*runner_args: str) -> int:
+    """
+    Start `python -m pipeline.runner <runner_args>` in a child process.
+
+    Extraction, entity resolution and scoring are long and CPU-heavy; running
+    them in the API process stalls the event loop and holds pool connections
+    for every other request. Returns the child pid as the job id.
+    """
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "pipeline.runner", *runner_args,
+        cwd=BACKEND_DIR,
+    )
+    _jobs[process.pid] = {"args": list(runner_args), "status": "running", "returncode": None}
+    logger.info(f"Started pipeline job {process.pid}: {' '.join(runner_args)}")
+
+    watcher = asyncio.create_task(_watch(process))
+    _watchers.add(watcher)
+    watcher.add_done_callback(_watchers.discard)
+
+    return process.pid
+
+
+def get_pipeline_job(job_id: int) -> dict | None:
+    """Get the status of a job started by this process."""
+    return _jobs.get(job_id)
+
+
+async def _watch(process: asyncio.subprocess.Process):
+    """Record the job's exit and drop cached API data it may have changed."""
+    from app.services.cached import (
+        invalidate_buildings_cache,
+        invalidate_leaderboard_cache,
+        invalidate_owner_cache,
+    )
+
+    returncode = await process.wait()
+    job = _jobs[process.pid]
+    job["returncode"] = returncode
+    job["status"] = "succeeded" if returncode == 0 else "failed"
+    logger.info(f"Pipeline job {process.pid} exited with code {returncode}")
+    await publish_progress(EXITED_STAGE, job_id=process.pid, **job)
+
+    # The child clears a shared Redis cache itself, but an in-memory cache
+    # lives in this process. Clear it even on failure: batches commit as they go.
+    await invalidate_buildings_cache()
+    await invalidate_leaderboard_cache()
+    await invalidate_owner_cache()
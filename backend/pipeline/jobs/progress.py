@@ -0,0 +1,78 @@
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import orjson
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Stage published by the launcher once the job process has exited
+EXITED_STAGE = "exited"
+
+_redis = None
+
+
+def progress_channel(job_id: int) -> str:
+    """Redis pub/sub channel carrying a pipeline job's progress events."""
+    return f"pipeline:{job_id}"
+
+
+async def _get_redis():
+    """Shared Redis client, or None when REDIS_URL isn't configured."""
+    global _redis
+    if _redis is None:
+        redis_url = get_settings().redis_url
+        if not redis_url:
+            return None
+        import redis.asyncio as redis
+        _redis = redis.from_url(redis_url)
+    return _redis
+
+
+async def publish_progress(stage: str, job_id: Optional[int] = None, **fields: Any) -> None:
+    """
+    Publish a progress event for a pipeline job.
+
+    Jobs are started by the launcher, which uses the child pid as the job id,
+    so by default events go to the current process's channel. Publishing is
+    best effort and a no-op without Redis.
+    """
+    try:
+        r = await _get_redis()
+        if r is None:
+            return
+        event = {"stage": stage, **fields}
+        await r.publish(progress_channel(job_id or os.getpid()), orjson.dumps(event))
+    except Exception as e:
+        logger.warning(f"Could not publish pipeline progress: {e}")
+
+
+@asynccontextmanager
+async def subscribe_progress(job_id: int) -> AsyncIterator[Optional[AsyncIterator[dict]]]:
+    """
+    Subscribe to a job's progress events.
+
+    Yields an async iterator of event dicts, or None without Redis. Subscribe
+    before checking the job's status so no event is missed in between.
+    """
+    r = await _get_redis()
+    if r is None:
+        yield None
+        return
+
+    pubsub = r.pubsub()
+    await pubsub.subscribe(progress_channel(job_id))
+
+    async def events() -> AsyncIterator[dict]:
+        async for message in pubsub.listen():
+            if message["type"] == "message":
+                yield orjson.loads(message["data"])
+
+    try:
+        yield events()
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.close()
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from datetime import datetime
+import time
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -17,7 +17,7 @@ logger = logging.getLogger(__name__)
 async def nightly_refresh():
     """Run nightly data refresh pipeline."""
     logger.info("Starting nightly data refresh")
-    start = datetime.now()
+    start = time.perf_counter()
 
     try:
         # Run all extractors
@@ -29,7 +29,7 @@ async def nightly_refresh():
         # Recompute all scores
         await run_scoring()
 
-        elapsed = (datetime.now() - start).total_seconds()
+        elapsed = time.perf_counter() - start
         logger.info(f"Nightly refresh complete in {elapsed:.1f}s")
 
     except Exception as e:
@@ -38,8 +38,8 @@ async def nightly_refresh():
 
 
 def start_scheduler():
-    """Start the APScheduler for nightly jobs."""
-    scheduler = AsyncIOScheduler()
+    """Start the APScheduler for nightly jobs on the running event loop."""
+    scheduler = AsyncIOScheduler(event_loop=asyncio.get_running_loop())
 
     # Run nightly at 3 AM EST
     scheduler.add_job(
@@ -56,10 +56,22 @@ def start_scheduler():
     return scheduler
 
 
-if __name__ == "__main__":
+async def serve():
+    """Run the scheduler until the process is stopped."""
     scheduler = start_scheduler()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        scheduler.shutdown(wait=False)
 
+
+if __name__ == "__main__":
     try:
-        asyncio.get_event_loop().run_forever()
-    except (KeyboardInterrupt, SystemExit):
+        try:
+            import uvloop
+        except ImportError:  # e.g. Windows, where uvloop isn't available
+            asyncio.run(serve())
+        else:
+            uvloop.run(serve())
+    except KeyboardInterrupt:
         logger.info("Scheduler shutdown")
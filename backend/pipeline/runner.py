@@ -1,6 +1,7 @@
 import asyncio
 import argparse
 import logging
+import time
 from datetime import datetime
 
 from pipeline.extractors import (
@@ -15,6 +16,7 @@ from pipeline.extractors.hpd_registrations import (
     RegistrationContactsExtractor,
     BuildingsFromRegistrationsExtractor,
 )
+from pipeline.jobs.progress import publish_progress
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,54 +35,143 @@ EXTRACTORS = {
     "dob_violations": DOBViolationsExtractor,
     "evictions": EvictionsExtractor,
 }
+EXTRACTOR_NAMES = tuple(EXTRACTORS)
 
-# Recommended order for full data load
-LOAD_ORDER = [
-    "buildings",
-    "pluto",
-    "hpd_registrations",
-    "registration_contacts",
-    "hpd_violations",
-    "complaints_311",
-    "dob_violations",
-    "evictions",
+# Full data load, as lanes that run concurrently; each lane loads its
+# extractors one after another. Every table the scoring queue triggers watch
+# (migration 011) is in the first lane: loads of those tables enqueue
+# overlapping BBLs into scoring_dirty_bbls while their transactions stay open
+# for several batches, so running two at once can deadlock. Its order also
+# covers the dependencies: PLUTO enriches rows the buildings extractor
+# creates, and contacts reference registrations (a full refresh of
+# hpd_registrations truncates them by CASCADE).
+LOAD_LANES = [
+    [
+        "buildings",
+        "pluto",
+        "hpd_registrations",
+        "registration_contacts",
+        "hpd_violations",
+        "complaints_311",
+        "evictions",
+    ],
+    ["dob_violations"],
 ]
 
 
+async def get_loaded_version(name: str) -> datetime | None:
+    """Source version (rowsUpdatedAt) of the extractor's last complete load."""
+    from sqlalchemy import text
+    from app.database import pipeline_engine
+
+    try:
+        async with pipeline_engine.connect() as conn:
+            if not await conn.scalar(text("SELECT to_regclass('extractor_sync_state') IS NOT NULL")):
+                return None
+            return await conn.scalar(
+                text("SELECT source_updated_at FROM extractor_sync_state WHERE extractor = :name"),
+                {"name": name},
+            )
+    except Exception as e:
+        logger.warning(f"Could not read last loaded version of {name}: {e}")
+        return None
+
+
+async def record_loaded_version(name: str, version: datetime):
+    """Remember the source version a complete load of the extractor started from."""
+    from sqlalchemy import text
+    from app.database import pipeline_engine
+
+    try:
+        async with pipeline_engine.begin() as conn:
+            await conn.execute(
+                text("""
+                    INSERT INTO extractor_sync_state (extractor, source_updated_at, loaded_at)
+                    VALUES (:name, :version, NOW())
+                    ON CONFLICT (extractor) DO UPDATE SET
+                        source_updated_at = EXCLUDED.source_updated_at,
+                        loaded_at = EXCLUDED.loaded_at
+                """),
+                {"name": name, "version": version},
+            )
+    except Exception as e:
+        logger.warning(f"Could not record loaded version of {name}: {e}")
+
+
 async def run_extractor(name: str, full_refresh: bool = False, start_offset: int = 0) -> int:
     """Run a single extractor with optional offset for resumption."""
     if name not in EXTRACTORS:
-        raise ValueError(f"Unknown dataset: {name}. Available: {list(EXTRACTORS.keys())}")
+        raise ValueError(f"Unknown dataset: {name}. Available: {list(EXTRACTOR_NAMES)}")
 
     extractor_class = EXTRACTORS[name]
     extractor = extractor_class()
 
+    # Version the source is at before loading; a resumed load doesn't cover
+    # the whole dataset, so it neither skips nor records one
+    source_version = None
+    if not start_offset:
+        try:
+            source_version = await extractor.client.get_rows_updated_at(extractor.dataset_id)
+        except Exception as e:
+            logger.warning(f"Could not check {name} for changes: {e}")
+
+        if (
+            not full_refresh
+            and extractor.skip_unchanged_source
+            and source_version is not None
+            and source_version == await get_loaded_version(name)
+        ):
+            logger.info(f"Skipping {name}: source unchanged since {source_version}")
+            await publish_progress("extractor_skipped", dataset=name)
+            return 0
+
     logger.info(f"Starting extractor: {name}" + (f" from offset {start_offset}" if start_offset else ""))
-    start = datetime.now()
+    start = time.perf_counter()
+    await publish_progress("extractor_started", dataset=name)
 
     count = await extractor.extract_and_load(full_refresh=full_refresh, start_offset=start_offset)
 
-    elapsed = (datetime.now() - start).total_seconds()
+    elapsed = time.perf_counter() - start
     logger.info(f"Completed {name}: {count} records in {elapsed:.1f}s")
+    await publish_progress("extractor_completed", dataset=name, rows=count, seconds=round(elapsed, 1))
+
+    if source_version is not None:
+        await record_loaded_version(name, source_version)
 
     return count
 
 
 async def run_all(full_refresh: bool = False):
-    """Run all extractors in order."""
+    """Run all extractors, lane by lane concurrently, with up to pipeline_concurrency at once."""
+    from app.config import get_settings
+
     logger.info("Starting full data pipeline")
-    start = datetime.now()
-    total = 0
+    start = time.perf_counter()
 
-    for name in LOAD_ORDER:
-        try:
-            count = await run_extractor(name, full_refresh=full_refresh)
-            total += count
-        except Exception as e:
-            logger.error(f"Error in {name}: {e}")
-            raise
+    # Each running extractor holds a pipeline connection for its whole load
+    semaphore = asyncio.Semaphore(get_settings().pipeline_concurrency)
 
-    elapsed = (datetime.now() - start).total_seconds()
+    async def run_lane(lane: list[str]) -> int:
+        count = 0
+        for name in lane:
+            try:
+                async with semaphore:
+                    count += await run_extractor(name, full_refresh=full_refresh)
+            except Exception as e:
+                # Later extractors in the lane may depend on this one
+                logger.error(f"Error in {name}: {e}")
+                raise
+        return count
+
+    # Let the other lanes finish before raising, so one failed dataset
+    # doesn't abandon the others half-loaded
+    results = await asyncio.gather(*map(run_lane, LOAD_LANES), return_exceptions=True)
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+    total = sum(results)
+
+    elapsed = time.perf_counter() - start
     logger.info(f"Pipeline complete: {total} total records in {elapsed:.1f}s")
 
 
@@ -88,16 +179,70 @@ async def run_entity_resolution():
     """Run entity resolution to group owners into portfolios."""
     from app.services.entity_resolution import EntityResolutionService
 
+    from app.services.cached import (
+        invalidate_buildings_cache,
+        invalidate_leaderboard_cache,
+        invalidate_owner_cache,
+    )
+
+    await publish_progress("entity_resolution_started")
     service = EntityResolutionService()
     await service.run_entity_resolution()
+    await refresh_entity_resolution_stats()
+    await publish_progress("entity_resolution_completed")
+
+    # Portfolios feed owner pages, building reports and the landlord leaderboard
+    await invalidate_owner_cache()
+    await invalidate_buildings_cache()
+    await invalidate_leaderboard_cache()
+
+
+async def refresh_entity_resolution_stats():
+    """Refresh the er_stats_mv view behind the admin stats endpoint."""
+    from sqlalchemy import text
+    from app.database import pipeline_engine
 
+    try:
+        async with pipeline_engine.begin() as conn:
+            await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY er_stats_mv"))
+        logger.info("Refreshed entity resolution stats")
+    except Exception as e:
+        logger.warning(f"Could not refresh entity resolution stats: {e}")
 
-async def run_scoring():
-    """Compute scores for all buildings."""
+
+async def refresh_leaderboard_view():
+    """Refresh the worst_buildings_mv view behind the buildings leaderboard."""
+    from sqlalchemy import text
+    from app.database import pipeline_engine
+
+    try:
+        async with pipeline_engine.begin() as conn:
+            await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY worst_buildings_mv"))
+        logger.info("Refreshed worst buildings leaderboard view")
+    except Exception as e:
+        logger.warning(f"Could not refresh worst buildings leaderboard view: {e}")
+
+
+async def run_scoring(full: bool = False):
+    """Compute scores for buildings whose inputs changed, or all of them if full."""
     from app.services.scoring import ScoringService
 
+    from app.services.cached import (
+        invalidate_buildings_cache,
+        invalidate_leaderboard_cache,
+        invalidate_owner_cache,
+    )
+
+    await publish_progress("scoring_started")
     service = ScoringService()
-    await service.compute_all_scores()
+    await service.compute_all_scores(full=full)
+    await refresh_leaderboard_view()
+    await publish_progress("scoring_completed")
+
+    # Building and portfolio scores feed reports, owner pages and both leaderboards
+    await invalidate_owner_cache()
+    await invalidate_buildings_cache()
+    await invalidate_leaderboard_cache()
 
 
 def main():
@@ -105,7 +250,7 @@ def main():
     parser.add_argument(
         "--dataset",
         "-d",
-        choices=list(EXTRACTORS.keys()) + ["all"],
+        choices=EXTRACTOR_NAMES + ("all",),
         default="all",
         help="Dataset to extract (default: all)",
     )
@@ -113,7 +258,7 @@ def main():
         "--full-refresh",
         "-f",
         action="store_true",
-        help="Truncate and reload instead of upsert",
+        help="Truncate and reload instead of upsert (and rescore every building)",
     )
     parser.add_argument(
         "--entity-resolution",
@@ -154,9 +299,14 @@ def main():
             await run_entity_resolution()
 
         if args.scoring:
-            await run_scoring()
+            await run_scoring(full=args.full_refresh)
 
-    asyncio.run(execute())
+    try:
+        import uvloop
+    except ImportError:  # e.g. Windows, where uvloop isn't available
+        asyncio.run(execute())
+    else:
+        uvloop.run(execute())
 
 
 if __name__ == "__main__":
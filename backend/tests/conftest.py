@@ -1,7 +1,8 @@
 """Test fixtures and configuration for IsMyLandlordShady.nyc API tests."""
 
 import asyncio
-from typing import AsyncGenerator, Generator
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Generator, Mapping
 
 import pytest
 import pytest_asyncio
@@ -10,7 +11,7 @@ from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from app.database import Base, get_db
+from app.database import Base, ReadOnlyConnection, get_db, get_readonly_conn
 from app.main import app
 from app.cache import InMemoryCache, get_cache
 
@@ -27,9 +28,9 @@ def event_loop() -> Generator:
     loop.close()
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session")
 async def async_engine():
-    """Create a test database engine."""
+    """Create the test database engine and schema once per session."""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
@@ -41,12 +42,18 @@ async def async_engine():
 
     yield engine
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-
     await engine.dispose()
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def clean_tables(async_engine) -> AsyncGenerator[None, None]:
+    """Empty every table after each test, instead of rebuilding the schema."""
+    yield
+    async with async_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
+
 @pytest_asyncio.fixture(scope="function")
 async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
     """Create a test database session."""
@@ -61,24 +68,45 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def asgi_client() -> AsyncGenerator[AsyncClient, None]:
+    """One HTTP client over the app for the whole session."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+async def client(asgi_client: AsyncClient, db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create a test client with database session override."""
 
     async def override_get_db():
         yield db_session
 
+    async def override_get_readonly_conn():
+        conn = ReadOnlyConnection(db_session.bind)
+        try:
+            yield conn
+        finally:
+            await conn.close()
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_readonly_conn] = override_get_readonly_conn
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+    yield asgi_client
 
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="session")
+def test_client() -> Generator[TestClient, None, None]:
+    """One synchronous client, and app lifespan cycle, for the whole session."""
+    with TestClient(app) as client:
+        yield client
+
+
 @pytest.fixture
-def sync_client(db_session: AsyncSession) -> Generator[TestClient, None, None]:
+def sync_client(test_client: TestClient, db_session: AsyncSession) -> Generator[TestClient, None, None]:
     """Create a synchronous test client for simple tests."""
 
     async def override_get_db():
@@ -86,12 +114,18 @@ def sync_client(db_session: AsyncSession) -> Generator[TestClient, None, None]:
 
     app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as client:
-        yield client
+    yield test_client
 
     app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def clear_cache() -> AsyncGenerator[None, None]:
+    """Start every test with an empty shared cache."""
+    await get_cache().clear_pattern("*")
+    yield
+
+
 @pytest.fixture
 def test_cache() -> InMemoryCache:
     """Create a test cache instance."""
@@ -99,10 +133,10 @@ def test_cache() -> InMemoryCache:
 
 
 # Sample test data fixtures
-@pytest.fixture
-def sample_building_data() -> dict:
-    """Sample building data for tests."""
-    return {
+@pytest.fixture(scope="session")
+def sample_building_data() -> Mapping[str, Any]:
+    """Sample building data for tests (read-only; copy to modify)."""
+    return MappingProxyType({
         "bbl": "1000010001",
         "borough": "Manhattan",
         "block": 1,
@@ -116,13 +150,13 @@ def sample_building_data() -> dict:
         "year_built": 1920,
         "latitude": 40.7128,
         "longitude": -74.0060,
-    }
+    })
 
 
-@pytest.fixture
-def sample_violation_data() -> dict:
-    """Sample violation data for tests."""
-    return {
+@pytest.fixture(scope="session")
+def sample_violation_data() -> Mapping[str, Any]:
+    """Sample violation data for tests (read-only; copy to modify)."""
+    return MappingProxyType({
         "violation_id": 12345,
         "bbl": "1000010001",
         "apartment": "1A",
@@ -131,13 +165,13 @@ def sample_violation_data() -> dict:
         "nov_description": "MICE",
         "current_status": "OPEN",
         "violation_class": "C",
-    }
+    })
 
 
-@pytest.fixture
-def sample_portfolio_data() -> dict:
-    """Sample owner portfolio data for tests."""
-    return {
+@pytest.fixture(scope="session")
+def sample_portfolio_data() -> Mapping[str, Any]:
+    """Sample owner portfolio data for tests (read-only; copy to modify)."""
+    return MappingProxyType({
         "id": 1,
         "primary_name": "TEST LANDLORD LLC",
         "normalized_name": "test landlord llc",
@@ -149,6 +183,5 @@ def sample_portfolio_data() -> dict:
         "class_b_violations": 20,
         "class_a_violations": 20,
         "portfolio_score": 75.5,
-        "portfolio_grade": "D",
         "is_llc": 1,
-    }
+    })
@@ -0,0 +1,68 @@
+"""Tests for the batch API endpoint."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.owner import OwnerPortfolio
+
+
+@pytest.mark.asyncio
+async def test_batch_dispatches_sub_requests(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_portfolio_data: dict,
+):
+    """Test batch returns each sub-response keyed by id, in request order."""
+    portfolio = OwnerPortfolio(**sample_portfolio_data)
+    db_session.add(portfolio)
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/batch",
+        json={"requests": [
+            {"id": "owner", "url": f"/api/v1/owners/{sample_portfolio_data['id']}"},
+            {"id": "missing", "url": "/api/v1/owners/99999"},
+        ]},
+    )
+
+    assert response.status_code == 200
+    data = response.json()["responses"]
+    assert [r["id"] for r in data] == ["owner", "missing"]
+    assert data[0]["status"] == 200
+    assert data[0]["body"]["name"] == sample_portfolio_data["primary_name"]
+    assert data[1]["status"] == 404
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_too_many_requests(client: AsyncClient):
+    """Test batch size is capped."""
+    response = await client.post(
+        "/api/v1/batch",
+        json={"requests": [
+            {"id": str(i), "url": "/api/v1/owners/1"} for i in range(11)
+        ]},
+    )
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_non_api_urls(client: AsyncClient):
+    """Test only /api/v1/ routes can be batched, excluding the batch route."""
+    for url in [
+        "/admin/entity-resolution/stats",
+        "/api/v1/batch",
+        "/api/v1/../../admin/entity-resolution/stats",
+        "/api/v1/%2e%2e/%2E%2E/admin/entity-resolution/stats",
+        "/api/v1/./batch",
+        "/api/v1//owners/1",
+        "/api/v1/search?q=main st",
+        "/api/v1/owners/1#x",
+    ]:
+        response = await client.post(
+            "/api/v1/batch",
+            json={"requests": [{"id": "a", "url": url}]},
+        )
+
+        assert response.status_code == 422
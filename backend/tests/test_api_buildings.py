@@ -1,10 +1,17 @@
 """Tests for building API endpoints."""
 
+import asyncio
+from datetime import date, datetime, timedelta
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.building import Building
+from app.models.hpd import HPDViolation
+from app.models.complaints import Complaint311
+from app.cache import CacheKeys, get_cache, make_cache_key
+from app.services.cached import _prefetch_tasks, invalidate_building_cache
 from app.models.score import BuildingScore
 
 
@@ -59,6 +66,32 @@ async def test_get_building_not_found(client: AsyncClient):
     assert response.json()["detail"] == "Building not found"
 
 
+@pytest.mark.asyncio
+async def test_get_building_not_found_is_negatively_cached(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_building_data: dict,
+):
+    """Test a 404 is remembered until the building's cache is invalidated."""
+    building_data = sample_building_data.copy()
+    building_data["bbl"] = "5000010001"
+
+    response = await client.get(f"/api/v1/buildings/{building_data['bbl']}")
+    assert response.status_code == 404
+
+    db_session.add(Building(**building_data))
+    await db_session.commit()
+
+    # Still served from the negative cache
+    response = await client.get(f"/api/v1/buildings/{building_data['bbl']}")
+    assert response.status_code == 404
+
+    await invalidate_building_cache(building_data["bbl"])
+
+    response = await client.get(f"/api/v1/buildings/{building_data['bbl']}")
+    assert response.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_get_building_success(
     client: AsyncClient,
@@ -95,7 +128,6 @@ async def test_get_building_with_score(
     score = BuildingScore(
         bbl=sample_building_data["bbl"],
         overall_score=45.5,
-        grade="C",
         violation_score=30.0,
         complaints_score=10.0,
         eviction_score=5.0,
@@ -114,6 +146,39 @@ async def test_get_building_with_score(
     assert data["score"]["grade"] == "C"
 
 
+@pytest.mark.asyncio
+async def test_get_building_complaint_summary(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_building_data: dict,
+):
+    """Test report splits complaint totals into all-time and last year."""
+    building_data = sample_building_data.copy()
+    building_data["bbl"] = "3000010001"
+    db_session.add(Building(**building_data))
+    db_session.add(Complaint311(
+        unique_key=1,
+        bbl=building_data["bbl"],
+        created_date=datetime.now() - timedelta(days=30),
+        complaint_type="HEAT/HOT WATER",
+    ))
+    db_session.add(Complaint311(
+        unique_key=2,
+        bbl=building_data["bbl"],
+        created_date=datetime.now() - timedelta(days=800),
+        complaint_type="HEAT/HOT WATER",
+    ))
+    await db_session.commit()
+
+    response = await client.get(f"/api/v1/buildings/{building_data['bbl']}")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["complaints"]["total"] == 2
+    assert data["complaints"]["last_year"] == 1
+    assert data["complaints"]["by_type"] == [{"type": "HEAT/HOT WATER", "count": 2}]
+
+
 @pytest.mark.asyncio
 async def test_get_building_violations_not_found(client: AsyncClient):
     """Test get violations returns 404 for non-existent building."""
@@ -122,6 +187,25 @@ async def test_get_building_violations_not_found(client: AsyncClient):
     assert response.status_code == 404
 
 
+@pytest.mark.asyncio
+async def test_get_building_violations_orphaned_bbl_not_found(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """Test violations for a BBL with no building row still return 404."""
+    db_session.add(HPDViolation(
+        violation_id=200,
+        bbl="4000010001",
+        inspection_date=date(2024, 1, 1),
+        violation_class="B",
+    ))
+    await db_session.commit()
+
+    response = await client.get("/api/v1/buildings/4000010001/violations")
+
+    assert response.status_code == 404
+
+
 @pytest.mark.asyncio
 async def test_get_building_violations_empty(
     client: AsyncClient,
@@ -167,6 +251,101 @@ async def test_get_building_violations_pagination(
     assert data["offset"] == 5
 
 
+@pytest.mark.asyncio
+async def test_get_building_violations_total_with_page(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_building_data: dict,
+):
+    """Test violations total counts all matches, not just the returned page."""
+    building = Building(**sample_building_data)
+    db_session.add(building)
+    for i in range(3):
+        db_session.add(HPDViolation(
+            violation_id=100 + i,
+            bbl=sample_building_data["bbl"],
+            inspection_date=date(2024, 1, 1 + i),
+            current_status="OPEN",
+            violation_class="C",
+        ))
+    await db_session.commit()
+
+    response = await client.get(
+        f"/api/v1/buildings/{sample_building_data['bbl']}/violations",
+        params={"limit": 2, "violation_class": "C"}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert data["total"] == 3
+    assert data["items"][0]["id"] == 102
+
+
+@pytest.mark.asyncio
+async def test_get_building_violations_filters_ignore_case(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_building_data: dict,
+):
+    """Test status and class filters match regardless of case or padding."""
+    db_session.add(Building(**sample_building_data))
+    db_session.add(HPDViolation(
+        violation_id=100,
+        bbl=sample_building_data["bbl"],
+        current_status="OPEN",
+        violation_class="C",
+    ))
+    await db_session.commit()
+
+    url = f"/api/v1/buildings/{sample_building_data['bbl']}/violations"
+    upper = await client.get(url, params={"status": "OPEN", "violation_class": "C"})
+    lower = await client.get(url, params={"status": " open", "violation_class": "c"})
+
+    assert upper.json()["total"] == 1
+    assert lower.json() == upper.json()
+
+
+@pytest.mark.asyncio
+async def test_get_building_violations_prefetches_next_page(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_building_data: dict,
+):
+    """Test serving a violations page warms the cache for the next one."""
+    bbl = sample_building_data["bbl"]
+    db_session.add(Building(**sample_building_data))
+    for i in range(3):
+        db_session.add(HPDViolation(
+            violation_id=100 + i,
+            bbl=bbl,
+            inspection_date=date(2024, 1, 1 + i),
+            current_status="OPEN",
+        ))
+    await db_session.commit()
+
+    response = await client.get(
+        f"/api/v1/buildings/{bbl}/violations", params={"limit": 2}
+    )
+    assert response.status_code == 200
+    await asyncio.gather(*_prefetch_tasks)
+
+    next_key = make_cache_key(
+        CacheKeys.BUILDING_VIOLATIONS, bbl,
+        limit=2, offset=2, status=None, violation_class=None,
+    )
+    next_page = await get_cache().get(next_key)
+    assert next_page is not None
+    assert [item["id"] for item in next_page["items"]] == [100]
+
+    # The last page has nothing after it to prefetch
+    response = await client.get(
+        f"/api/v1/buildings/{bbl}/violations", params={"limit": 2, "offset": 2}
+    )
+    assert response.json()["items"] == next_page["items"]
+    assert not _prefetch_tasks
+
+
 @pytest.mark.asyncio
 async def test_get_building_timeline_not_found(client: AsyncClient):
     """Test get timeline returns 404 for non-existent building."""
@@ -194,3 +373,36 @@ async def test_get_building_timeline_empty(
     data = response.json()
     assert data["events"] == []
     assert data["bbl"] == sample_building_data["bbl"]
+
+
+@pytest.mark.asyncio
+async def test_get_building_overview_not_found(client: AsyncClient):
+    """Test get overview returns 404 for non-existent building."""
+    response = await client.get("/api/v1/buildings/9999999999/overview")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_building_overview_matches_individual_endpoints(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_building_data: dict,
+):
+    """Test the overview combines the report, violations and timeline."""
+    db_session.add(Building(**sample_building_data))
+    await db_session.commit()
+
+    bbl = sample_building_data["bbl"]
+    overview = await client.get(f"/api/v1/buildings/{bbl}/overview")
+    # Served from the entries the overview cached
+    report = await client.get(f"/api/v1/buildings/{bbl}")
+    violations = await client.get(f"/api/v1/buildings/{bbl}/violations")
+    timeline = await client.get(f"/api/v1/buildings/{bbl}/timeline")
+
+    assert overview.status_code == 200
+    data = overview.json()
+    assert data["report"] == report.json()
+    assert data["violations"] == violations.json()
+    assert data["timeline"] == timeline.json()
+    assert data["report"]["bbl"] == bbl
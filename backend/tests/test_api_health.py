@@ -1,7 +1,14 @@
 """Tests for health and root endpoints."""
 
 import pytest
+from fastapi.testclient import TestClient
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.websockets import WebSocketDisconnect
+
+from app.main import app
+from app.models.hpd import RegistrationContact
+from pipeline.jobs import launcher
 
 
 @pytest.mark.asyncio
@@ -25,3 +32,116 @@ async def test_health_endpoint(client: AsyncClient):
     data = response.json()
     assert data["status"] in ["healthy", "degraded"]
     assert "database" in data
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_gzipped(client: AsyncClient):
+    """Test large JSON bodies are compressed and small ones are not."""
+    large = await client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    small = await client.get("/", headers={"Accept-Encoding": "gzip"})
+
+    assert large.headers.get("content-encoding") == "gzip"
+    assert "paths" in large.json()
+    assert "content-encoding" not in small.headers
+
+
+@pytest.mark.asyncio
+async def test_entity_resolution_stats_without_view(client: AsyncClient):
+    """Test stats fall back to a live count when er_stats_mv does not exist."""
+    response = await client.get("/admin/entity-resolution/stats")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_contacts"] == 0
+    assert data["linked_pct"] == 0
+
+
+@pytest.mark.asyncio
+async def test_entity_resolution_stats_counts(
+    client: AsyncClient,
+    db_session: AsyncSession,
+):
+    """Test owner-type contacts are counted and the rest only in the total."""
+    db_session.add_all([
+        RegistrationContact(
+            registration_id=1, contact_type="CorporateOwner",
+            full_name="ACME LLC", business_address="1 MAIN ST", name_hash="h1",
+        ),
+        RegistrationContact(registration_id=1, contact_type="HeadOfficer", full_name=""),
+        RegistrationContact(registration_id=1, contact_type="Agent", full_name="AGENT"),
+    ])
+    await db_session.commit()
+
+    response = await client.get("/admin/entity-resolution/stats")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_contacts"] == 3
+    assert data["owner_type_contacts"] == 2
+    assert data["with_hash"] == 1
+    assert data["empty_name"] == 1
+    assert data["empty_address"] == 1
+    assert data["linked"] == 0
+
+
+@pytest.mark.asyncio
+async def test_api_responses_carry_timing_header(client: AsyncClient):
+    """Test request logging middleware adds X-Response-Time to API responses."""
+    response = await client.get("/api/v1/leaderboards/worst-landlords")
+
+    assert response.status_code == 200
+    assert response.headers["x-response-time"].endswith("ms")
+
+
+@pytest.mark.asyncio
+async def test_request_id_is_echoed_or_generated(client: AsyncClient):
+    """Test X-Request-ID is propagated from the caller or generated."""
+    echoed = await client.get("/health", headers={"X-Request-ID": "abc-123"})
+    generated = await client.get("/health", headers={"X-Request-ID": "bad id\nx"})
+
+    assert echoed.headers["x-request-id"] == "abc-123"
+    assert len(generated.headers["x-request-id"]) == 32
+
+
+def test_pipeline_progress_rejects_unknown_job():
+    """Progress socket refuses jobs this worker didn't start."""
+    # Not entered as a context manager, so the lifespan (and its DB setup) is skipped
+    client = TestClient(app)
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/admin/pipeline/ws/999999"):
+            pass
+
+
+def test_pipeline_progress_reports_finished_job(monkeypatch):
+    """A finished job's final status is sent and the socket closed."""
+    monkeypatch.setitem(
+        launcher._jobs, 4242, {"args": ["--scoring"], "status": "succeeded", "returncode": 0}
+    )
+
+    client = TestClient(app)
+    with client.websocket_connect("/admin/pipeline/ws/4242") as ws:
+        event = ws.receive_json()
+
+    assert event["stage"] == "succeeded"
+    assert event["returncode"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pipeline_actions_share_one_route(client: AsyncClient, monkeypatch):
+    """Each admin pipeline action launches the matching runner arguments."""
+    launched = []
+
+    async def fake_launch(*args):
+        launched.append(args)
+        return 4242
+
+    monkeypatch.setattr("app.main.launch_pipeline_job", fake_launch)
+
+    scoring = await client.post("/admin/pipeline/scoring")
+    trigger = await client.post("/admin/pipeline/trigger", params={"dataset": "pluto"})
+    unknown = await client.post("/admin/pipeline/nope")
+
+    assert scoring.json() == {"message": "Scoring triggered in background", "job_id": 4242}
+    assert trigger.json()["dataset"] == "pluto"
+    assert launched == [("--skip-extraction", "--scoring"), ("--dataset", "pluto")]
+    assert unknown.status_code == 422
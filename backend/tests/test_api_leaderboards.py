@@ -1,12 +1,18 @@
 """Tests for leaderboard API endpoints."""
 
+import asyncio
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import CacheKeys, get_cache, make_cache_key
 from app.models.building import Building
 from app.models.score import BuildingScore
 from app.models.owner import OwnerPortfolio
+from app.services import cached
+from app.services.cached import prewarm_leaderboard_cache
 
 
 @pytest.mark.asyncio
@@ -44,26 +50,25 @@ async def test_get_worst_buildings_with_data(
 ):
     """Test worst buildings returns ranked buildings."""
     # Create buildings with scores
-    for i in range(3):
-        building_data = sample_building_data.copy()
-        building_data["bbl"] = f"100001000{i}"
-        building_data["full_address"] = f"{i} BROADWAY, MANHATTAN"
-
-        building = Building(**building_data)
-        db_session.add(building)
-        await db_session.flush()
-
-        score = BuildingScore(
-            bbl=building_data["bbl"],
-            overall_score=50.0 + i * 10,
-            grade="D" if i == 2 else "C",
-            total_violations=10 + i * 5,
-            class_c_violations=2 + i,
-            total_complaints=5 + i,
-            total_evictions=i,
-        )
-        db_session.add(score)
-
+    await db_session.execute(insert(Building), [
+        {
+            **sample_building_data,
+            "bbl": f"100001000{i}",
+            "full_address": f"{i} BROADWAY, MANHATTAN",
+        }
+        for i in range(3)
+    ])
+    await db_session.execute(insert(BuildingScore), [
+        {
+            "bbl": f"100001000{i}",
+            "overall_score": 50.0 + i * 10,
+            "total_violations": 10 + i * 5,
+            "class_c_violations": 2 + i,
+            "total_complaints": 5 + i,
+            "total_evictions": i,
+        }
+        for i in range(3)
+    ])
     await db_session.commit()
 
     response = await client.get("/api/v1/leaderboards/worst-buildings")
@@ -84,28 +89,27 @@ async def test_get_worst_buildings_borough_filter(
     """Test worst buildings can filter by borough."""
     # Create buildings in different boroughs
     boroughs = ["Manhattan", "Brooklyn", "Queens"]
-    for i, borough in enumerate(boroughs):
-        building = Building(
-            bbl=f"100001000{i}",
-            borough=borough,
-            block=1,
-            lot=i,
-            full_address=f"1 MAIN ST, {borough.upper()}",
-        )
-        db_session.add(building)
-        await db_session.flush()
-
-        score = BuildingScore(
-            bbl=building.bbl,
-            overall_score=50.0,
-            grade="C",
-            total_violations=10,
-            class_c_violations=2,
-            total_complaints=5,
-            total_evictions=1,
-        )
-        db_session.add(score)
-
+    await db_session.execute(insert(Building), [
+        {
+            "bbl": f"100001000{i}",
+            "borough": borough,
+            "block": 1,
+            "lot": i,
+            "full_address": f"1 MAIN ST, {borough.upper()}",
+        }
+        for i, borough in enumerate(boroughs)
+    ])
+    await db_session.execute(insert(BuildingScore), [
+        {
+            "bbl": f"100001000{i}",
+            "overall_score": 50.0,
+            "total_violations": 10,
+            "class_c_violations": 2,
+            "total_complaints": 5,
+            "total_evictions": 1,
+        }
+        for i in range(len(boroughs))
+    ])
     await db_session.commit()
 
     response = await client.get(
@@ -196,3 +200,123 @@ async def test_get_worst_landlords_excludes_single_building(
     data = response.json()
     assert data["total"] == 0
     assert data["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_get_worst_landlords_total_past_last_page(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_portfolio_data: dict,
+):
+    """Test total is still reported when offset is past the last row."""
+    for i in range(3):
+        portfolio_data = sample_portfolio_data.copy()
+        portfolio_data["id"] = i + 1
+        portfolio_data["name_hash"] = f"hash{i}"
+        portfolio_data["primary_name"] = f"LANDLORD {i} LLC"
+        db_session.add(OwnerPortfolio(**portfolio_data))
+
+    await db_session.commit()
+
+    response = await client.get(
+        "/api/v1/leaderboards/worst-landlords",
+        params={"limit": 5, "offset": 10}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["items"] == []
+    assert data["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_worst_landlords_pages_share_cached_list(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_portfolio_data: dict,
+):
+    """Test pages are sliced from one cached ranking and stay consistent."""
+    for i in range(3):
+        portfolio_data = sample_portfolio_data.copy()
+        portfolio_data["id"] = i + 1
+        portfolio_data["name_hash"] = f"hash{i}"
+        portfolio_data["primary_name"] = f"LANDLORD {i} LLC"
+        portfolio_data["portfolio_score"] = 60.0 + i * 10
+        db_session.add(OwnerPortfolio(**portfolio_data))
+
+    await db_session.commit()
+
+    first = await client.get("/api/v1/leaderboards/worst-landlords", params={"limit": 2})
+    second = await client.get(
+        "/api/v1/leaderboards/worst-landlords",
+        params={"limit": 2, "offset": 2}
+    )
+
+    assert [item["name"] for item in first.json()["items"]] == ["LANDLORD 2 LLC", "LANDLORD 1 LLC"]
+    assert [item["name"] for item in second.json()["items"]] == ["LANDLORD 0 LLC"]
+    assert first.json()["total"] == second.json()["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_worst_landlords_conditional_get(client: AsyncClient):
+    """Test a matching If-None-Match gets a bodyless 304."""
+    first = await client.get("/api/v1/leaderboards/worst-landlords")
+    etag = first.headers["etag"]
+
+    second = await client.get(
+        "/api/v1/leaderboards/worst-landlords",
+        headers={"If-None-Match": etag}
+    )
+    stale = await client.get(
+        "/api/v1/leaderboards/worst-landlords",
+        headers={"If-None-Match": '"stale"'}
+    )
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert stale.status_code == 200
+    assert stale.json() == first.json()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_fills_default_leaderboards(
+    db_session: AsyncSession,
+    sample_portfolio_data: dict,
+    monkeypatch,
+):
+    """Test startup warm-up caches both unfiltered leaderboards."""
+    monkeypatch.setattr("app.services.cached.PREWARM_JITTER_SECONDS", 0)
+    db_session.add(OwnerPortfolio(**sample_portfolio_data))
+    await db_session.commit()
+
+    await prewarm_leaderboard_cache(db_session.bind)
+
+    cache = get_cache()
+    buildings = await cache.get(make_cache_key(CacheKeys.LEADERBOARD_BUILDINGS, "top"))
+    landlords = await cache.get(make_cache_key(CacheKeys.LEADERBOARD_LANDLORDS, "top"))
+    assert buildings["value"] == {"items": [], "total": 0}
+    assert landlords["value"]["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_leaderboard_served_while_refreshing(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_portfolio_data: dict,
+):
+    """Test a stale entry is returned at once and refreshed in the background."""
+    key = make_cache_key(CacheKeys.LEADERBOARD_LANDLORDS, "top")
+    stale = {"items": [], "total": 0}
+    await get_cache().set(key, {"value": stale, "fresh_until": 0}, ttl=60)
+
+    db_session.add(OwnerPortfolio(**sample_portfolio_data))
+    await db_session.commit()
+
+    response = await client.get("/api/v1/leaderboards/worst-landlords")
+    assert response.json()["total"] == 0
+
+    await asyncio.gather(*cached._refresh_tasks)
+
+    refreshed = await client.get("/api/v1/leaderboards/worst-landlords")
+    assert refreshed.json()["total"] == 1
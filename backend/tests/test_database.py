@@ -0,0 +1,22 @@
+"""Tests for database startup helpers."""
+
+import pytest
+from sqlalchemy import text
+
+from app.database import create_tables_if_changed, schema_fingerprint
+
+
+@pytest.mark.asyncio
+async def test_create_tables_skipped_when_schema_unchanged(async_engine):
+    """Test create_all only runs when the model fingerprint changes."""
+    assert await create_tables_if_changed(async_engine) is True
+    assert await create_tables_if_changed(async_engine) is False
+
+    async with async_engine.begin() as conn:
+        await conn.execute(text("UPDATE schema_version SET hash = 'stale'"))
+
+    assert await create_tables_if_changed(async_engine) is True
+
+    async with async_engine.connect() as conn:
+        stored = await conn.scalar(text("SELECT hash FROM schema_version"))
+    assert stored == schema_fingerprint()